@@ -4,28 +4,109 @@ Strawberry is a Python library for GraphQL that aims to stay close to the GraphQ
 specification and allow for a more natural way of defining GraphQL schemas.
 """
 
-from . import experimental, federation, relay
-from .directive import directive, directive_field
-from .parent import Parent
-from .permission import BasePermission
-from .scalars import ID
-from .schema import Schema
-from .schema_directive import schema_directive
-from .streamable import Streamable
-from .types.arguments import argument
-from .types.auto import auto
-from .types.cast import cast
-from .types.enum import enum, enum_value
-from .types.field import field
-from .types.info import Info
-from .types.lazy_type import LazyType, lazy
-from .types.maybe import Maybe, Some
-from .types.mutation import mutation, subscription
-from .types.object_type import asdict, input, interface, type  # noqa: A004
-from .types.private import Private
-from .types.scalar import scalar
-from .types.union import union
-from .types.unset import UNSET
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Subpackages that can be accessed as attributes of strawberry
+    from . import (  # noqa: F401
+        annotation,
+        exceptions,
+        execution,
+        experimental,
+        extensions,
+        federation,
+        file_uploads,
+        parent,
+        permission,
+        printer,
+        relay,
+        scalars,
+        schema,
+        streamable,
+        types,
+        utils,
+    )
+    from .directive import directive, directive_field
+    from .parent import Parent
+    from .permission import BasePermission
+    from .scalars import ID
+    from .schema import Schema
+    from .schema_directive import schema_directive
+    from .streamable import Streamable
+    from .types.arguments import argument
+    from .types.auto import auto
+    from .types.cast import cast
+    from .types.enum import enum, enum_value
+    from .types.field import field
+    from .types.info import Info
+    from .types.lazy_type import LazyType, lazy
+    from .types.maybe import Maybe, Some
+    from .types.mutation import mutation, subscription
+    from .types.object_type import asdict, input, interface, type  # noqa: A004
+    from .types.private import Private
+    from .types.scalar import scalar
+    from .types.union import union
+    from .types.unset import UNSET
+else:
+    from ._lazy_import import lazy_import
+
+    # Import the public names when they are first accessed, so that importing
+    # strawberry doesn't import graphql-core and all the types machinery
+    __getattr__, __dir__ = lazy_import(
+        __name__,
+        {
+            "ID": ".scalars",
+            "UNSET": ".types.unset",
+            "BasePermission": ".permission",
+            "Info": ".types.info",
+            "LazyType": ".types.lazy_type",
+            "Maybe": ".types.maybe",
+            "Parent": ".parent",
+            "Private": ".types.private",
+            "Schema": ".schema",
+            "Some": ".types.maybe",
+            "Streamable": ".streamable",
+            "argument": ".types.arguments",
+            "asdict": ".types.object_type",
+            "auto": ".types.auto",
+            "cast": ".types.cast",
+            "directive": ".directive",
+            "directive_field": ".directive",
+            "enum": ".types.enum",
+            "enum_value": ".types.enum",
+            "field": ".types.field",
+            "input": ".types.object_type",
+            "interface": ".types.object_type",
+            "lazy": ".types.lazy_type",
+            "mutation": ".types.mutation",
+            "scalar": ".types.scalar",
+            "schema_directive": ".schema_directive",
+            "subscription": ".types.mutation",
+            "type": ".types.object_type",
+            "union": ".types.union",
+        },
+        # The subpackages that used to be imported with strawberry, so that
+        # they can still be accessed as attributes after `import strawberry`
+        submodules=(
+            "annotation",
+            "exceptions",
+            "execution",
+            "experimental",
+            "extensions",
+            "federation",
+            "file_uploads",
+            "parent",
+            "permission",
+            "printer",
+            "relay",
+            "scalars",
+            "schema",
+            "streamable",
+            "types",
+            "utils",
+        ),
+    )
+
 
 __all__ = [
     "ID",
@@ -0,0 +1,101 @@
+"""Import the public names of a package when they are first accessed.
+
+Packages like `strawberry` re-export names from many modules, which pulls in
+graphql-core and every type as soon as the package is imported. They use
+`lazy_import` to build a PEP 562 module `__getattr__` instead, which imports
+each name from its module the first time it's accessed.
+
+This module is imported by the top level package, so it must not import any
+other part of strawberry.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+
+def lazy_import(
+    package: str,
+    imports: Mapping[str, str],
+    submodules: Iterable[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the `__getattr__` and `__dir__` of a package importing its names lazily.
+
+    Args:
+        package: The name of the package, its `__name__`.
+        imports: The module of each public name, relative to the package.
+        submodules: The submodules to import when accessed as attributes.
+
+    Returns:
+        The `__getattr__` and `__dir__` functions of the package.
+
+    Example:
+
+    ```python
+    from typing import TYPE_CHECKING
+
+    if TYPE_CHECKING:
+        from .schema import Schema
+    else:
+        from strawberry._lazy_import import lazy_import
+
+        __getattr__, __dir__ = lazy_import(__name__, {"Schema": ".schema"})
+    ```
+    """
+    module = sys.modules[package]
+    submodules = frozenset(submodules)
+
+    # Importing a submodule sets it as an attribute of its package, which
+    # would hide the names defined in a module of the same name, like
+    # `strawberry.directive`. Those attributes are ignored instead.
+    shadowed = frozenset(
+        name
+        for name, module_name in imports.items()
+        if module_name.rpartition(".")[2] == name
+    )
+
+    if shadowed:
+
+        class LazyModule(ModuleType):
+            def __setattr__(self, name: str, value: Any) -> None:
+                if name in shadowed and isinstance(value, ModuleType):
+                    return
+
+                super().__setattr__(name, value)
+
+        module.__class__ = LazyModule
+
+    def module_getattr(name: str) -> Any:
+        if name in submodules:
+            # The package used to import its names eagerly, which made the
+            # modules they import reachable as attributes of their packages
+            # too, like `strawberry.utils.str_converters`
+            for name_module in imports.values():
+                importlib.import_module(name_module, package)
+
+            return importlib.import_module(f".{name}", package)
+
+        module_name = imports.get(name)
+
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache the name, so that `__getattr__` isn't called for it again
+        module.__dict__[name] = value
+
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted({*module.__dict__, *imports, *submodules})
+
+    return module_getattr, module_dir
+
+
+__all__ = ["lazy_import"]
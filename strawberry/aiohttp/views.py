@@ -57,12 +57,11 @@ class AiohttpWebSocketAdapter(AsyncWebSocketAdapter):
                 raise NonTextMessageReceived
 
     async def send_json(self, message: Mapping[str, object]) -> None:
+        await self.send_text(self.encode_json_text(message))
+
+    async def send_text(self, data: str) -> None:
         try:
-            encoded_data = self.view.encode_json(message)
-            if isinstance(encoded_data, bytes):
-                await self.ws.send_bytes(encoded_data)
-            else:
-                await self.ws.send_str(encoded_data)
+            await self.ws.send_str(data)
         except (RuntimeError, ClientConnectionResetError) as exc:
             raise WebSocketDisconnected from exc
 
@@ -160,8 +159,9 @@ class GraphQLView(
     ) -> web.Response:
         encoded_data = self.encode_json(response_data)
         if isinstance(encoded_data, bytes):
-            encoded_data = encoded_data.decode()
-        sub_response.text = encoded_data
+            sub_response.body = encoded_data
+        else:
+            sub_response.text = encoded_data
         sub_response.content_type = "application/json"
 
         return sub_response
@@ -169,7 +169,7 @@ class GraphQLView(
     async def create_streaming_response(
         self,
         request: web.Request,
-        stream: Callable[[], AsyncGenerator[str, None]],
+        stream: Callable[[], AsyncGenerator[bytes, None]],
         sub_response: web.Response,
         headers: Mapping[str, str],
     ) -> web.StreamResponse:
@@ -184,7 +184,7 @@ class GraphQLView(
         await response.prepare(request)
 
         async for data in stream():
-            await response.write(data.encode())
+            await response.write(data)
 
         await response.write_eof()
 
@@ -36,6 +36,7 @@ from strawberry.types.maybe import _annotation_is_maybe
 from strawberry.types.private import is_private
 from strawberry.types.scalar import ScalarDefinition
 from strawberry.types.unset import UNSET
+from strawberry.utils.build_cache import is_build_cache_enabled
 from strawberry.utils.typing import eval_type, is_generic, is_type_var
 
 if TYPE_CHECKING:
@@ -56,7 +57,12 @@ ASYNC_TYPES = (
 
 
 class StrawberryAnnotation:
-    __slots__ = "__resolve_cache__", "namespace", "raw_annotation"
+    __slots__ = (
+        "__generic_cache__",
+        "__resolve_cache__",
+        "namespace",
+        "raw_annotation",
+    )
 
     def __init__(
         self,
@@ -68,6 +74,9 @@ class StrawberryAnnotation:
         self.namespace = namespace
 
         self.__resolve_cache__: StrawberryType | type | None = None
+        # Whether the cached resolved type is generic, kept between schema
+        # builds when the build cache is enabled
+        self.__generic_cache__: bool | None = None
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, StrawberryAnnotation):
@@ -136,10 +145,18 @@ class StrawberryAnnotation:
         if (resolved := self.__resolve_cache__) is None:
             resolved = self._resolve()
             self.__resolve_cache__ = resolved
+            self.__generic_cache__ = None
+
+        if is_build_cache_enabled():
+            if (is_type_generic := self.__generic_cache__) is None:
+                is_type_generic = self._is_type_generic(resolved)
+                self.__generic_cache__ = is_type_generic
+        else:
+            is_type_generic = self._is_type_generic(resolved)
 
         # If this is a generic field, try to resolve it using its origin's
         # specialized type_var_map
-        if self._is_type_generic(resolved) and type_definition is not None:
+        if is_type_generic and type_definition is not None:
             from strawberry.types.base import StrawberryType
 
             specialized_type_var_map = type_definition.specialized_type_var_map
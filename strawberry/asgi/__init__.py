@@ -73,12 +73,11 @@ class ASGIWebSocketAdapter(AsyncWebSocketAdapter):
             pass
 
     async def send_json(self, message: Mapping[str, object]) -> None:
+        await self.send_text(self.encode_json_text(message))
+
+    async def send_text(self, data: str) -> None:
         try:
-            encoded_data = self.view.encode_json(message)
-            if isinstance(encoded_data, bytes):
-                await self.ws.send_bytes(encoded_data)
-            else:
-                await self.ws.send_text(encoded_data)
+            await self.ws.send_text(data)
         except WebSocketDisconnect as exc:
             raise WebSocketDisconnected from exc
 
@@ -187,7 +186,7 @@ class GraphQL(
     async def create_streaming_response(
         self,
         request: Request | WebSocket,
-        stream: Callable[[], AsyncIterator[str]],
+        stream: Callable[[], AsyncIterator[bytes]],
         sub_response: Response,
         headers: Mapping[str, str],
     ) -> Response:
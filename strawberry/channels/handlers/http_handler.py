@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import dataclasses
-import json
 from functools import cached_property
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, TypeGuard
@@ -48,7 +47,7 @@ class ChannelsResponse:
 
 @dataclasses.dataclass
 class MultipartChannelsResponse:
-    stream: Callable[[], AsyncGenerator[str, None]]
+    stream: Callable[[], AsyncGenerator[bytes, None]]
     status: int = 200
     content_type: str = "multipart/mixed;boundary=graphql;subscriptionSpec=1.0"
     headers: dict[bytes, bytes] = dataclasses.field(default_factory=dict)
@@ -227,8 +226,13 @@ class BaseGraphQLHTTPConsumer(ChannelsConsumer, AsyncHttpConsumer):
         response_data: GraphQLHTTPResponse | list[GraphQLHTTPResponse],
         sub_response: TemporalResponse,
     ) -> ChannelsResponse:
+        encoded_data = self.encode_json(response_data)
+
+        if isinstance(encoded_data, str):
+            encoded_data = encoded_data.encode()
+
         return ChannelsResponse(
-            content=json.dumps(response_data).encode(),
+            content=encoded_data,
             status=sub_response.status_code,
             headers={k.encode(): v.encode() for k, v in sub_response.headers.items()},
         )
@@ -243,10 +247,12 @@ class BaseGraphQLHTTPConsumer(ChannelsConsumer, AsyncHttpConsumer):
 
             if isinstance(response, MultipartChannelsResponse):
                 response.headers[b"Transfer-Encoding"] = b"chunked"
-                await self.send_headers(headers=response.headers)
+                await self.send_headers(
+                    status=response.status, headers=response.headers
+                )
 
                 async for chunk in response.stream():
-                    await self.send_body(chunk.encode("utf-8"), more_body=True)
+                    await self.send_body(chunk, more_body=True)
 
                 await self.send_body(b"", more_body=False)
 
@@ -319,7 +325,7 @@ class GraphQLHTTPConsumer(
     async def create_streaming_response(
         self,
         request: ChannelsRequest,
-        stream: Callable[[], AsyncGenerator[str, None]],
+        stream: Callable[[], AsyncGenerator[bytes, None]],
         sub_response: TemporalResponse,
         headers: Mapping[str, str],
     ) -> MultipartChannelsResponse:
@@ -52,8 +52,10 @@ class ChannelsWebSocketAdapter(AsyncWebSocketAdapter):
                     raise NonJsonMessageReceived from e
 
     async def send_json(self, message: Mapping[str, object]) -> None:
-        serialized_message = self.view.encode_json(message)
-        await self.ws_consumer.send(serialized_message)
+        await self.send_text(self.encode_json_text(message))
+
+    async def send_text(self, data: str) -> None:
+        await self.ws_consumer.send(data)
 
     async def close(self, code: int, reason: str) -> None:
         await self.ws_consumer.close(code=code, reason=reason)
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+import math
+import threading
+import time
 from abc import ABC, abstractmethod
 from asyncio import create_task, gather, get_event_loop
 from asyncio.futures import Future
+from collections import Counter, OrderedDict
+from contextlib import suppress
 from dataclasses import dataclass
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -103,10 +109,398 @@ class DefaultCache(AbstractCache[K, T]):
         self.cache_map.clear()
 
 
+@dataclass
+class CacheStats:
+    """Counters of a DataLoader cache.
+
+    Attributes:
+        hits: Number of lookups that found a value in the cache.
+        misses: Number of lookups that didn't find a value in the cache.
+        evictions: Number of values dropped because the cache was full or
+            because they expired.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class LRUCache(AbstractCache[K, T]):
+    """Cache keeping at most `maxsize` values, evicting the least recently used.
+
+    Like `DefaultCache` it stores the futures returned by `DataLoader.load`,
+    so it must not outlive the event loop the loader runs on.
+
+    ```python
+    from strawberry.dataloader import DataLoader, LRUCache
+
+    loader = DataLoader(load_fn=load_users, cache_map=LRUCache(maxsize=1000))
+    ```
+    """
+
+    def __init__(
+        self, maxsize: int, cache_key_fn: Callable[[K], Hashable] | None = None
+    ) -> None:
+        self.maxsize = maxsize
+        self.cache_key_fn: Callable[[K], Hashable] = (
+            cache_key_fn if cache_key_fn is not None else lambda x: x
+        )
+        self.cache_map: OrderedDict[Hashable, Future[T]] = OrderedDict()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self.cache_map)
+
+    def get(self, key: K) -> Future[T] | None:
+        cache_key = self.cache_key_fn(key)
+        future = self.cache_map.get(cache_key)
+
+        if future is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        self.cache_map.move_to_end(cache_key)
+
+        return future
+
+    def set(self, key: K, value: Future[T]) -> None:
+        cache_key = self.cache_key_fn(key)
+        self.cache_map[cache_key] = value
+        self.cache_map.move_to_end(cache_key)
+
+        while len(self.cache_map) > self.maxsize:
+            self.cache_map.popitem(last=False)
+            self.stats.evictions += 1
+
+    def delete(self, key: K) -> None:
+        self.cache_map.pop(self.cache_key_fn(key), None)
+
+    def clear(self) -> None:
+        self.cache_map.clear()
+
+
+def _get_loop() -> AbstractEventLoop:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return get_event_loop()
+
+
+class TTLCache(AbstractCache[K, T]):
+    """Cache keeping the values loaded in the last `ttl` seconds.
+
+    Unlike `DefaultCache` and `LRUCache`, it stores the resolved values
+    instead of futures, so a single instance can be shared by the loaders of
+    every request, even when they run on different event loops or threads.
+    Failed loads are never cached.
+
+    ```python
+    from strawberry.dataloader import DataLoader, TTLCache
+
+    users_cache = TTLCache(ttl=60, maxsize=10_000)
+
+
+    async def get_context():
+        return {"user_loader": DataLoader(load_fn=load_users, cache_map=users_cache)}
+    ```
+    """
+
+    def __init__(
+        self,
+        ttl: float | None,
+        maxsize: int | None = None,
+        cache_key_fn: Callable[[K], Hashable] | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the TTLCache.
+
+        Args:
+            ttl: How many seconds values are kept. If `ttl` is `None` values
+                only leave the cache when it is full.
+            maxsize: The maximum number of values to keep, evicting the least
+                recently used ones. If `maxsize` is `None` the cache will grow
+                without bound.
+            cache_key_fn: Function returning the cache key of a key.
+            timer: Function returning the current time in seconds.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.cache_key_fn: Callable[[K], Hashable] = (
+            cache_key_fn if cache_key_fn is not None else lambda x: x
+        )
+        self.timer = timer
+        self.stats = CacheStats()
+        # Values are stored with the time at which they expire
+        self._values: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        # Loads in progress, so that concurrent loads of the same key on the
+        # same event loop are still deduplicated
+        self._pending: dict[Hashable, Future[T]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: K) -> Future[T] | None:
+        cache_key = self.cache_key_fn(key)
+        loop = _get_loop()
+
+        with self._lock:
+            entry = self._values.get(cache_key)
+
+            if entry is not None:
+                expires_at, value = entry
+
+                if expires_at > self.timer():
+                    self._values.move_to_end(cache_key)
+                    self.stats.hits += 1
+
+                    future = loop.create_future()
+                    future.set_result(value)
+
+                    return future
+
+                del self._values[cache_key]
+                self.stats.evictions += 1
+
+            pending = self._pending.get(cache_key)
+
+            if pending is not None and pending.get_loop() is loop:
+                self.stats.hits += 1
+                return pending
+
+            self.stats.misses += 1
+
+        return None
+
+    def set(self, key: K, value: Future[T]) -> None:
+        cache_key = self.cache_key_fn(key)
+
+        if value.done():
+            self._store(cache_key, value)
+            return
+
+        with self._lock:
+            self._pending[cache_key] = value
+
+        value.add_done_callback(partial(self._store, cache_key))
+
+    def _store(self, cache_key: Hashable, future: Future[T]) -> None:
+        with self._lock:
+            if self._pending.get(cache_key) is future:
+                del self._pending[cache_key]
+
+            if future.cancelled() or future.exception() is not None:
+                return
+
+            expires_at = math.inf if self.ttl is None else self.timer() + self.ttl
+            self._values[cache_key] = (expires_at, future.result())
+            self._values.move_to_end(cache_key)
+
+            if self.maxsize is not None:
+                while len(self._values) > self.maxsize:
+                    self._values.popitem(last=False)
+                    self.stats.evictions += 1
+
+    def delete(self, key: K) -> None:
+        cache_key = self.cache_key_fn(key)
+
+        with self._lock:
+            self._values.pop(cache_key, None)
+            self._pending.pop(cache_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._pending.clear()
+
+
+class TieredCache(AbstractCache[K, T]):
+    """Cache checking a local cache first and then a shared one.
+
+    The local cache is usually created per request, while the shared cache is
+    usually a process-wide `TTLCache`. Values found in the shared cache are
+    copied to the local one, and values loaded by `load_fn` are stored in
+    both, so `load_fn` is only called for keys missing from both tiers.
+
+    ```python
+    from strawberry.dataloader import DataLoader, DefaultCache, TieredCache, TTLCache
+
+    users_cache = TTLCache(ttl=60, maxsize=10_000)
+
+
+    async def get_context():
+        return {
+            "user_loader": DataLoader(
+                load_fn=load_users,
+                cache_map=TieredCache(DefaultCache(), users_cache),
+            )
+        }
+    ```
+    """
+
+    def __init__(self, local: AbstractCache[K, T], shared: AbstractCache[K, T]) -> None:
+        self.local = local
+        self.shared = shared
+        self.stats = CacheStats()
+
+    def get(self, key: K) -> Future[T] | None:
+        future = self.local.get(key)
+
+        if future is None:
+            future = self.shared.get(key)
+
+            if future is None:
+                self.stats.misses += 1
+                return None
+
+            self.local.set(key, future)
+
+        self.stats.hits += 1
+
+        return future
+
+    def set(self, key: K, value: Future[T]) -> None:
+        self.local.set(key, value)
+        self.shared.set(key, value)
+
+    def delete(self, key: K) -> None:
+        # A tier may not hold the key, like the local cache of a request that
+        # didn't load it, and `DefaultCache` raises a KeyError for those
+        with suppress(KeyError):
+            self.local.delete(key)
+
+        with suppress(KeyError):
+            self.shared.delete(key)
+
+    def clear(self) -> None:
+        self.local.clear()
+        self.shared.clear()
+
+
+class DispatchPolicy(ABC):
+    """Decides when a batch of a DataLoader is dispatched to `load_fn`.
+
+    Keys loaded before the batch is dispatched are added to it, so waiting
+    longer trades latency for fewer and larger batches.
+    """
+
+    @abstractmethod
+    def schedule(
+        self, loop: AbstractEventLoop, batch: Batch, dispatch: Callable[[], None]
+    ) -> None:
+        """Arrange for `dispatch` to be called once the batch is ready."""
+
+
+class DispatchOnNextTick(DispatchPolicy):
+    """Dispatch batches on the next iteration of the event loop.
+
+    This is the default policy.
+    """
+
+    def schedule(
+        self, loop: AbstractEventLoop, batch: Batch, dispatch: Callable[[], None]
+    ) -> None:
+        loop.call_soon(dispatch)
+
+
+class DispatchAfterTicks(DispatchPolicy):
+    """Dispatch batches after `ticks` iterations of the event loop.
+
+    Useful when nested async resolvers load keys of the same type a few
+    iterations apart.
+    """
+
+    def __init__(self, ticks: int) -> None:
+        if ticks < 1:
+            raise ValueError("ticks must be at least 1")
+
+        self.ticks = ticks
+
+    def schedule(
+        self, loop: AbstractEventLoop, batch: Batch, dispatch: Callable[[], None]
+    ) -> None:
+        remaining = self.ticks
+
+        def tick() -> None:
+            nonlocal remaining
+            remaining -= 1
+
+            if remaining:
+                loop.call_soon(tick)
+            else:
+                dispatch()
+
+        loop.call_soon(tick)
+
+
+class DispatchAfterDelay(DispatchPolicy):
+    """Dispatch batches `delay` seconds after their first key was loaded."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    def schedule(
+        self, loop: AbstractEventLoop, batch: Batch, dispatch: Callable[[], None]
+    ) -> None:
+        loop.call_later(self.delay, dispatch)
+
+
+class DispatchWhenIdle(DispatchPolicy):
+    """Dispatch batches once an iteration of the event loop adds no keys.
+
+    As long as pending resolvers keep loading keys the batch keeps growing,
+    up to `max_ticks` iterations of the event loop.
+    """
+
+    def __init__(self, max_ticks: int = 10) -> None:
+        self.max_ticks = max_ticks
+
+    def schedule(
+        self, loop: AbstractEventLoop, batch: Batch, dispatch: Callable[[], None]
+    ) -> None:
+        ticks = 0
+        size = -1
+
+        def tick() -> None:
+            nonlocal ticks, size
+            ticks += 1
+
+            if len(batch) == size or ticks >= self.max_ticks:
+                dispatch()
+            else:
+                size = len(batch)
+                loop.call_soon(tick)
+
+        loop.call_soon(tick)
+
+
+@dataclass
+class BatchStats:
+    """Counters of the batches dispatched by a DataLoader.
+
+    Attributes:
+        batches: Number of calls to `load_fn`.
+        keys: Number of keys passed to `load_fn`.
+        batch_sizes: Histogram of the batch sizes, mapping each size to the
+            number of batches of that size.
+    """
+
+    batches: int = 0
+    keys: int = 0
+    batch_sizes: Counter[int] = dataclasses.field(default_factory=Counter)
+
+    def record(self, size: int) -> None:
+        self.batches += 1
+        self.keys += size
+        self.batch_sizes[size] += 1
+
+
 class DataLoader(Generic[K, T]):
     batch: Batch[K, T] | None = None
     cache: bool = False
     cache_map: AbstractCache[K, T]
+    dispatch_policy: DispatchPolicy = DispatchOnNextTick()
 
     @overload
     def __init__(
@@ -118,6 +512,8 @@ class DataLoader(Generic[K, T]):
         loop: AbstractEventLoop | None = None,
         cache_map: AbstractCache[K, T] | None = None,
         cache_key_fn: Callable[[K], Hashable] | None = None,
+        dispatch_policy: DispatchPolicy | None = None,
+        coalesce: bool = False,
     ) -> None: ...
 
     # fallback if load_fn is untyped and there's no other info for inference
@@ -130,6 +526,8 @@ class DataLoader(Generic[K, T]):
         loop: AbstractEventLoop | None = None,
         cache_map: AbstractCache[K, T] | None = None,
         cache_key_fn: Callable[[K], Hashable] | None = None,
+        dispatch_policy: DispatchPolicy | None = None,
+        coalesce: bool = False,
     ) -> None: ...
 
     def __init__(
@@ -140,6 +538,8 @@ class DataLoader(Generic[K, T]):
         loop: AbstractEventLoop | None = None,
         cache_map: AbstractCache[K, T] | None = None,
         cache_key_fn: Callable[[K], Hashable] | None = None,
+        dispatch_policy: DispatchPolicy | None = None,
+        coalesce: bool = False,
     ):
         self.load_fn = load_fn
         self.max_batch_size = max_batch_size
@@ -153,6 +553,19 @@ class DataLoader(Generic[K, T]):
                 DefaultCache(cache_key_fn) if cache_map is None else cache_map
             )
 
+        if dispatch_policy is not None:
+            self.dispatch_policy = dispatch_policy
+
+        # Futures of the keys that are loading, keyed by cache key, so that
+        # loads of a key that is already in a batch share its result
+        self.coalesce = coalesce
+        self.cache_key_fn: Callable[[K], Hashable] = (
+            cache_key_fn if cache_key_fn is not None else lambda x: x
+        )
+        self._pending: dict[Hashable, Future] = {}
+
+        self.stats = BatchStats()
+
     @property
     def loop(self) -> AbstractEventLoop:
         if self._loop is None:
@@ -167,16 +580,34 @@ class DataLoader(Generic[K, T]):
             if future and not future.cancelled():
                 return future
 
+        if self.coalesce:
+            cache_key = self.cache_key_fn(key)
+            future = self._pending.get(cache_key)
+
+            if future is not None and not future.cancelled():
+                if self.cache:
+                    self.cache_map.set(key, future)
+
+                return future
+
         future = self.loop.create_future()
 
         if self.cache:
             self.cache_map.set(key, future)
 
+        if self.coalesce:
+            self._pending[cache_key] = future
+            future.add_done_callback(partial(self._on_pending_done, cache_key))
+
         batch = get_current_batch(self)
         batch.add_task(key, future)
 
         return future
 
+    def _on_pending_done(self, cache_key: Hashable, future: Future) -> None:
+        if self._pending.get(cache_key) is future:
+            del self._pending[cache_key]
+
     def load_many(self, keys: Iterable[K]) -> Awaitable[list[T]]:
         return gather(*map(self.load, keys))
 
@@ -184,15 +615,19 @@ class DataLoader(Generic[K, T]):
         if self.cache:
             self.cache_map.delete(key)
 
+        if self.coalesce:
+            self._pending.pop(self.cache_key_fn(key), None)
+
     def clear_many(self, keys: Iterable[K]) -> None:
-        if self.cache:
-            for key in keys:
-                self.cache_map.delete(key)
+        for key in keys:
+            self.clear(key)
 
     def clear_all(self) -> None:
         if self.cache:
             self.cache_map.clear()
 
+        self._pending.clear()
+
     def prime(self, key: K, value: T, force: bool = False) -> None:
         self.prime_many({key: value}, force)
 
@@ -245,7 +680,7 @@ def dispatch(loader: DataLoader, batch: Batch) -> None:
             lambda _: setattr(batch, "_dispatch_task", None)
         )
 
-    loader.loop.call_soon(_schedule)
+    loader.dispatch_policy.schedule(loader.loop, batch, _schedule)
 
 
 async def dispatch_batch(loader: DataLoader, batch: Batch) -> None:
@@ -264,6 +699,8 @@ async def dispatch_batch(loader: DataLoader, batch: Batch) -> None:
     if all(task.future.cancelled() for task in batch.tasks):
         return
 
+    loader.stats.record(len(keys))
+
     # TODO: check if load_fn return an awaitable and it is a list
 
     try:
@@ -295,9 +732,19 @@ async def dispatch_batch(loader: DataLoader, batch: Batch) -> None:
 __all__ = [
     "AbstractCache",
     "Batch",
+    "BatchStats",
+    "CacheStats",
     "DataLoader",
     "DefaultCache",
+    "DispatchAfterDelay",
+    "DispatchAfterTicks",
+    "DispatchOnNextTick",
+    "DispatchPolicy",
+    "DispatchWhenIdle",
+    "LRUCache",
     "LoaderTask",
+    "TTLCache",
+    "TieredCache",
     "dispatch",
     "dispatch_batch",
     "get_current_batch",
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -28,6 +27,7 @@ from django.utils.decorators import classonlymethod
 from django.views.generic import View
 
 from strawberry.http.async_base_view import AsyncBaseHTTPView
+from strawberry.http.codecs import JSONCodec
 from strawberry.http.sync_base_view import SyncBaseHTTPView
 from strawberry.http.typevars import (
     Context,
@@ -68,6 +68,9 @@ class TemporalHttpResponse(JsonResponse):
 
 class BaseView:
     graphql_ide_html: str
+    # Provided by the HTTP view this mixin is combined with
+    encode_json: Callable[[object], str | bytes]
+    json_codec: JSONCodec = JSONCodec(encoder=DjangoJSONEncoder)
     subscription_protocols: Sequence[str] = (
         GRAPHQL_TRANSPORT_WS_PROTOCOL,
         GRAPHQL_WS_PROTOCOL,
@@ -132,9 +135,6 @@ class BaseView:
             },
         )
 
-    def encode_json(self, data: object) -> str | bytes:
-        return json.dumps(data, cls=DjangoJSONEncoder)
-
 
 class GraphQLView(
     BaseView,
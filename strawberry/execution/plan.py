@@ -0,0 +1,413 @@
+"""Execution plans compiled once per document and operation.
+
+graphql-core collects the fields of every selection set, merges fragments,
+looks up field definitions and coerces literal arguments again on every
+execution. `CompiledExecutionContext` keeps the result of all that work in an
+`ExecutionPlan`, shared by every execution of the same parsed document and
+operation, so repeated executions only have to run the resolvers.
+
+Plans are kept on the parsed document itself, which means they pay off when
+documents are reused across requests, for example with the
+`ParserCache` extension or with persisted documents.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, TypeAlias
+
+from graphql import (
+    GraphQLError,
+    GraphQLIncludeDirective,
+    GraphQLSkipDirective,
+    ListValueNode,
+    ObjectValueNode,
+    OperationType,
+    Undefined,
+    VariableNode,
+    Visitor,
+    located_error,
+    visit,
+)
+
+from strawberry.schema.schema import StrawberryGraphQLCoreExecutionContext
+from strawberry.utils import IS_GQL_33
+
+if not IS_GQL_33:
+    from graphql.execution.collect_fields import collect_fields, collect_sub_fields
+    from graphql.execution.execute import get_field_def
+    from graphql.execution.values import get_argument_values
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from graphql import (
+        DirectiveNode,
+        DocumentNode,
+        FieldNode,
+        FragmentDefinitionNode,
+        GraphQLField,
+        GraphQLFieldResolver,
+        GraphQLObjectType,
+        GraphQLSchema,
+        Node,
+        OperationDefinitionNode,
+        ValueNode,
+    )
+    from graphql.pyutils import AwaitableOrValue, Path
+
+
+CollectedFields: TypeAlias = "dict[str, list[FieldNode]]"
+
+_CONDITIONAL_DIRECTIVES = frozenset(
+    (GraphQLSkipDirective.name, GraphQLIncludeDirective.name)
+)
+
+
+class _ConditionalVariablesCollector(Visitor):
+    """Collect the variables used by `@skip` and `@include` directives."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.variables: set[str] = set()
+
+    def enter_directive(self, node: DirectiveNode, *_: Any) -> None:
+        if node.name.value not in _CONDITIONAL_DIRECTIVES:
+            return
+
+        for argument in node.arguments:
+            if isinstance(argument.value, VariableNode):
+                self.variables.add(argument.value.name.value)
+
+
+def get_conditional_variables(node: Node) -> tuple[str, ...]:
+    """Return the names of the variables that can change which fields run.
+
+    These are the only variables that affect field collection, so their values
+    are part of the key of an execution plan. `node` is usually a document, but
+    can be any node, like an operation or a fragment.
+    """
+    collector = _ConditionalVariablesCollector()
+    visit(node, collector)
+
+    return tuple(sorted(collector.variables))
+
+
+def _is_constant(value: ValueNode) -> bool:
+    if isinstance(value, VariableNode):
+        return False
+
+    if isinstance(value, ListValueNode):
+        return all(_is_constant(item) for item in value.values)
+
+    if isinstance(value, ObjectValueNode):
+        return all(_is_constant(field.value) for field in value.fields)
+
+    return True
+
+
+class FieldPlan(NamedTuple):
+    field_def: GraphQLField
+    resolve_fn: GraphQLFieldResolver | None
+    # Arguments made only of literal leaf values don't change between
+    # executions, so they are coerced once. `None` if they must be coerced
+    # on every execution.
+    arguments: dict[str, Any] | None
+
+
+class ExecutionPlan:
+    """The reusable part of the execution of an operation.
+
+    The plan is filled lazily by the executions using it: the first execution
+    of a document compiles the selection sets and fields it visits, later
+    executions reuse them.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        fragments: dict[str, FragmentDefinitionNode],
+        operation: OperationDefinitionNode,
+        variable_values: dict[str, Any],
+    ) -> None:
+        self.root_type = schema.get_root_type(operation.operation)
+        self.root_fields: CollectedFields | None = None
+
+        if self.root_type is not None:
+            self.root_fields = collect_fields(
+                schema,
+                fragments,
+                variable_values,
+                self.root_type,
+                operation.selection_set,
+            )
+
+        self.subfields: dict[tuple[Any, ...], CollectedFields] = {}
+        self.fields: dict[tuple[GraphQLObjectType, int], FieldPlan | None] = {}
+
+    def compile_field(
+        self, schema: GraphQLSchema, parent_type: GraphQLObjectType, node: FieldNode
+    ) -> FieldPlan | None:
+        field_def = get_field_def(schema, parent_type, node)
+
+        if not field_def:
+            return None
+
+        arguments = None
+
+        if all(_is_constant(argument.value) for argument in node.arguments):
+            try:
+                arguments = get_argument_values(field_def, node)
+            except GraphQLError:
+                # Let the execution report the error with the field's path
+                arguments = None
+            else:
+                # Resolvers could mutate lists and objects, only share leaves
+                if any(isinstance(value, (list, dict)) for value in arguments.values()):
+                    arguments = None
+
+        return FieldPlan(field_def, field_def.resolve, arguments)
+
+
+# Documents keep their plans in this attribute, by plan cache
+_PLANS_ATTRIBUTE = "_strawberry_execution_plans"
+
+
+class _DocumentPlans:
+    def __init__(self, document: DocumentNode) -> None:
+        self.conditional_variables = get_conditional_variables(document)
+        self.plans: dict[Hashable, ExecutionPlan] = {}
+
+
+class ExecutionPlanCache:
+    """Execution plans of the parsed documents that are still in use.
+
+    Plans refer to the nodes of their document by identity, so they are kept
+    on the document and are dropped with it, for example when it is evicted
+    from the parser cache.
+    """
+
+    def __init__(self) -> None:
+        # Only tracks the documents with plans, to count them
+        self._documents: weakref.WeakSet[_DocumentPlans] = weakref.WeakSet()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get_plan(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        fragments: dict[str, FragmentDefinitionNode],
+        operation: OperationDefinitionNode,
+        variable_values: dict[str, Any],
+    ) -> ExecutionPlan:
+        caches: dict[ExecutionPlanCache, _DocumentPlans] | None = getattr(
+            document, _PLANS_ATTRIBUTE, None
+        )
+
+        if caches is None:
+            caches = {}
+            setattr(document, _PLANS_ATTRIBUTE, caches)
+
+        document_plans = caches.get(self)
+
+        if document_plans is None:
+            document_plans = caches[self] = _DocumentPlans(document)
+            self._documents.add(document_plans)
+
+        key = (
+            schema,
+            id(operation),
+            *(
+                variable_values.get(name)
+                for name in document_plans.conditional_variables
+            ),
+        )
+        plan = document_plans.plans.get(key)
+
+        if plan is None:
+            plan = document_plans.plans[key] = ExecutionPlan(
+                schema, fragments, operation, variable_values
+            )
+
+        return plan
+
+
+class CompiledExecutionContext(StrawberryGraphQLCoreExecutionContext):
+    """Execution context running operations from cached execution plans.
+
+    ```python
+    import strawberry
+    from strawberry.execution.plan import CompiledExecutionContext
+    from strawberry.extensions import ParserCache
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[lambda: ParserCache(maxsize=100)],
+        execution_context_class=CompiledExecutionContext,
+    )
+    ```
+
+    Extensions, middleware and the resolve info passed to resolvers behave
+    exactly like with the default execution context. Execution plans rely on
+    internals of graphql-core 3.2, with graphql-core 3.3 this context behaves
+    like the default one.
+    """
+
+    plan_cache: ClassVar[ExecutionPlanCache] = ExecutionPlanCache()
+    plan: ExecutionPlan | None = None
+
+    if not IS_GQL_33:
+
+        @classmethod
+        def build(
+            cls,
+            schema: GraphQLSchema,
+            document: DocumentNode,
+            *args: Any,
+            **kwargs: Any,
+        ) -> list[GraphQLError] | CompiledExecutionContext:
+            context = super().build(schema, document, *args, **kwargs)
+
+            if isinstance(context, CompiledExecutionContext):
+                context.plan = cls.plan_cache.get_plan(
+                    schema,
+                    document,
+                    context.fragments,
+                    context.operation,
+                    context.variable_values,
+                )
+
+            return context  # type: ignore[return-value]
+
+        def execute_operation(
+            self, operation: OperationDefinitionNode, root_value: Any
+        ) -> AwaitableOrValue[Any] | None:
+            plan = self.plan
+
+            if plan is None or plan.root_fields is None:
+                return super().execute_operation(operation, root_value)
+
+            return (
+                self.execute_fields_serially
+                if operation.operation == OperationType.MUTATION
+                else self.execute_fields
+            )(plan.root_type, root_value, None, plan.root_fields)  # type: ignore[arg-type]
+
+        def collect_subfields(
+            self, return_type: GraphQLObjectType, field_nodes: list[FieldNode]
+        ) -> CollectedFields:
+            plan = self.plan
+
+            if plan is None:
+                return super().collect_subfields(return_type, field_nodes)
+
+            # Same keys as graphql-core's own per execution cache, the plan
+            # holds the field nodes so their ids can't be reused
+            key = (
+                (return_type, id(field_nodes[0]))
+                if len(field_nodes) == 1
+                else (return_type, *map(id, field_nodes))
+            )
+            subfields = plan.subfields.get(key)
+
+            if subfields is None:
+                subfields = plan.subfields[key] = collect_sub_fields(
+                    self.schema,
+                    self.fragments,
+                    self.variable_values,
+                    return_type,
+                    field_nodes,
+                )
+
+            return subfields
+
+        def execute_field(
+            self,
+            parent_type: GraphQLObjectType,
+            source: Any,
+            field_nodes: list[FieldNode],
+            path: Path,
+        ) -> AwaitableOrValue[Any]:
+            plan = self.plan
+
+            if plan is None:
+                return super().execute_field(parent_type, source, field_nodes, path)
+
+            field_node = field_nodes[0]
+            key = (parent_type, id(field_node))
+
+            try:
+                field_plan = plan.fields[key]
+            except KeyError:
+                field_plan = plan.fields[key] = plan.compile_field(
+                    self.schema, parent_type, field_node
+                )
+
+            if field_plan is None:
+                return Undefined
+
+            field_def, resolve_fn, arguments = field_plan
+            return_type = field_def.type
+            resolve_fn = resolve_fn or self.field_resolver
+
+            if self.middleware_manager:
+                resolve_fn = self.middleware_manager.get_field_resolver(resolve_fn)
+
+            info = self.build_resolve_info(field_def, field_nodes, parent_type, path)
+
+            # The rest mirrors graphql-core's `ExecutionContext.execute_field`
+            try:
+                if arguments is None:
+                    arguments = get_argument_values(
+                        field_def, field_node, self.variable_values
+                    )
+
+                result = resolve_fn(source, info, **arguments)
+
+                if self.is_awaitable(result):
+
+                    async def await_result() -> Any:
+                        try:
+                            completed = self.complete_value(
+                                return_type, field_nodes, info, path, await result
+                            )
+                            if self.is_awaitable(completed):
+                                return await completed
+                            return completed  # noqa: TRY300
+                        except Exception as raw_error:  # noqa: BLE001
+                            error = located_error(
+                                raw_error, field_nodes, path.as_list()
+                            )
+                            self.handle_field_error(error, return_type, path)
+                            return None
+
+                    return await_result()
+
+                completed = self.complete_value(
+                    return_type, field_nodes, info, path, result
+                )
+
+                if self.is_awaitable(completed):
+
+                    async def await_completed() -> Any:
+                        try:
+                            return await completed
+                        except Exception as raw_error:  # noqa: BLE001
+                            error = located_error(
+                                raw_error, field_nodes, path.as_list()
+                            )
+                            self.handle_field_error(error, return_type, path)
+                            return None
+
+                    return await_completed()
+
+                return completed  # noqa: TRY300
+            except Exception as raw_error:  # noqa: BLE001
+                error = located_error(raw_error, field_nodes, path.as_list())
+                self.handle_field_error(error, return_type, path)
+                return None
+
+
+__all__ = ["CompiledExecutionContext", "ExecutionPlan", "ExecutionPlanCache"]
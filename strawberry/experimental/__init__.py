@@ -1,6 +1,18 @@
-try:
-    from . import pydantic
-except ModuleNotFoundError:
-    pass
-else:
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
+# `strawberry.experimental.pydantic` is only available with pydantic installed,
+# and is imported when first accessed
+if importlib.util.find_spec("pydantic") is not None:
     __all__ = ["pydantic"]
+
+    if TYPE_CHECKING:
+        from . import pydantic
+    else:
+
+        def __getattr__(name: str) -> Any:
+            if name == "pydantic":
+                return importlib.import_module(".pydantic", __name__)
+
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
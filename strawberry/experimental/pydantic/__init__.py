@@ -1,6 +1,30 @@
-from .error_type import error_type
-from .exceptions import UnregisteredTypeException
-from .object_type import input, interface, type  # noqa: A004
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .error_type import error_type
+    from .exceptions import UnregisteredTypeException
+    from .object_type import input, interface, type  # noqa: A004
+else:
+    from strawberry._lazy_import import lazy_import
+
+    __getattr__, __dir__ = lazy_import(
+        __name__,
+        {
+            "UnregisteredTypeException": ".exceptions",
+            "error_type": ".error_type",
+            "input": ".object_type",
+            "interface": ".object_type",
+            "type": ".object_type",
+        },
+        submodules=(
+            "_compat",
+            "conversion",
+            "exceptions",
+            "fields",
+            "object_type",
+            "utils",
+        ),
+    )
 
 __all__ = [
     "UnregisteredTypeException",
@@ -1,32 +1,78 @@
 import warnings
+from typing import TYPE_CHECKING, Any
 
-from .add_validation_rules import AddValidationRules
-from .base_extension import LifecycleStep, SchemaExtension
-from .disable_introspection import DisableIntrospection
-from .disable_validation import DisableValidation
-from .field_extension import FieldExtension
-from .mask_errors import MaskErrors
-from .max_aliases import MaxAliasesLimiter
-from .max_tokens import MaxTokensLimiter
-from .parser_cache import ParserCache
-from .pydantic_error_extension import PydanticErrorExtension
-from .query_depth_limiter import IgnoreContext, QueryDepthLimiter
-from .validation_cache import ValidationCache
+if TYPE_CHECKING:
+    from .add_validation_rules import AddValidationRules
+    from .base_extension import LifecycleStep, SchemaExtension
+    from .disable_introspection import DisableIntrospection
+    from .disable_validation import DisableValidation
+    from .field_extension import FieldExtension
+    from .field_metrics import FieldMetrics, FieldMetricsExtension
+    from .mask_errors import MaskErrors
+    from .max_aliases import MaxAliasesLimiter
+    from .max_tokens import MaxTokensLimiter
+    from .parser_cache import ParserCache
+    from .pydantic_error_extension import PydanticErrorExtension
+    from .query_depth_limiter import IgnoreContext, QueryDepthLimiter
+    from .validation_cache import ValidationCache
 
+    Extension = SchemaExtension
+else:
+    from strawberry._lazy_import import lazy_import
 
-def __getattr__(name: str) -> type[SchemaExtension]:
-    if name == "Extension":
-        warnings.warn(
-            (
-                "importing `Extension` from `strawberry.extensions` "
-                "is deprecated, import `SchemaExtension` instead."
-            ),
-            DeprecationWarning,
-            stacklevel=2,
-        )
-        return SchemaExtension
+    _getattr, __dir__ = lazy_import(
+        __name__,
+        {
+            "AddValidationRules": ".add_validation_rules",
+            "DisableIntrospection": ".disable_introspection",
+            "DisableValidation": ".disable_validation",
+            "FieldExtension": ".field_extension",
+            "FieldMetrics": ".field_metrics",
+            "FieldMetricsExtension": ".field_metrics",
+            "IgnoreContext": ".query_depth_limiter",
+            "LifecycleStep": ".base_extension",
+            "MaskErrors": ".mask_errors",
+            "MaxAliasesLimiter": ".max_aliases",
+            "MaxTokensLimiter": ".max_tokens",
+            "ParserCache": ".parser_cache",
+            "PydanticErrorExtension": ".pydantic_error_extension",
+            "QueryDepthLimiter": ".query_depth_limiter",
+            "SchemaExtension": ".base_extension",
+            "ValidationCache": ".validation_cache",
+        },
+        submodules=(
+            "add_validation_rules",
+            "base_extension",
+            "context",
+            "directives",
+            "disable_introspection",
+            "disable_validation",
+            "field_extension",
+            "mask_errors",
+            "max_aliases",
+            "max_tokens",
+            "parser_cache",
+            "pydantic_error_extension",
+            "query_depth_limiter",
+            "runner",
+            "utils",
+            "validation_cache",
+        ),
+    )
 
-    raise AttributeError(f"module {__name__} has no attribute {name}")
+    def __getattr__(name: str) -> Any:
+        if name == "Extension":
+            warnings.warn(
+                (
+                    "importing `Extension` from `strawberry.extensions` "
+                    "is deprecated, import `SchemaExtension` instead."
+                ),
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            return _getattr("SchemaExtension")
+
+        return _getattr(name)
 
 
 __all__ = [
@@ -34,6 +80,8 @@ __all__ = [
     "DisableIntrospection",
     "DisableValidation",
     "FieldExtension",
+    "FieldMetrics",
+    "FieldMetricsExtension",
     "IgnoreContext",
     "LifecycleStep",
     "MaskErrors",
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
 
     from strawberry.types import ExecutionContext
+    from strawberry.types.field import StrawberryField
 
 
 class LifecycleStep(Enum):
@@ -64,6 +65,23 @@ class SchemaExtension:
     def get_results(self) -> AwaitableOrValue[dict[str, Any]]:
         return {}
 
+    @classmethod
+    def targets_field(cls, field: StrawberryField | None) -> bool:
+        """Whether `resolve` should wrap the resolution of the given field.
+
+        By default `resolve` wraps every field. Override it to skip fields
+        that don't need to go through `resolve`, for example fields without a
+        custom resolver, so that resolving them has no overhead at all.
+
+        This is called once per extension class and field, and the answer is
+        reused by every request, so it must only depend on the field.
+
+        Args:
+            field: The Strawberry field, or `None` for fields that are not
+                defined with Strawberry, like introspection fields.
+        """
+        return True
+
     @classmethod
     def _implements_resolve(cls) -> bool:
         """Whether the extension implements the resolve method."""
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import contextlib
 import inspect
-import types
 from asyncio import iscoroutinefunction
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     NamedTuple,
+    TypeAlias,
 )
+from weakref import WeakKeyDictionary
 
 from strawberry.extensions import SchemaExtension
 
@@ -30,6 +32,33 @@ class WrappedHook(NamedTuple):
     is_async: bool
 
 
+HookFactory: TypeAlias = (
+    "Callable[[SchemaExtension], contextlib.AbstractAsyncContextManager[None]"
+    " | contextlib.AbstractContextManager[None]]"
+)
+
+
+class HookPlan(NamedTuple):
+    """How to run the hook of an extension class for a lifecycle stage.
+
+    Analyzing a hook means inspecting the function and wrapping it into a
+    context manager factory, so it's done once per extension class and the
+    plan is reused by every request.
+    """
+
+    # The hook as defined on the class, which may not even be callable
+    hook_fn: Any
+    factory: HookFactory | None
+    is_async: bool
+
+
+# The plans of each hook, by extension class. Weak keys, so that classes
+# created at runtime, like in tests, are freed with their plans
+_hook_plans: WeakKeyDictionary[type[SchemaExtension], dict[str, HookPlan]] = (
+    WeakKeyDictionary()
+)
+
+
 class ExtensionContextManagerBase:
     __slots__ = (
         "async_exit_stack",
@@ -49,58 +78,100 @@ class ExtensionContextManagerBase:
                 self.hooks.append(hook)
 
     def get_hook(self, extension: SchemaExtension) -> WrappedHook | None:
-        hook_fn: Hook | None = getattr(type(extension), self.HOOK_NAME)
-        hook_fn = hook_fn if hook_fn is not self.default_hook else None
+        plan = self.get_hook_plan(type(extension))
 
-        if hook_fn:
-            if inspect.isgeneratorfunction(hook_fn):
-                context_manager = contextlib.contextmanager(
-                    types.MethodType(hook_fn, extension)
-                )
-                return WrappedHook(
-                    extension=extension, hook=context_manager, is_async=False
-                )
-
-            if inspect.isasyncgenfunction(hook_fn):
-                context_manager_async = contextlib.asynccontextmanager(
-                    types.MethodType(hook_fn, extension)
-                )
-                return WrappedHook(
-                    extension=extension, hook=context_manager_async, is_async=True
-                )
-
-            if callable(hook_fn):
-                return self.from_callable(extension, hook_fn)
+        if plan.factory is None:
+            if plan.hook_fn is self.default_hook or not plan.hook_fn:
+                return None  # Current extension does not define a hook for this lifecycle stage
 
             raise ValueError(
                 f"Hook {self.HOOK_NAME} on {extension} "
-                f"must be callable, received {hook_fn!r}"
+                f"must be callable, received {plan.hook_fn!r}"
             )
 
-        return None  # Current extension does not define a hook for this lifecycle stage
+        return WrappedHook(
+            extension=extension,
+            hook=partial(plan.factory, extension),
+            is_async=plan.is_async,
+        )
+
+    def get_hook_plan(self, extension_class: type[SchemaExtension]) -> HookPlan:
+        hook_fn: Hook | None = getattr(extension_class, self.HOOK_NAME)
+        plans = _hook_plans.get(extension_class)
+
+        if plans is None:
+            plans = _hook_plans[extension_class] = {}
+
+        plan = plans.get(self.HOOK_NAME)
+
+        # Hooks can be replaced on the class, e.g. when patched in tests
+        if plan is None or plan.hook_fn is not hook_fn:
+            plan = plans[self.HOOK_NAME] = self.build_hook_plan(hook_fn)
+
+        return plan
+
+    def build_hook_plan(self, hook_fn: Hook | None) -> HookPlan:
+        if hook_fn is self.default_hook or not hook_fn:
+            return HookPlan(hook_fn=hook_fn, factory=None, is_async=False)
+
+        if inspect.isgeneratorfunction(hook_fn):
+            return HookPlan(
+                hook_fn=hook_fn,
+                factory=contextlib.contextmanager(hook_fn),
+                is_async=False,
+            )
+
+        if inspect.isasyncgenfunction(hook_fn):
+            return HookPlan(
+                hook_fn=hook_fn,
+                factory=contextlib.asynccontextmanager(hook_fn),
+                is_async=True,
+            )
+
+        if callable(hook_fn):
+            return self.plan_from_callable(hook_fn)
+
+        # Not callable, reported when binding the hook to an extension
+        return HookPlan(hook_fn=hook_fn, factory=None, is_async=False)
 
     @staticmethod
-    def from_callable(
-        extension: SchemaExtension,
+    def plan_from_callable(
         func: Callable[[SchemaExtension], AwaitableOrValue[Any]],
-    ) -> WrappedHook:
+    ) -> HookPlan:
         if iscoroutinefunction(func):
 
             @contextlib.asynccontextmanager
-            async def iterator() -> AsyncIterator[None]:
+            async def async_iterator(extension: SchemaExtension) -> AsyncIterator[None]:
                 await func(extension)
                 yield
 
-            return WrappedHook(extension=extension, hook=iterator, is_async=True)
+            return HookPlan(hook_fn=func, factory=async_iterator, is_async=True)
 
-        @contextlib.contextmanager  # type: ignore[no-redef]
-        def iterator() -> Iterator[None]:
+        @contextlib.contextmanager
+        def iterator(extension: SchemaExtension) -> Iterator[None]:
             func(extension)
             yield
 
-        return WrappedHook(extension=extension, hook=iterator, is_async=False)
+        return HookPlan(hook_fn=func, factory=iterator, is_async=False)
+
+    @staticmethod
+    def from_callable(
+        extension: SchemaExtension,
+        func: Callable[[SchemaExtension], AwaitableOrValue[Any]],
+    ) -> WrappedHook:
+        plan = ExtensionContextManagerBase.plan_from_callable(func)
+        assert plan.factory is not None
+
+        return WrappedHook(
+            extension=extension,
+            hook=partial(plan.factory, extension),
+            is_async=plan.is_async,
+        )
 
     def __enter__(self) -> None:
+        if not self.hooks:
+            return
+
         self.exit_stack = contextlib.ExitStack()
 
         self.exit_stack.__enter__()
@@ -119,9 +190,15 @@ class ExtensionContextManagerBase:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        if not self.hooks:
+            return
+
         self.exit_stack.__exit__(exc_type, exc_val, exc_tb)
 
     async def __aenter__(self) -> None:
+        if not self.hooks:
+            return
+
         self.async_exit_stack = contextlib.AsyncExitStack()
 
         await self.async_exit_stack.__aenter__()
@@ -138,6 +215,9 @@ class ExtensionContextManagerBase:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        if not self.hooks:
+            return
+
         await self.async_exit_stack.__aexit__(exc_type, exc_val, exc_tb)
 
 
@@ -0,0 +1,324 @@
+"""Aggregate resolver timings per field across every request.
+
+Tracing extensions attach the timing of every resolver to the response of
+each request, which is too expensive to keep enabled and doesn't tell which
+resolvers are the hottest across all the traffic. `FieldMetricsExtension`
+instead records the latency, calls and errors of each field resolver in the
+in-process histograms of a `FieldMetrics` registry, which can be exported as a
+dict or in the Prometheus text format.
+"""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import random
+import threading
+import time
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any
+
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.tracing.utils import is_traced_field
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator, Sequence
+
+    from graphql import GraphQLResolveInfo
+
+    from strawberry.types.field import StrawberryField
+
+# Upper bounds of the latency buckets, in seconds
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclasses.dataclass
+class FieldStats:
+    """The latency histogram, calls and errors of a field resolver.
+
+    Attributes:
+        parent_type: The name of the type the field belongs to.
+        field_name: The name of the field.
+        buckets: The upper bounds of the latency buckets, in seconds.
+        bucket_counts: The number of calls of each bucket, the last one
+            counting the calls slower than every bucket.
+        count: The number of calls.
+        errors: The number of calls that raised an error.
+        total_time: The total time spent in the resolver, in seconds.
+        max_time: The longest call, in seconds.
+    """
+
+    parent_type: str
+    field_name: str
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    bucket_counts: list[int] = dataclasses.field(default_factory=list)
+    count: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+    def observe(self, duration: float, *, error: bool = False) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+
+        if error:
+            self.errors += 1
+
+    def cumulative_buckets(self) -> list[tuple[str, int]]:
+        """The number of calls up to each bucket bound, like Prometheus."""
+        bounds = [_format_float(bound) for bound in self.buckets]
+        cumulative = []
+        total = 0
+
+        for bound, count in zip([*bounds, "+Inf"], self.bucket_counts, strict=True):
+            total += count
+            cumulative.append((bound, total))
+
+        return cumulative
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "parentType": self.parent_type,
+            "fieldName": self.field_name,
+            "count": self.count,
+            "errors": self.errors,
+            "totalTime": self.total_time,
+            "averageTime": self.average_time,
+            "maxTime": self.max_time,
+            "buckets": dict(self.cumulative_buckets()),
+        }
+
+
+def _format_float(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class FieldMetrics:
+    """An in-process registry of `FieldStats`, by type and field name."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize the FieldMetrics.
+
+        Args:
+            buckets: The upper bounds of the latency buckets, in seconds.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._stats: dict[tuple[str, str], FieldStats] = {}
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> Iterator[FieldStats]:
+        with self._lock:
+            return iter(list(self._stats.values()))
+
+    def get(self, parent_type: str, field_name: str) -> FieldStats | None:
+        return self._stats.get((parent_type, field_name))
+
+    def observe(
+        self,
+        parent_type: str,
+        field_name: str,
+        duration: float,
+        *,
+        error: bool = False,
+    ) -> None:
+        key = (parent_type, field_name)
+
+        with self._lock:
+            stats = self._stats.get(key)
+
+            if stats is None:
+                stats = self._stats[key] = FieldStats(
+                    parent_type, field_name, self.buckets
+                )
+
+            stats.observe(duration, error=error)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def hottest(self, limit: int = 10) -> list[FieldStats]:
+        """The fields that spent the most time resolving."""
+        return sorted(self, key=lambda stats: stats.total_time, reverse=True)[:limit]
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """The stats of every field, by `Type.field` coordinate."""
+        with self._lock:
+            return {
+                f"{stats.parent_type}.{stats.field_name}": stats.to_dict()
+                for stats in self._stats.values()
+            }
+
+    def to_prometheus(self, prefix: str = "strawberry_field") -> str:
+        """Export the stats in the Prometheus text exposition format.
+
+        Args:
+            prefix: The prefix of the metric names.
+        """
+        duration = f"{prefix}_duration_seconds"
+        errors = f"{prefix}_errors_total"
+        duration_lines = [
+            f"# HELP {duration} Time spent resolving the field.",
+            f"# TYPE {duration} histogram",
+        ]
+        error_lines = [
+            f"# HELP {errors} Errors raised resolving the field.",
+            f"# TYPE {errors} counter",
+        ]
+
+        with self._lock:
+            all_stats = [
+                dataclasses.replace(stats, bucket_counts=list(stats.bucket_counts))
+                for stats in self._stats.values()
+            ]
+
+        for stats in all_stats:
+            labels = f'parent_type="{stats.parent_type}",field="{stats.field_name}"'
+
+            for bound, count in stats.cumulative_buckets():
+                duration_lines.append(
+                    f'{duration}_bucket{{{labels},le="{bound}"}} {count}'
+                )
+
+            duration_lines.append(f"{duration}_sum{{{labels}}} {stats.total_time!r}")
+            duration_lines.append(f"{duration}_count{{{labels}}} {stats.count}")
+            error_lines.append(f"{errors}{{{labels}}} {stats.errors}")
+
+        return "\n".join([*duration_lines, *error_lines]) + "\n"
+
+
+# The registry used by `FieldMetricsExtension` unless another one is given
+field_metrics = FieldMetrics()
+
+
+class FieldMetricsExtension(SchemaExtension):
+    """Record the latency, calls and errors of the field resolvers.
+
+    Only fields with a custom resolver are measured. With a `sample_rate`
+    lower than 1, only that fraction of the operations is measured. The
+    fields of the other operations still go through `resolve`, but skip the
+    timing and recording.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import FieldMetricsExtension
+    from strawberry.extensions.field_metrics import field_metrics
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[lambda: FieldMetricsExtension(sample_rate=0.1)],
+    )
+
+    print(field_metrics.to_prometheus())
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        metrics: FieldMetrics | None = None,
+        sample_rate: float = 1.0,
+    ) -> None:
+        """Initialize the FieldMetricsExtension.
+
+        Args:
+            metrics: The registry to record the stats in, the module's
+                `field_metrics` registry by default.
+            sample_rate: The fraction of the operations to measure, between 0
+                and 1.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+
+        self.metrics = metrics if metrics is not None else field_metrics
+        self.sample_rate = sample_rate
+        self._sampled = sample_rate == 1
+
+    @classmethod
+    def targets_field(cls, field: StrawberryField | None) -> bool:
+        return is_traced_field(field)
+
+    def on_operation(self) -> Iterator[None]:
+        self._sampled = self.sample_rate == 1 or random.random() < self.sample_rate  # noqa: S311
+        yield
+
+    def resolve(
+        self,
+        _next: Callable,
+        root: Any,
+        info: GraphQLResolveInfo,
+        *args: str,
+        **kwargs: Any,
+    ) -> Any:
+        if not self._sampled:
+            return _next(root, info, *args, **kwargs)
+
+        start = time.perf_counter()
+
+        try:
+            result = _next(root, info, *args, **kwargs)
+        except Exception:
+            self._observe(info, start, error=True)
+            raise
+
+        if isawaitable(result):
+            return self._await_result(result, info, start)
+
+        self._observe(info, start, error=False)
+        return result
+
+    async def _await_result(
+        self, result: Awaitable[Any], info: GraphQLResolveInfo, start: float
+    ) -> Any:
+        try:
+            value = await result
+        except Exception:
+            self._observe(info, start, error=True)
+            raise
+
+        self._observe(info, start, error=False)
+        return value
+
+    def _observe(self, info: GraphQLResolveInfo, start: float, *, error: bool) -> None:
+        self.metrics.observe(
+            info.parent_type.name,
+            info.field_name,
+            time.perf_counter() - start,
+            error=error,
+        )
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "FieldMetrics",
+    "FieldMetricsExtension",
+    "FieldStats",
+    "field_metrics",
+]
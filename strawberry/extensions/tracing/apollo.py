@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any
 from strawberry.extensions import SchemaExtension
 from strawberry.extensions.utils import get_path_from_info
 
-from .utils import should_skip_tracing
+from .utils import is_traced_field, should_skip_tracing
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
@@ -20,6 +20,7 @@ DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 if TYPE_CHECKING:
     from strawberry.types.execution import ExecutionContext
+    from strawberry.types.field import StrawberryField
 
 
 @dataclasses.dataclass
@@ -147,6 +148,10 @@ class ApolloTracingExtension(SchemaExtension):
     def get_results(self) -> dict[str, dict[str, Any]]:
         return {"tracing": self.stats.to_json()}
 
+    @classmethod
+    def targets_field(cls, field: StrawberryField | None) -> bool:
+        return is_traced_field(field)
+
     async def resolve(
         self,
         _next: Callable,
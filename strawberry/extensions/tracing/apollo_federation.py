@@ -71,7 +71,7 @@ from typing import TYPE_CHECKING, Any
 
 from strawberry.extensions import SchemaExtension
 
-from .utils import should_skip_tracing
+from .utils import is_traced_field, should_skip_tracing
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
@@ -79,6 +79,7 @@ if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
 
     from strawberry.types.execution import ExecutionContext
+    from strawberry.types.field import StrawberryField
 
 # Header that triggers ftv1 tracing
 FTV1_HEADER = "apollo-federation-include-trace"
@@ -356,6 +357,10 @@ class ApolloFederationTracingExtension(SchemaExtension):
             self._trace.duration_ns = time.perf_counter_ns() - self._start_time_ns
             self._trace.root = self._root_node
 
+    @classmethod
+    def targets_field(cls, field: StrawberryField | None) -> bool:
+        return is_traced_field(field)
+
     async def resolve(
         self,
         _next: Callable,
@@ -9,7 +9,7 @@ import ddtrace
 from packaging import version
 
 from strawberry.extensions import LifecycleStep, SchemaExtension
-from strawberry.extensions.tracing.utils import should_skip_tracing
+from strawberry.extensions.tracing.utils import is_traced_field, should_skip_tracing
 
 parsed_ddtrace_version = version.parse(ddtrace.__version__)
 if parsed_ddtrace_version >= version.parse("3.0.0"):
@@ -24,6 +24,7 @@ if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
 
     from strawberry.types.execution import ExecutionContext
+    from strawberry.types.field import StrawberryField
 
 
 class DatadogTracingExtension(SchemaExtension):
@@ -122,6 +123,10 @@ class DatadogTracingExtension(SchemaExtension):
         ) as self.parsing_span:
             yield
 
+    @classmethod
+    def targets_field(cls, field: StrawberryField | None) -> bool:
+        return is_traced_field(field)
+
     async def resolve(
         self,
         _next: Callable,
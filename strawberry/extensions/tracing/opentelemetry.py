@@ -14,7 +14,7 @@ from opentelemetry.trace import SpanKind
 from strawberry.extensions import LifecycleStep, SchemaExtension
 from strawberry.extensions.utils import get_path_from_info
 
-from .utils import should_skip_tracing
+from .utils import is_traced_field, should_skip_tracing
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterable
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
     from opentelemetry.trace import Span, Tracer
 
     from strawberry.types.execution import ExecutionContext
+    from strawberry.types.field import StrawberryField
 
 
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
@@ -149,6 +150,10 @@ class OpenTelemetryExtension(SchemaExtension):
                 converted_value = self.convert_to_allowed_types(value)
                 span.set_attribute(f"graphql.param.{kwarg}", converted_value)
 
+    @classmethod
+    def targets_field(cls, field: StrawberryField | None) -> bool:
+        return is_traced_field(field)
+
     async def resolve(
         self,
         _next: Callable,
@@ -10,6 +10,17 @@ if TYPE_CHECKING:
 
     from graphql import GraphQLResolveInfo
 
+    from strawberry.types.field import StrawberryField
+
+
+def is_traced_field(field: StrawberryField | None) -> bool:
+    """Whether tracing extensions should wrap the resolution of a field.
+
+    Only fields with a custom resolver are traced, fields that just read an
+    attribute and fields not defined with Strawberry are resolved untouched.
+    """
+    return field is not None and field.base_resolver is not None
+
 
 def should_skip_tracing(resolver: Callable[..., Any], info: GraphQLResolveInfo) -> bool:
     if info.field_name not in info.parent_type.fields:
@@ -22,4 +33,4 @@ def should_skip_tracing(resolver: Callable[..., Any], info: GraphQLResolveInfo)
     )
 
 
-__all__ = ["should_skip_tracing"]
+__all__ = ["is_traced_field", "should_skip_tracing"]
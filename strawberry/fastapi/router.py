@@ -284,7 +284,7 @@ class GraphQLRouter(
     async def create_streaming_response(
         self,
         request: Request,
-        stream: Callable[[], AsyncIterator[str]],
+        stream: Callable[[], AsyncIterator[bytes]],
         sub_response: Response,
         headers: Mapping[str, str],
     ) -> Response:
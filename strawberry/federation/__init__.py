@@ -1,12 +1,43 @@
-from .argument import argument
-from .enum import enum, enum_value
-from .field import field
-from .mutation import mutation
-from .object_type import input, interface, interface_object, type  # noqa: A004
-from .scalar import scalar
-from .schema import Schema
-from .schema_directive import schema_directive
-from .union import union
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .argument import argument
+    from .enum import enum, enum_value
+    from .field import field
+    from .mutation import mutation
+    from .object_type import input, interface, interface_object, type  # noqa: A004
+    from .scalar import scalar
+    from .schema import Schema
+    from .schema_directive import schema_directive
+    from .union import union
+else:
+    from strawberry._lazy_import import lazy_import
+
+    __getattr__, __dir__ = lazy_import(
+        __name__,
+        {
+            "Schema": ".schema",
+            "argument": ".argument",
+            "enum": ".enum",
+            "enum_value": ".enum",
+            "field": ".field",
+            "input": ".object_type",
+            "interface": ".object_type",
+            "interface_object": ".object_type",
+            "mutation": ".mutation",
+            "scalar": ".scalar",
+            "schema_directive": ".schema_directive",
+            "type": ".object_type",
+            "union": ".union",
+        },
+        submodules=(
+            "object_type",
+            "params",
+            "schema",
+            "types",
+            "versions",
+        ),
+    )
 
 __all__ = [
     "Schema",
@@ -1,20 +1,23 @@
+import asyncio
+import inspect
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from functools import cached_property
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
     Literal,
+    NamedTuple,
     NewType,
     Optional,
     Union,
-    cast,
 )
 
 from strawberry.annotation import StrawberryAnnotation
 from strawberry.printer import print_schema
 from strawberry.schema import Schema as BaseSchema
+from strawberry.types.arguments import build_argument_converter
 from strawberry.types.base import (
     StrawberryContainer,
     StrawberryObjectDefinition,
@@ -37,7 +40,9 @@ if TYPE_CHECKING:
     from strawberry.federation.schema_directives import ComposeDirective
     from strawberry.schema.config import StrawberryConfig
     from strawberry.schema_directive import StrawberrySchemaDirective
+    from strawberry.types.arguments import ArgumentConverter
     from strawberry.types.enum import StrawberryEnumDefinition
+    from strawberry.utils.await_maybe import AwaitableOrValue
 
 
 FederationAny = NewType("FederationAny", object)
@@ -113,6 +118,8 @@ class Schema(BaseSchema):
         )
 
         self.schema_directives = list(schema_directives)
+        # Filled lazily, only the types returned by `_entities` need an entry
+        self._entity_resolvers: dict[str, _EntityResolver] = {}
 
         # Validate directive compatibility with federation version
         self._validate_directive_compatibility()
@@ -186,50 +193,80 @@ class Schema(BaseSchema):
 
         return query_type
 
+    def _get_entity_resolver(self, type_name: str) -> "_EntityResolver":
+        """Inspect how the references of an object type are resolved, once."""
+        entity_resolver = self._entity_resolvers.get(type_name)
+
+        if entity_resolver is None:
+            entity_resolver = self._entity_resolvers[type_name] = (
+                self._build_entity_resolver(type_name)
+            )
+
+        return entity_resolver
+
+    def _build_entity_resolver(self, type_name: str) -> "_EntityResolver":
+        definition = self.schema_converter.type_map[type_name].definition
+
+        if not isinstance(definition, StrawberryObjectDefinition):
+            raise KeyError(type_name)
+
+        origin = definition.origin
+        method: Literal["resolve_references", "resolve_reference"] | None = None
+
+        if hasattr(origin, "resolve_references"):
+            method = "resolve_references"
+        elif hasattr(origin, "resolve_reference"):
+            method = "resolve_reference"
+
+        pass_info = method is not None and "info" in get_func_args(
+            getattr(origin, method)
+        )
+        # Types without hooks are instantiated from their representations
+        convert_representation = (
+            build_argument_converter(
+                origin,
+                scalar_registry=self.schema_converter.scalar_registry,
+                config=self.config,
+                converters=self.schema_converter._argument_converters,
+            )
+            if method is None
+            else None
+        )
+
+        return _EntityResolver(definition, method, pass_info, convert_representation)
+
     def entities_resolver(
         self, info: Info, representations: list[FederationAny]
-    ) -> list[FederationAny]:
-        results = []
+    ) -> "AwaitableOrValue[list[FederationAny]]":
+        results: list[Any] = [None] * len(representations)
+        indexes_by_type: defaultdict[str, list[int]] = defaultdict(list)
 
-        for representation in representations:
+        for index, representation in enumerate(representations):
             type_name = representation.pop("__typename")  # type: ignore[attr-defined]
-            type_ = self.schema_converter.type_map[type_name]
-
-            definition = cast("StrawberryObjectDefinition", type_.definition)
+            indexes_by_type[type_name].append(index)
 
-            if hasattr(definition.origin, "resolve_reference"):
-                resolve_reference = definition.origin.resolve_reference
+        pending: list[Awaitable[None]] = []
 
-                func_args = get_func_args(resolve_reference)
-                kwargs = representation
-
-                # TODO: use the same logic we use for other resolvers
-                if "info" in func_args:
-                    kwargs["info"] = info  # type: ignore[index]
+        for type_name, indexes in indexes_by_type.items():
+            entity_resolver = self._get_entity_resolver(type_name)
+            group = [representations[index] for index in indexes]
+            resolved = entity_resolver.resolve(info, type_name, group)
 
-                try:
-                    result = resolve_reference(**kwargs)  # type: ignore[arg-type]
-                except Exception as e:  # noqa: BLE001
-                    result = e
+            if inspect.isawaitable(resolved):
+                pending.append(_set_results(results, indexes, resolved))
             else:
-                from strawberry.types.arguments import convert_argument
+                for index, result in zip(indexes, resolved, strict=True):
+                    results[index] = result
 
-                config = info.schema.config
-                scalar_registry = info.schema.schema_converter.scalar_registry
-
-                try:
-                    result = convert_argument(
-                        representation,
-                        type_=definition.origin,
-                        scalar_registry=scalar_registry,
-                        config=config,
-                    )
-                except Exception:  # noqa: BLE001
-                    result = TypeError(f"Unable to resolve reference for {type_name}")
+        if not pending:
+            return results
 
-            results.append(result)
+        # Wait for the bulk resolvers of the different types concurrently
+        async def gather_results() -> list[FederationAny]:
+            await asyncio.gather(*pending)
+            return results
 
-        return results
+        return gather_results()
 
     @cached_property
     def schema_directives_in_use(self) -> list[object]:
@@ -365,6 +402,104 @@ class Schema(BaseSchema):
         pass
 
 
+class _EntityResolver(NamedTuple):
+    """How the references of an object type are resolved.
+
+    `method` is the name of the bulk `resolve_references` hook or of the
+    `resolve_reference` hook of the type, or `None` if the type is
+    instantiated from the representation with `convert_representation`.
+    """
+
+    definition: StrawberryObjectDefinition
+    method: Literal["resolve_references", "resolve_reference"] | None
+    pass_info: bool
+    convert_representation: "ArgumentConverter | None" = None
+
+    def resolve(
+        self, info: Info, type_name: str, representations: list[Any]
+    ) -> "AwaitableOrValue[list[Any]]":
+        origin = self.definition.origin
+
+        if self.method == "resolve_references":
+            kwargs: dict[str, Any] = {"representations": representations}
+            if self.pass_info:
+                kwargs["info"] = info
+
+            try:
+                results = origin.resolve_references(**kwargs)
+
+                if inspect.isawaitable(results):
+                    return _await_bulk_results(type_name, representations, results)
+
+                # Results can be a generator raising while it's iterated
+                return _check_bulk_results(type_name, representations, results)
+            except Exception as e:  # noqa: BLE001
+                return [e] * len(representations)
+
+        if self.method == "resolve_reference":
+            results = []
+
+            for representation in representations:
+                kwargs = representation
+                # TODO: use the same logic we use for other resolvers
+                if self.pass_info:
+                    kwargs["info"] = info
+
+                try:
+                    result = origin.resolve_reference(**kwargs)
+                except Exception as e:  # noqa: BLE001
+                    result = e
+
+                results.append(result)
+
+            return results
+
+        convert_representation = self.convert_representation
+        assert convert_representation is not None
+        results = []
+
+        for representation in representations:
+            try:
+                result = convert_representation(representation)
+            except Exception:  # noqa: BLE001
+                result = TypeError(f"Unable to resolve reference for {type_name}")
+
+            results.append(result)
+
+        return results
+
+
+def _check_bulk_results(
+    type_name: str, representations: list[Any], results: Iterable[Any]
+) -> list[Any]:
+    results = list(results)
+
+    if len(results) != len(representations):
+        error = ValueError(
+            f"{type_name}.resolve_references returned {len(results)} results "
+            f"for {len(representations)} representations"
+        )
+        return [error] * len(representations)
+
+    return results
+
+
+async def _await_bulk_results(
+    type_name: str, representations: list[Any], results: Awaitable[Iterable[Any]]
+) -> list[Any]:
+    try:
+        return _check_bulk_results(type_name, representations, await results)
+    except Exception as e:  # noqa: BLE001
+        return [e] * len(representations)
+
+
+async def _set_results(
+    results: list[Any], indexes: list[int], resolved: Awaitable[list[Any]]
+) -> None:
+    for index, result in zip(indexes, await resolved, strict=True):
+        results[index] = result
+
+
 def _get_entity_type(
     query: type[WithStrawberryObjectDefinition] | None,
     mutation: type[WithStrawberryObjectDefinition] | None,
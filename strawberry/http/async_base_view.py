@@ -1,8 +1,12 @@
 import abc
 import asyncio
 import json
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+import warnings
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Hashable, Mapping, Sequence
+from contextlib import suppress
 from datetime import timedelta
+from functools import cached_property
 from typing import (
     Any,
     Generic,
@@ -22,7 +26,13 @@ from strawberry.http import (
     GraphQLRequestProtocol,
     process_result,
 )
+from strawberry.http.exceptions import WebSocketDisconnected
 from strawberry.http.ides import GraphQL_IDE
+from strawberry.http.websocket_frames import EncodedPayloadCache
+from strawberry.persisted_documents import (
+    get_persisted_query,
+    is_valid_persisted_query,
+)
 from strawberry.schema._graphql_core import (
     GraphQLIncrementalExecutionResults,
     InitialIncrementalExecutionResult,
@@ -38,6 +48,7 @@ from strawberry.subscriptions.protocols.graphql_transport_ws.handlers import (
     BaseGraphQLTransportWSHandler,
 )
 from strawberry.subscriptions.protocols.graphql_ws.handlers import BaseGraphQLWSHandler
+from strawberry.subscriptions.scheduler import OperationMetrics
 from strawberry.types import ExecutionResult, SubscriptionExecutionResult
 from strawberry.types.graphql import OperationType
 from strawberry.types.unset import UNSET, UnsetType
@@ -45,10 +56,12 @@ from strawberry.types.unset import UNSET, UnsetType
 from .base import BaseView
 from .parse_content_type import parse_content_type
 from .streaming import (
-    AsyncTextStream,
+    JSON_STREAM_CHUNK_SIZE,
+    AsyncByteStream,
     HTTPStreamTransport,
     MultipartTransport,
     merge_stream_with_heartbeat,
+    stream_json,
 )
 from .typevars import (
     Context,
@@ -76,6 +89,156 @@ class AsyncWebSocketAdapter(abc.ABC):
     @abc.abstractmethod
     async def close(self, code: int, reason: str) -> None: ...
 
+    def encode_json_text(self, message: Mapping[str, object]) -> str:
+        """Encode a message with the view's `encode_json` as a text frame.
+
+        GraphQL over WebSocket protocols only use text frames, even when the
+        JSON codec of the view encodes to bytes.
+        """
+        return self.view._encode_json_text(message)
+
+    async def send_text(self, data: str) -> None:
+        """Send a message that is already encoded as JSON.
+
+        Adapters should override this to send `data` as a text frame, the
+        default implementation decodes it again to send it with `send_json`.
+        """
+        await self.send_json(cast("Mapping[str, object]", self.view.decode_json(data)))
+
+    async def send_latest(self, key: Hashable, data: str) -> None:
+        """Send a message that newer messages with the same key can replace.
+
+        Only buffered adapters hold messages long enough to replace them, the
+        others send every message.
+        """
+        await self.send_text(data)
+
+
+class BufferedWebSocketAdapter(AsyncWebSocketAdapter):
+    """Send the messages of a websocket from a bounded queue.
+
+    Messages are sent by a writer task. Senders wait while the queue is full,
+    so slow clients slow down the operations sending to them instead of
+    growing the memory of the server. Messages sent with `send_latest` never
+    wait: they replace the message with the same key still in the queue, so
+    slow clients only get the latest value.
+
+    With a coalescing window, the writer waits for the window to pass before
+    sending the queued messages, batching them and replacing more of the
+    messages sent with `send_latest`.
+
+    Closing waits up to `close_timeout` seconds for the queued messages to be
+    sent, then drops them, so a client that stopped reading can't keep the
+    connection open.
+    """
+
+    def __init__(
+        self,
+        websocket: AsyncWebSocketAdapter,
+        max_size: int,
+        coalesce_window: float = 0,
+        close_timeout: float = 5,
+    ) -> None:
+        super().__init__(websocket.view)
+        self.websocket = websocket
+        self.max_size = max_size
+        self.coalesce_window = coalesce_window
+        self.close_timeout = close_timeout
+        # Mutable `[key, data]` pairs, so queued messages can be replaced
+        self._queue: deque[list[Any]] = deque()
+        self._latest: dict[Hashable, list[Any]] = {}
+        self._has_messages = asyncio.Event()
+        self._has_room = asyncio.Event()
+        self._has_room.set()
+        self._flushed = asyncio.Event()
+        self._flushed.set()
+        self._error: Exception | None = None
+        self._writer: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def iter_json(
+        self, *, ignore_parsing_errors: bool = False
+    ) -> AsyncGenerator[object, None]:
+        return self.websocket.iter_json(ignore_parsing_errors=ignore_parsing_errors)
+
+    async def send_json(self, message: Mapping[str, object]) -> None:
+        await self.send_text(self.encode_json_text(message))
+
+    async def send_text(self, data: str) -> None:
+        while len(self._queue) >= self.max_size and self._error is None:
+            self._has_room.clear()
+            await self._has_room.wait()
+
+        self._put(None, data)
+
+    async def send_latest(self, key: Hashable, data: str) -> None:
+        if (message := self._latest.get(key)) is not None:
+            message[1] = data
+            return
+
+        self._put(key, data)
+
+    async def close(self, code: int, reason: str) -> None:
+        # Messages sent before closing still reach the client, unless it
+        # doesn't read them in time
+        try:
+            await asyncio.wait_for(self._flushed.wait(), self.close_timeout)
+        except asyncio.TimeoutError:
+            await self.aclose()
+
+        await self.websocket.close(code, reason)
+
+    async def aclose(self) -> None:
+        """Stop the writer task, dropping the messages not sent yet."""
+        if self._writer:
+            self._writer.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await self._writer
+
+    def _put(self, key: Hashable, data: str) -> None:
+        if self._error is not None:
+            raise WebSocketDisconnected from self._error
+
+        message = [key, data]
+        self._queue.append(message)
+
+        if key is not None:
+            self._latest[key] = message
+
+        self._flushed.clear()
+        self._has_messages.set()
+
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write())
+
+    async def _write(self) -> None:
+        try:
+            while True:
+                await self._has_messages.wait()
+
+                if self.coalesce_window:
+                    await asyncio.sleep(self.coalesce_window)
+
+                messages = list(self._queue)
+                self._queue.clear()
+                self._latest.clear()
+                self._has_messages.clear()
+                self._has_room.set()
+
+                for _, data in messages:
+                    await self.websocket.send_text(data)
+
+                if not self._queue:
+                    self._flushed.set()
+        except Exception as error:  # noqa: BLE001
+            # Raised to the senders, usually `WebSocketDisconnected`
+            self._error = error
+            self._has_room.set()
+            self._flushed.set()
+
 
 class AsyncBaseHTTPView(
     abc.ABC,
@@ -96,6 +259,12 @@ class AsyncBaseHTTPView(
     keep_alive_interval: float | None = None
     connection_init_wait_timeout: timedelta = timedelta(minutes=1)
     max_subscriptions_per_connection: int | None = 100
+    # Send websocket messages from a bounded queue per connection
+    websocket_send_queue_size: int | None = None
+    websocket_coalesce_window: float = 0
+    websocket_close_timeout: float = 5
+    # Limit the queries and mutations executing at once per connection
+    max_concurrent_executions_per_connection: int | None = None
     protocols: Sequence[str] = (
         GRAPHQL_TRANSPORT_WS_PROTOCOL,
         GRAPHQL_WS_PROTOCOL,
@@ -116,6 +285,20 @@ class AsyncBaseHTTPView(
         BaseGraphQLWSHandler[Context, RootValue]
     )
     multipart_transport_class: type[MultipartTransport] = MultipartTransport
+    stream_json_responses: bool = False
+    json_stream_chunk_size: int = JSON_STREAM_CHUNK_SIZE
+
+    @cached_property
+    def websocket_payload_cache(self) -> EncodedPayloadCache:
+        return EncodedPayloadCache(self._encode_json_text)
+
+    def _encode_json_text(self, data: object) -> str:
+        encoded_data = self.encode_json(data)
+
+        if isinstance(encoded_data, bytes):
+            return encoded_data.decode()
+
+        return encoded_data
 
     @property
     @abc.abstractmethod
@@ -149,7 +332,7 @@ class AsyncBaseHTTPView(
     async def create_streaming_response(
         self,
         request: Request,
-        stream: Callable[[], AsyncGenerator[str, None]],
+        stream: Callable[[], AsyncGenerator[bytes, None]],
         sub_response: SubResponse,
         headers: Mapping[str, str],
     ) -> Response:
@@ -328,7 +511,17 @@ class AsyncBaseHTTPView(
             websocket_response = await self.create_websocket_response(
                 request, websocket_subprotocol
             )
-            websocket = self.websocket_adapter_class(self, request, websocket_response)
+            websocket: AsyncWebSocketAdapter = self.websocket_adapter_class(
+                self, request, websocket_response
+            )
+
+            if self.websocket_send_queue_size is not None:
+                websocket = BufferedWebSocketAdapter(
+                    websocket,
+                    max_size=self.websocket_send_queue_size,
+                    coalesce_window=self.websocket_coalesce_window,
+                    close_timeout=self.websocket_close_timeout,
+                )
 
             context = (
                 await self.get_context(request, response=websocket_response)
@@ -336,29 +529,33 @@ class AsyncBaseHTTPView(
                 else context
             )
 
-            if websocket_subprotocol == GRAPHQL_TRANSPORT_WS_PROTOCOL:
-                await self.graphql_transport_ws_handler_class(
-                    view=self,
-                    websocket=websocket,
-                    context=context,
-                    root_value=root_value,
-                    schema=self.schema,
-                    connection_init_wait_timeout=self.connection_init_wait_timeout,
-                    max_subscriptions_per_connection=self.max_subscriptions_per_connection,
-                ).handle()
-            elif websocket_subprotocol == GRAPHQL_WS_PROTOCOL:
-                await self.graphql_ws_handler_class(
-                    view=self,
-                    websocket=websocket,
-                    context=context,
-                    root_value=root_value,
-                    schema=self.schema,
-                    keep_alive=self.keep_alive,
-                    keep_alive_interval=self.keep_alive_interval,
-                    max_subscriptions_per_connection=self.max_subscriptions_per_connection,
-                ).handle()
-            else:
-                await websocket.close(4406, "Subprotocol not acceptable")
+            try:
+                if websocket_subprotocol == GRAPHQL_TRANSPORT_WS_PROTOCOL:
+                    await self.graphql_transport_ws_handler_class(
+                        view=self,
+                        websocket=websocket,
+                        context=context,
+                        root_value=root_value,
+                        schema=self.schema,
+                        connection_init_wait_timeout=self.connection_init_wait_timeout,
+                        max_subscriptions_per_connection=self.max_subscriptions_per_connection,
+                    ).handle()
+                elif websocket_subprotocol == GRAPHQL_WS_PROTOCOL:
+                    await self.graphql_ws_handler_class(
+                        view=self,
+                        websocket=websocket,
+                        context=context,
+                        root_value=root_value,
+                        schema=self.schema,
+                        keep_alive=self.keep_alive,
+                        keep_alive_interval=self.keep_alive_interval,
+                        max_subscriptions_per_connection=self.max_subscriptions_per_connection,
+                    ).handle()
+                else:
+                    await websocket.close(4406, "Subprotocol not acceptable")
+            finally:
+                if isinstance(websocket, BufferedWebSocketAdapter):
+                    await websocket.aclose()
 
             return websocket_response
         request = cast("Request", request)
@@ -424,7 +621,7 @@ class AsyncBaseHTTPView(
 
             return await self.create_streaming_response(
                 request,
-                multipart_transport.stream(data, self.encode_json_string),
+                multipart_transport.stream(data, self.encode_json),
                 sub_response,
                 headers=multipart_transport.headers,
             )
@@ -446,11 +643,33 @@ class AsyncBaseHTTPView(
             if result.errors:
                 self._handle_errors(result.errors, response_data)
 
+        if self.stream_json_responses:
+            return await self.create_streaming_response(
+                request,
+                stream_json(
+                    response_data, self.encode_json, self.json_stream_chunk_size
+                ),
+                sub_response,
+                headers={"Content-Type": "application/json"},
+            )
+
         return self.create_response(
             response_data=response_data, sub_response=sub_response
         )
 
     def encode_json_string(self, data: object) -> str:
+        """Encode `data` with `encode_json`, decoding bytes to a string.
+
+        Deprecated, streaming responses are now built from the bytes or
+        strings returned by `encode_json`.
+        """
+        warnings.warn(
+            "`encode_json_string` is deprecated and will be removed in a future "
+            "release, use `encode_json` instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
         encoded_data = self.encode_json(data)
 
         if isinstance(encoded_data, bytes):
@@ -481,21 +700,21 @@ class AsyncBaseHTTPView(
         request: Request,
         result: SubscriptionExecutionResult,
         transport: HTTPStreamTransport,
-    ) -> AsyncTextStream:
-        async def stream() -> AsyncGenerator[str, None]:
+    ) -> AsyncByteStream:
+        async def stream() -> AsyncGenerator[bytes, None]:
             all_pending: list[Any] = []
 
             async for value in result:
                 response, all_pending = await self._process_stream_result(
                     request, value, all_pending
                 )
-                yield transport.encode_next(response, self.encode_json_string)
+                yield transport.encode_next(response, self.encode_json)
 
             yield transport.encode_complete()
 
         return merge_stream_with_heartbeat(
             stream,
-            lambda: transport.heartbeat_message(self.encode_json_string),
+            lambda: transport.heartbeat_message(self.encode_json),
             interval=transport.heartbeat_interval,
             send_initial_heartbeat=transport.send_initial_heartbeat,
         )
@@ -620,6 +839,16 @@ class AsyncBaseHTTPView(
                 "The GraphQL operation's `extensions` must be an object or null, if provided.",
             )
 
+        persisted_query = get_persisted_query(extensions)
+        if persisted_query is not None and not is_valid_persisted_query(
+            persisted_query
+        ):
+            raise HTTPException(
+                400,
+                "The GraphQL operation's `persistedQuery` extension must be an object "
+                "with a `version` of 1 and a `sha256Hash` string.",
+            )
+
         return GraphQLRequestData(
             query=query,
             variables=variables,
@@ -638,5 +867,15 @@ class AsyncBaseHTTPView(
     ) -> UnsetType | None | dict[str, object]:
         return UNSET
 
+    async def get_ws_operation_weight(
+        self, context: Context, operation_name: str | None
+    ) -> float:
+        return 1.0
+
+    async def on_ws_operation_complete(
+        self, context: Context, metrics: OperationMetrics
+    ) -> None:
+        return None
+
 
 __all__ = ["AsyncBaseHTTPView"]
@@ -7,6 +7,7 @@ from typing_extensions import Protocol
 from cross_web import HTTPException
 
 from strawberry.http import GraphQLRequestData, GraphQLRequestProtocol
+from strawberry.http.codecs import JSONCodec
 from strawberry.http.ides import GraphQL_IDE, get_graphql_ide_html
 from strawberry.http.types import HTTPMethod, QueryParams
 from strawberry.schema.base import BaseSchema
@@ -32,6 +33,7 @@ class BaseRequestProtocol(Protocol):
 
 class BaseView(Generic[Request]):
     graphql_ide: GraphQL_IDE | None
+    json_codec: JSONCodec = JSONCodec()
     multipart_uploads_enabled: bool = False
     protocols: Sequence[str] = ()
     schema: BaseSchema
@@ -44,6 +46,8 @@ class BaseView(Generic[Request]):
         return (
             request.method == "GET"
             and request.query_params.get("query") is None
+            # Persisted queries only send the document id in the extensions
+            and request.query_params.get("extensions") is None
             and any(
                 supported_header in request.headers.get("accept", "")
                 for supported_header in ("text/html", "*/*")
@@ -60,10 +64,10 @@ class BaseView(Generic[Request]):
             raise HTTPException(400, "Unable to parse request body as JSON") from e
 
     def decode_json(self, data: str | bytes) -> object:
-        return json.loads(data)
+        return self.json_codec.decode(data)
 
     def encode_json(self, data: object) -> str | bytes:
-        return json.dumps(data)
+        return self.json_codec.encode(data)
 
     def parse_query_params(self, params: QueryParams) -> dict[str, Any]:
         params = dict(params)
@@ -0,0 +1,100 @@
+"""JSON codecs used by the HTTP views to decode requests and encode responses.
+
+Views decode request bodies and encode responses through their `json_codec`.
+The default codec uses the standard library, `OrjsonCodec` and `MsgspecCodec`
+use faster libraries that decode straight from the request bytes and encode
+straight to the response bytes:
+
+```python
+from strawberry.asgi import GraphQL
+from strawberry.http.codecs import OrjsonCodec
+
+
+class MyGraphQL(GraphQL):
+    json_codec = OrjsonCodec()
+```
+
+Codecs must raise `json.JSONDecodeError` (or a subclass) for invalid JSON, so
+that views can answer with a 400 error whatever the codec.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+class JSONCodec:
+    """Encode and decode JSON with the standard library's `json` module.
+
+    This is the default codec of the views, and the base class of all codecs.
+    """
+
+    def __init__(self, encoder: type[json.JSONEncoder] | None = None) -> None:
+        """Initialize the JSONCodec.
+
+        Args:
+            encoder: The `json.JSONEncoder` subclass used to encode responses.
+        """
+        self.encoder = encoder
+
+    def decode(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def encode(self, data: object) -> str | bytes:
+        return json.dumps(data, cls=self.encoder)
+
+
+class OrjsonCodec(JSONCodec):
+    """Encode and decode JSON with [orjson](https://github.com/ijl/orjson).
+
+    Requires the `orjson` extra: `pip install 'strawberry-graphql[orjson]'`.
+    """
+
+    def __init__(self, option: int | None = None) -> None:
+        """Initialize the OrjsonCodec.
+
+        Args:
+            option: Options passed to `orjson.dumps`, for example
+                `orjson.OPT_NON_STR_KEYS`.
+        """
+        import orjson
+
+        super().__init__()
+        self.option = option
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+
+    def decode(self, data: str | bytes) -> Any:
+        # `orjson.JSONDecodeError` is a subclass of `json.JSONDecodeError`
+        return self._loads(data)
+
+    def encode(self, data: object) -> bytes:
+        return self._dumps(data, option=self.option)
+
+
+class MsgspecCodec(JSONCodec):
+    """Encode and decode JSON with [msgspec](https://jcristharif.com/msgspec/).
+
+    Requires the `msgspec` extra: `pip install 'strawberry-graphql[msgspec]'`.
+    """
+
+    def __init__(self) -> None:
+        import msgspec
+
+        super().__init__()
+        self._decode_error = msgspec.DecodeError
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def decode(self, data: str | bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+    def encode(self, data: object) -> bytes:
+        return self._encoder.encode(data)
+
+
+__all__ = ["JSONCodec", "MsgspecCodec", "OrjsonCodec"]
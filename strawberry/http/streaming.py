@@ -3,7 +3,7 @@ from __future__ import annotations
 import abc
 import asyncio
 import contextlib
-from collections.abc import AsyncGenerator, Callable, Iterable, Mapping
+from collections.abc import AsyncGenerator, Callable, Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from strawberry.types.graphql import OperationType
@@ -13,15 +13,20 @@ if TYPE_CHECKING:
 
 from .parse_content_type import parse_content_type
 
-AsyncTextStream = Callable[[], AsyncGenerator[str, None]]
-JSONEncoder = Callable[[object], str]
+AsyncByteStream = Callable[[], AsyncGenerator[bytes, None]]
+JSONEncoder = Callable[[object], str | bytes]
 
 MULTIPART_SUBSCRIPTION_BOUNDARY = "graphql"
 MULTIPART_SUBSCRIPTION_HEARTBEAT_INTERVAL = 5
 MULTIPART_INCREMENTAL_BOUNDARY = "-"
 SSE_HEARTBEAT_INTERVAL = 15
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
 MultipartDataStream = Callable[[], AsyncGenerator[object, None]]
-MultipartTextStream = Callable[[], AsyncGenerator[str, None]]
+MultipartByteStream = Callable[[], AsyncGenerator[bytes, None]]
+
+
+def _to_bytes(data: str | bytes) -> bytes:
+    return data.encode() if isinstance(data, str) else data
 
 
 def _multipart_subscription_content_type(separator: str) -> str:
@@ -43,29 +48,28 @@ class MultipartTransport:
 
     def stream(
         self, data: MultipartDataStream, encode_json: JSONEncoder
-    ) -> MultipartTextStream:
-        async def stream() -> AsyncGenerator[str, None]:
-            yield f"--{self.separator}"
+    ) -> MultipartByteStream:
+        async def stream() -> AsyncGenerator[bytes, None]:
+            yield f"--{self.separator}".encode()
 
             async for value in data():
                 yield self.encode_multipart_data(value, encode_json)
 
-            yield "--\r\n"
+            yield b"--\r\n"
 
         return stream
 
-    def encode_multipart_data(self, data: object, encode_json: JSONEncoder) -> str:
-        encoded_data = encode_json(data)
-        encoded_data_length = len(encoded_data.encode())
+    def encode_multipart_data(self, data: object, encode_json: JSONEncoder) -> bytes:
+        encoded_data = _to_bytes(encode_json(data))
 
-        return "".join(
+        return b"".join(
             [
-                "\r\n",
-                "Content-Type: application/json; charset=utf-8\r\n",
-                "Content-Length: " + str(encoded_data_length) + "\r\n",
-                "\r\n",
+                b"\r\n",
+                b"Content-Type: application/json; charset=utf-8\r\n",
+                b"Content-Length: %d\r\n" % len(encoded_data),
+                b"\r\n",
                 encoded_data,
-                f"\r\n--{self.separator}",
+                f"\r\n--{self.separator}".encode(),
             ]
         )
 
@@ -97,13 +101,13 @@ class HTTPStreamTransport(abc.ABC):
     @abc.abstractmethod
     def encode_next(
         self, response: GraphQLHTTPResponse, encode_json: JSONEncoder
-    ) -> str: ...
+    ) -> bytes: ...
 
     @abc.abstractmethod
-    def encode_complete(self) -> str: ...
+    def encode_complete(self) -> bytes: ...
 
     @abc.abstractmethod
-    def heartbeat_message(self, encode_json: JSONEncoder) -> str: ...
+    def heartbeat_message(self, encode_json: JSONEncoder) -> bytes: ...
 
 
 class MultipartSubscriptionTransport(MultipartTransport, HTTPStreamTransport):
@@ -146,13 +150,13 @@ class MultipartSubscriptionTransport(MultipartTransport, HTTPStreamTransport):
 
     def encode_next(
         self, response: GraphQLHTTPResponse, encode_json: JSONEncoder
-    ) -> str:
+    ) -> bytes:
         return self.encode_multipart_data({"payload": response}, encode_json)
 
-    def encode_complete(self) -> str:
-        return f"\r\n--{self.separator}--\r\n"
+    def encode_complete(self) -> bytes:
+        return f"\r\n--{self.separator}--\r\n".encode()
 
-    def heartbeat_message(self, encode_json: JSONEncoder) -> str:
+    def heartbeat_message(self, encode_json: JSONEncoder) -> bytes:
         return self.encode_multipart_data({}, encode_json)
 
 
@@ -182,39 +186,97 @@ class SSETransport(HTTPStreamTransport):
 
     def encode_next(
         self, response: GraphQLHTTPResponse, encode_json: JSONEncoder
-    ) -> str:
-        return self.encode_event("next", encode_json(response))
+    ) -> bytes:
+        return self.encode_event("next", _to_bytes(encode_json(response)))
 
-    def encode_complete(self) -> str:
+    def encode_complete(self) -> bytes:
         return self.encode_event("complete")
 
-    def heartbeat_message(self, encode_json: JSONEncoder) -> str:
+    def heartbeat_message(self, encode_json: JSONEncoder) -> bytes:
         return self.encode_comment("ping")
 
-    def encode_event(self, event: str, data: str | None = None) -> str:
+    def encode_event(self, event: str, data: bytes | None = None) -> bytes:
         """Encode one SSE event from already-encoded ``data``.
 
         ``data`` must be a single line: SSE cannot carry a value with newlines in
         one field, so a multi-line ``encode_json`` output is rejected rather than
         silently reframed.
         """
-        if data and ("\r" in data or "\n" in data):
+        if data and (b"\r" in data or b"\n" in data):
             raise ValueError("SSE event data must not contain newlines")
 
         # Browsers discard SSE events without a data field, so always send one.
-        return f"event: {event}\r\ndata: {data or ''}\r\n\r\n"
+        return b"event: %s\r\ndata: %s\r\n\r\n" % (event.encode(), data or b"")
+
+    def encode_comment(self, comment: str) -> bytes:
+        return f": {comment}\r\n\r\n".encode()
+
+
+def _iter_json_parts(value: object, encode_json: JSONEncoder) -> Iterator[bytes]:
+    # Objects are split into their members and lists into their elements, the
+    # elements themselves are encoded in one go unless they are lists. Objects
+    # with keys that aren't strings are encoded in one go too, so that their
+    # keys are converted by the codec, like in unstreamed responses.
+    if isinstance(value, dict) and all(type(key) is str for key in value):
+        yield b"{"
+
+        for index, (key, item) in enumerate(value.items()):
+            yield (b"," if index else b"") + _to_bytes(encode_json(key)) + b":"
+            yield from _iter_json_parts(item, encode_json)
+
+        yield b"}"
+    elif isinstance(value, list):
+        yield b"["
+
+        for index, item in enumerate(value):
+            if index:
+                yield b","
+
+            if isinstance(item, list):
+                yield from _iter_json_parts(item, encode_json)
+            else:
+                yield _to_bytes(encode_json(item))
+
+        yield b"]"
+    else:
+        yield _to_bytes(encode_json(value))
+
+
+def stream_json(
+    data: object,
+    encode_json: JSONEncoder,
+    chunk_size: int = JSON_STREAM_CHUNK_SIZE,
+) -> AsyncByteStream:
+    """Encode ``data`` as a stream of JSON chunks of about ``chunk_size`` bytes.
+
+    Only one list element at a time is encoded, so the encoded document is
+    never held in memory in full, and the first chunk can be sent before the
+    whole document is encoded.
+    """
+
+    async def stream() -> AsyncGenerator[bytes, None]:
+        buffer = bytearray()
+
+        for part in _iter_json_parts(data, encode_json):
+            buffer += part
+
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+        if buffer:
+            yield bytes(buffer)
 
-    def encode_comment(self, comment: str) -> str:
-        return f": {comment}\r\n\r\n"
+    return stream
 
 
 def merge_stream_with_heartbeat(
-    stream: AsyncTextStream,
-    heartbeat_message: Callable[[], str],
+    stream: AsyncByteStream,
+    heartbeat_message: Callable[[], bytes],
     interval: float,
     *,
     send_initial_heartbeat: bool,
-) -> AsyncTextStream:
+) -> AsyncByteStream:
     """Add heartbeat messages to a stream to prevent connection timeouts.
 
     The source stream and heartbeat producer coordinate through a size-1 queue.
@@ -224,7 +286,7 @@ def merge_stream_with_heartbeat(
     chunk.
     """
 
-    async def merged() -> AsyncGenerator[str, None]:
+    async def merged() -> AsyncGenerator[bytes, None]:
         queue: asyncio.Queue[tuple[bool, bool, Any]] = asyncio.Queue(maxsize=1)
         cancelling = False
 
@@ -283,10 +345,11 @@ def merge_stream_with_heartbeat(
 
 
 __all__ = [
-    "AsyncTextStream",
+    "AsyncByteStream",
     "HTTPStreamTransport",
     "MultipartSubscriptionTransport",
     "MultipartTransport",
     "SSETransport",
     "merge_stream_with_heartbeat",
+    "stream_json",
 ]
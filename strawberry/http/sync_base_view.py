@@ -14,6 +14,10 @@ from strawberry.http import (
     process_result,
 )
 from strawberry.http.ides import GraphQL_IDE
+from strawberry.persisted_documents import (
+    get_persisted_query,
+    is_valid_persisted_query,
+)
 from strawberry.schema import BaseSchema
 from strawberry.schema.exceptions import (
     CannotGetOperationTypeError,
@@ -215,6 +219,16 @@ class SyncBaseHTTPView(
                 "The GraphQL operation's `extensions` must be an object or null, if provided.",
             )
 
+        persisted_query = get_persisted_query(extensions)
+        if persisted_query is not None and not is_valid_persisted_query(
+            persisted_query
+        ):
+            raise HTTPException(
+                400,
+                "The GraphQL operation's `persistedQuery` extension must be an object "
+                "with a `version` of 1 and a `sha256Hash` string.",
+            )
+
         return GraphQLRequestData(
             query=query,
             variables=variables,
@@ -0,0 +1,73 @@
+"""Encoding of the result frames sent over WebSockets.
+
+Subscriptions send one `next` (or `data`) message per event and operation.
+The payload of these messages only depends on the result, so it is encoded
+once per result and spliced into the frame of every operation sending it,
+for example when identical subscriptions share one stream.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from strawberry.http import process_result
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from strawberry.types.execution import ExecutionResult
+
+
+class EncodedPayloadCache:
+    """Encoded payloads of the most recently sent results.
+
+    Results are looked up by identity, the cache keeps them alive so that
+    their ids can't be reused by other results. This means that up to
+    `maxsize` results, with their data and encoded payload, stay in memory
+    after they were sent. Payloads longer than `max_payload_size` characters
+    are not cached, so that large results are freed as soon as they are sent.
+    """
+
+    def __init__(
+        self,
+        encode_json: Callable[[object], str],
+        maxsize: int = 128,
+        max_payload_size: int = 64 * 1024,
+    ) -> None:
+        self.encode_json = encode_json
+        self.maxsize = maxsize
+        self.max_payload_size = max_payload_size
+        self._payloads: OrderedDict[int, tuple[ExecutionResult, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def encode(self, result: ExecutionResult) -> str:
+        key = id(result)
+        cached = self._payloads.get(key)
+
+        if cached is not None and cached[0] is result:
+            self._payloads.move_to_end(key)
+            return cached[1]
+
+        payload = self.encode_json(process_result(result))
+
+        if len(payload) > self.max_payload_size:
+            return payload
+
+        self._payloads[key] = (result, payload)
+
+        if len(self._payloads) > self.maxsize:
+            self._payloads.popitem(last=False)
+
+        return payload
+
+
+def encode_message_frame(type_: str, id: str, payload: str) -> str:
+    """Build the frame of a message from its already encoded payload."""
+    return f'{{"type":"{type_}","id":{json.dumps(id)},"payload":{payload}}}'
+
+
+__all__ = ["EncodedPayloadCache", "encode_message_frame"]
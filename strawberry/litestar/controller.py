@@ -181,8 +181,11 @@ class LitestarWebSocketAdapter(AsyncWebSocketAdapter):
             pass
 
     async def send_json(self, message: Mapping[str, object]) -> None:
+        await self.send_text(self.encode_json_text(message))
+
+    async def send_text(self, data: str) -> None:
         try:
-            await self.ws.send_data(data=self.view.encode_json(message))
+            await self.ws.send_data(data=data)
         except WebSocketDisconnect as exc:
             raise WebSocketDisconnected from exc
 
@@ -293,7 +296,7 @@ class GraphQLController(
     async def create_streaming_response(
         self,
         request: Request,
-        stream: Callable[[], AsyncIterator[str]],
+        stream: Callable[[], AsyncIterator[bytes]],
         sub_response: Response,
         headers: Mapping[str, str],
     ) -> Response:
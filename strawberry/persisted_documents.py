@@ -0,0 +1,264 @@
+"""Persisted documents support, also known as persisted queries.
+
+Clients can send the hash of a document instead of its full text using the
+`persistedQuery` extension popularized by Apollo (APQ):
+
+```json
+{"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "..."}}}
+```
+
+The schema looks the document up in a `PersistedDocumentStore` and keeps the
+parsed and validated document in memory, so following requests for the same
+hash skip lexing, parsing and validation entirely.
+"""
+
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from graphql import GraphQLError
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Mapping
+
+    from graphql.language import DocumentNode
+    from graphql.validation import ASTValidationRule
+
+
+SUPPORTED_PERSISTED_QUERY_VERSION = 1
+
+
+class PersistedQueryNotFoundError(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__(
+            "PersistedQueryNotFound",
+            extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+        )
+
+
+class PersistedQueryNotSupportedError(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__(
+            "PersistedQueryNotSupported",
+            extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+        )
+
+
+class PersistedQueryRequiredError(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__(
+            "Only persisted documents can be executed, "
+            "please send the document id in the `persistedQuery` extension",
+            extensions={"code": "PERSISTED_QUERY_ID_REQUIRED"},
+        )
+
+
+class PersistedQueryHashMismatchError(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__(
+            "provided sha does not match query",
+            extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+        )
+
+
+def compute_document_id(query: str) -> str:
+    """Return the id of a document, the hex encoded SHA-256 hash of its text."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def get_persisted_query(
+    extensions: Mapping[str, Any] | None,
+) -> Mapping[str, Any] | None:
+    """Return the `persistedQuery` extension of an operation, if any."""
+    if not extensions:
+        return None
+
+    return extensions.get("persistedQuery")
+
+
+def is_valid_persisted_query(persisted_query: object) -> bool:
+    """Check that a `persistedQuery` extension has the expected shape."""
+    if not isinstance(persisted_query, dict):
+        return False
+
+    if persisted_query.get("version") != SUPPORTED_PERSISTED_QUERY_VERSION:
+        return False
+
+    return isinstance(persisted_query.get("sha256Hash"), str)
+
+
+class PersistedDocumentStore(abc.ABC):
+    """Base class for the stores of persisted documents.
+
+    Stores map document ids to the text of the documents. Parsing and
+    validation results are cached by the schema, so stores are only hit
+    the first time a process sees a document.
+
+    Subclass it to plug in your own backend:
+
+    ```python
+    from strawberry.persisted_documents import PersistedDocumentStore
+
+
+    class RedisDocumentStore(PersistedDocumentStore):
+        def __init__(self, redis):
+            self.redis = redis
+
+        def get(self, document_id: str) -> str | None:
+            query = self.redis.get(f"persisted-document:{document_id}")
+            return query.decode() if query is not None else None
+
+        def set(self, document_id: str, query: str) -> None:
+            self.redis.set(f"persisted-document:{document_id}", query)
+    ```
+    """
+
+    @abc.abstractmethod
+    def get(self, document_id: str) -> str | None:
+        """Return the text of the document with the given id, if known."""
+
+    def set(self, document_id: str, query: str) -> None:  # noqa: B027
+        """Register a document sent by a client.
+
+        Read-only stores, like manifests of trusted documents, ignore
+        registrations.
+        """
+
+
+class InMemoryDocumentStore(PersistedDocumentStore):
+    """Store documents in memory, evicting the least recently used ones.
+
+    ```python
+    from strawberry.persisted_documents import InMemoryDocumentStore
+
+    store = InMemoryDocumentStore(maxsize=1000)
+    ```
+    """
+
+    def __init__(
+        self,
+        documents: Mapping[str, str] | None = None,
+        maxsize: int | None = 1000,
+    ) -> None:
+        """Initialize the InMemoryDocumentStore.
+
+        Args:
+            documents: Documents to preload, keyed by their id.
+            maxsize: The maximum number of documents to keep. If `maxsize` is
+                `None` the store will grow without bound.
+        """
+        self.maxsize = maxsize
+        self._documents: OrderedDict[str, str] = OrderedDict(documents or {})
+
+    def get(self, document_id: str) -> str | None:
+        query = self._documents.get(document_id)
+
+        if query is not None:
+            self._documents.move_to_end(document_id)
+
+        return query
+
+    def set(self, document_id: str, query: str) -> None:
+        self._documents[document_id] = query
+        self._documents.move_to_end(document_id)
+
+        if self.maxsize is not None and len(self._documents) > self.maxsize:
+            self._documents.popitem(last=False)
+
+
+class ManifestDocumentStore(PersistedDocumentStore):
+    """Read-only store backed by a JSON manifest of trusted documents.
+
+    Both the Apollo persisted query manifest format and plain JSON objects
+    mapping document ids to document texts (as generated by Relay or GraphQL
+    Code Generator) are supported.
+
+    ```python
+    from strawberry.persisted_documents import ManifestDocumentStore
+
+    store = ManifestDocumentStore("persisted-documents.json")
+    ```
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+
+        if isinstance(manifest, dict) and "operations" in manifest:
+            self._documents = {
+                operation["id"]: operation["body"]
+                for operation in manifest["operations"]
+            }
+        else:
+            self._documents = dict(manifest)
+
+    def get(self, document_id: str) -> str | None:
+        return self._documents.get(document_id)
+
+
+@dataclass
+class PersistedDocumentsConfig:
+    """Configuration for persisted documents.
+
+    Attributes:
+        store: Where documents are looked up and registered.
+        trusted_documents_only: Only execute documents found in the store,
+            rejecting documents sent as text and never registering new ones.
+        max_cached_documents: How many parsed and validated documents the
+            schema keeps in memory. If `None` the cache will grow without bound.
+    """
+
+    store: PersistedDocumentStore = field(default_factory=InMemoryDocumentStore)
+    trusted_documents_only: bool = False
+    max_cached_documents: int | None = 1000
+
+
+class ValidatedDocument(NamedTuple):
+    query: str
+    document: DocumentNode
+    validation_rules: tuple[type[ASTValidationRule], ...]
+
+
+class ValidatedDocumentCache:
+    """LRU cache of the persisted documents that passed validation.
+
+    Validation depends on the schema, so each schema owns its own cache.
+    """
+
+    def __init__(self, maxsize: int | None) -> None:
+        self.maxsize = maxsize
+        self._documents: OrderedDict[str, ValidatedDocument] = OrderedDict()
+
+    def get(self, document_id: str) -> ValidatedDocument | None:
+        validated_document = self._documents.get(document_id)
+
+        if validated_document is not None:
+            self._documents.move_to_end(document_id)
+
+        return validated_document
+
+    def set(self, document_id: str, validated_document: ValidatedDocument) -> None:
+        self._documents[document_id] = validated_document
+        self._documents.move_to_end(document_id)
+
+        if self.maxsize is not None and len(self._documents) > self.maxsize:
+            self._documents.popitem(last=False)
+
+
+__all__ = [
+    "InMemoryDocumentStore",
+    "ManifestDocumentStore",
+    "PersistedDocumentStore",
+    "PersistedDocumentsConfig",
+    "PersistedQueryHashMismatchError",
+    "PersistedQueryNotFoundError",
+    "PersistedQueryNotSupportedError",
+    "PersistedQueryRequiredError",
+    "compute_document_id",
+]
@@ -57,11 +57,13 @@ class QuartWebSocketAdapter(AsyncWebSocketAdapter):
             pass
 
     async def send_json(self, message: Mapping[str, object]) -> None:
+        await self.send_text(self.encode_json_text(message))
+
+    async def send_text(self, data: str) -> None:
         try:
             # Raises asyncio.CancelledError when the connection is closed.
             # https://quart.palletsprojects.com/en/latest/how_to_guides/websockets.html#detecting-disconnection
-            await self.ws.send(self.view.encode_json(message))  # type:ignore
-            # quart is misusing AnyStr, leading to type errors for unions, see https://github.com/pallets/quart/issues/451
+            await self.ws.send(data)
         except asyncio.CancelledError as exc:
             raise WebSocketDisconnected from exc
 
@@ -143,7 +145,7 @@ class GraphQLView(
     async def create_streaming_response(
         self,
         request: Request,
-        stream: Callable[[], AsyncGenerator[str, None]],
+        stream: Callable[[], AsyncGenerator[bytes, None]],
         sub_response: Response,
         headers: Mapping[str, str],
     ) -> Response:
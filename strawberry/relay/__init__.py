@@ -1,23 +1,75 @@
-from .fields import ConnectionExtension, NodeExtension, connection, node
-from .types import (
-    Connection,
-    Edge,
-    GlobalID,
-    GlobalIDValueError,
-    ListConnection,
-    Node,
-    NodeID,
-    NodeType,
-    PageInfo,
-)
-from .utils import from_base64, to_base64
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .fields import ConnectionExtension, NodeExtension, connection, node
+    from .types import (
+        Connection,
+        Edge,
+        GlobalID,
+        GlobalIDValueError,
+        KeysetConnection,
+        KeysetEdge,
+        KeysetSource,
+        ListConnection,
+        Node,
+        NodeID,
+        NodeType,
+        PageInfo,
+    )
+    from .utils import (
+        ConnectionSelection,
+        KeysetRequest,
+        from_base64,
+        get_connection_selection,
+        to_base64,
+    )
+else:
+    from strawberry._lazy_import import lazy_import
+
+    __getattr__, __dir__ = lazy_import(
+        __name__,
+        {
+            "Connection": ".types",
+            "ConnectionExtension": ".fields",
+            "ConnectionSelection": ".utils",
+            "Edge": ".types",
+            "GlobalID": ".types",
+            "GlobalIDValueError": ".types",
+            "KeysetConnection": ".types",
+            "KeysetEdge": ".types",
+            "KeysetRequest": ".utils",
+            "KeysetSource": ".types",
+            "ListConnection": ".types",
+            "Node": ".types",
+            "NodeExtension": ".fields",
+            "NodeID": ".types",
+            "NodeType": ".types",
+            "PageInfo": ".types",
+            "connection": ".fields",
+            "from_base64": ".utils",
+            "get_connection_selection": ".utils",
+            "node": ".fields",
+            "to_base64": ".utils",
+        },
+        submodules=(
+            "exceptions",
+            "fields",
+            "types",
+            "utils",
+        ),
+    )
 
 __all__ = [
     "Connection",
     "ConnectionExtension",
+    "ConnectionSelection",
     "Edge",
     "GlobalID",
     "GlobalIDValueError",
+    "KeysetConnection",
+    "KeysetEdge",
+    "KeysetRequest",
+    "KeysetSource",
     "ListConnection",
     "Node",
     "NodeExtension",
@@ -26,6 +78,7 @@ __all__ = [
     "PageInfo",
     "connection",
     "from_base64",
+    "get_connection_selection",
     "node",
     "to_base64",
 ]
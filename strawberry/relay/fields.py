@@ -45,7 +45,7 @@ from strawberry.types.unset import UNSET
 from strawberry.utils.aio import asyncgen_to_list
 from strawberry.utils.typing import eval_type, is_generic_alias, is_optional, is_union
 
-from .types import Connection, GlobalID, Node
+from .types import Connection, GlobalID, KeysetSource, Node
 
 if TYPE_CHECKING:
     from typing import Literal
@@ -137,14 +137,20 @@ class NodeExtension(FieldExtension):
             ],
         ) -> list[Node] | Awaitable[list[Node]]:
             nodes_map: defaultdict[type[Node], list[str]] = defaultdict(list)
-            # Store the index of the node in the list of nodes of the same type
+            # Store the index of each node in the list of nodes of the same type
             # so that we can return them in the same order while also supporting
             # different types
-            index_map: dict[GlobalID, tuple[type[Node], int]] = {}
+            positions: list[tuple[type[Node], int]] = []
+            # Each type name is only resolved once
+            node_types: dict[str, type[Node]] = {}
             for gid in ids:
-                node_t = gid.resolve_type(info)
-                nodes_map[node_t].append(gid.node_id)
-                index_map[gid] = (node_t, len(nodes_map[node_t]) - 1)
+                node_t = node_types.get(gid.type_name)
+                if node_t is None:
+                    node_t = node_types[gid.type_name] = gid.resolve_type(info)
+
+                node_ids = nodes_map[node_t]
+                positions.append((node_t, len(node_ids)))
+                node_ids.append(gid.node_id)
 
             resolved_nodes = {
                 node_t: node_t.resolve_nodes(
@@ -200,9 +206,7 @@ class NodeExtension(FieldExtension):
                         node_t: cast_nodes(node_t, nodes)
                         for node_t, nodes in resolved.items()
                     }
-                    return [
-                        resolved[index_map[gid][0]][index_map[gid][1]] for gid in ids
-                    ]
+                    return [resolved[node_t][index] for node_t, index in positions]
 
                 return resolve()
 
@@ -211,7 +215,7 @@ class NodeExtension(FieldExtension):
                 node_t: cast_nodes(node_t, cast("Iterable[Node]", nodes))
                 for node_t, nodes in resolved_nodes.items()
             }
-            return [resolved[index_map[gid][0]][index_map[gid][1]] for gid in ids]
+            return [resolved[node_t][index] for node_t, index in positions]
 
         return resolver
 
@@ -306,8 +310,17 @@ class ConnectionExtension(FieldExtension):
 
         origin = get_origin(resolver_type)
 
-        if origin is None or not issubclass(
-            origin, (Iterator, Iterable, AsyncIterator, AsyncIterable)
+        # Keyset connections are resolved from a source fetching their nodes
+        source_type = origin or resolver_type
+        is_keyset_source = isinstance(source_type, type) and issubclass(
+            source_type, KeysetSource
+        )
+
+        if not is_keyset_source and (
+            origin is None
+            or not issubclass(
+                origin, (Iterator, Iterable, AsyncIterator, AsyncIterable)
+            )
         ):
             raise RelayWrongResolverAnnotationError(field.name, field.base_resolver)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import binascii
 import dataclasses
 import inspect
 import itertools
@@ -20,6 +21,7 @@ from typing import (
     ForwardRef,
     Generic,
     Literal,
+    Protocol,
     TypeAlias,
     TypeVar,
     Union,
@@ -27,6 +29,7 @@ from typing import (
     get_args,
     get_origin,
     overload,
+    runtime_checkable,
 )
 from typing_extensions import Self
 
@@ -47,9 +50,11 @@ from strawberry.utils.inspect import in_async_context
 from strawberry.utils.typing import eval_type, is_classvar
 
 from .utils import (
+    KeysetRequest,
     SliceMetadata,
+    encode_keyset_key,
     from_base64,
-    should_resolve_list_connection_edges,
+    get_connection_selection,
     to_base64,
 )
 
@@ -57,14 +62,18 @@ if TYPE_CHECKING:
     from strawberry.scalars import ID
     from strawberry.utils.await_maybe import AwaitableOrValue
 
+    from .utils import ConnectionSelection
+
 _T = TypeVar("_T")
 
 NodeIterableType: TypeAlias = (
     Iterator[_T] | Iterable[_T] | AsyncIterator[_T] | AsyncIterable[_T]
 )
 NodeType = TypeVar("NodeType", bound="Node")
+_NodeType_co = TypeVar("_NodeType_co", covariant=True)
 
 PREFIX = "arrayconnection"
+KEYSET_PREFIX = "keyset"
 
 
 class GlobalIDValueError(ValueError):
@@ -133,6 +142,53 @@ class GlobalID:
 
         return cls(type_name=type_name, node_id=node_id)
 
+    @classmethod
+    def from_ids(cls, values: Iterable[str | ID]) -> list[Self]:
+        """Create new GlobalIDs from parsing all the given values.
+
+        Same as calling `from_id` for each value, but repeated values are only
+        parsed once.
+
+        Args:
+            values:
+                The values to be parsed, as base64 strings in the
+                "TypeName:NodeID" format
+
+        Returns:
+            A list of GlobalID instances, in the order of the values
+
+        Raises:
+            GlobalIDValueError:
+                If any of the values is not in a GlobalID format
+
+        """
+        parsed: dict[str, Self] = {}
+        global_ids: list[Self] = []
+        decode = binascii.a2b_base64
+
+        for value in values:
+            global_id = parsed.get(value)
+
+            if global_id is None:
+                try:
+                    type_name, separator, node_id = (
+                        decode(value).decode().partition(":")
+                    )
+                except (TypeError, ValueError):
+                    separator = ""
+
+                # Let `from_id` raise the error of invalid values
+                global_id = (
+                    cls(type_name=type_name, node_id=node_id)
+                    if separator
+                    else cls.from_id(value)
+                )
+                parsed[value] = global_id
+
+            global_ids.append(global_id)
+
+        return global_ids
+
     @overload
     async def resolve_node(
         self,
@@ -224,6 +280,10 @@ class GlobalID:
             The resolved GraphQL type for the execution info
 
         """
+        node_type = info.schema.get_node_type(self.type_name)
+        if node_type is not None:
+            return node_type
+
         type_def = info.schema.get_type_by_name(self.type_name)
         if not isinstance(type_def, StrawberryObjectDefinition):
             raise GlobalIDValueError(
@@ -383,19 +443,16 @@ class Node:
     @field(name="id", description="The Globally Unique ID of this object")
     @classmethod
     def _id(cls, root: Node, info: Info) -> GlobalID:
-        # NOTE: root might not be a Node instance when using integrations which
-        # return an object that is compatible with the type (e.g. the django one).
-        # In that case, we can retrieve the type itself from info
-        if isinstance(root, Node):
-            resolve_id = root.__class__.resolve_id
-            resolve_typename = root.__class__.resolve_typename
-        else:
-            parent_type = info._raw_info.parent_type
-            type_def = info.schema.get_type_by_name(parent_type.name)
-            assert isinstance(type_def, StrawberryObjectDefinition)
-            origin = cast("type[Node]", type_def.origin)
-            resolve_id = origin.resolve_id
-            resolve_typename = origin.resolve_typename
+        # The class resolving the id only depends on the class of root and the
+        # GraphQL type it is resolved as, so it is looked up once per pair
+        key = (root.__class__, info._raw_info.parent_type.name)
+        origin = info.schema._node_id_types.get(key)
+
+        if origin is None:
+            origin = info.schema._node_id_types[key] = cls._get_id_type(root, info)
+
+        resolve_id = origin.resolve_id
+        resolve_typename = origin.resolve_typename
 
         type_name = resolve_typename(root, info)
         assert isinstance(type_name, str)
@@ -417,6 +474,19 @@ class Node:
         # If node_id is not str, GlobalID will raise an error for us
         return GlobalID(type_name=type_name, node_id=str(node_id))
 
+    @classmethod
+    def _get_id_type(cls, root: Any, info: Info) -> type[Node]:
+        # NOTE: root might not be a Node instance when using integrations which
+        # return an object that is compatible with the type (e.g. the django one).
+        # In that case, we can retrieve the type itself from info
+        if isinstance(root, Node):
+            return root.__class__
+
+        parent_type = info._raw_info.parent_type
+        type_def = info.schema.get_type_by_name(parent_type.name)
+        assert isinstance(type_def, StrawberryObjectDefinition)
+        return cast("type[Node]", type_def.origin)
+
     @classmethod
     def resolve_id_attr(cls) -> str:
         if cls._id_attr is not None:
@@ -812,6 +882,18 @@ class ListConnection(Connection[NodeType]):
             prefix=edge_class.CURSOR_PREFIX,
         )
 
+        selection = get_connection_selection(info)
+        if not selection.resolve_edges:
+            return cls(
+                edges=[],
+                page_info=PageInfo(
+                    start_cursor=None,
+                    end_cursor=None,
+                    has_previous_page=False,
+                    has_next_page=False,
+                ),
+            )
+
         if isinstance(nodes, (AsyncIterator, AsyncIterable)) and in_async_context():
 
             async def resolver() -> Self:
@@ -837,7 +919,9 @@ class ListConnection(Connection[NodeType]):
                     if isinstance(iterator, (AsyncIterator, AsyncIterable)):
                         edges: list[Edge] = [
                             edge_class.resolve_edge(
-                                cls.resolve_node(v, info=info, **kwargs),
+                                cls.resolve_node(v, info=info, **kwargs)
+                                if selection.node
+                                else v,
                                 cursor=slice_metadata.start + i,
                             )
                             async for i, v in aenumerate(iterator)
@@ -845,7 +929,9 @@ class ListConnection(Connection[NodeType]):
                     else:
                         edges: list[Edge] = [  # type: ignore[no-redef]
                             edge_class.resolve_edge(
-                                cls.resolve_node(v, info=info, **kwargs),
+                                cls.resolve_node(v, info=info, **kwargs)
+                                if selection.node
+                                else v,
                                 cursor=slice_metadata.start + i,
                             )
                             for i, v in enumerate(iterator)
@@ -896,20 +982,9 @@ class ListConnection(Connection[NodeType]):
                 slice_metadata.overfetch,
             )
 
-        if not should_resolve_list_connection_edges(info):
-            return cls(
-                edges=[],
-                page_info=PageInfo(
-                    start_cursor=None,
-                    end_cursor=None,
-                    has_previous_page=False,
-                    has_next_page=False,
-                ),
-            )
-
         edges = [
             edge_class.resolve_edge(
-                cls.resolve_node(v, info=info, **kwargs),
+                cls.resolve_node(v, info=info, **kwargs) if selection.node else v,
                 cursor=slice_metadata.start + i,
             )
             for i, v in enumerate(iterator)
@@ -944,12 +1019,220 @@ class ListConnection(Connection[NodeType]):
         )
 
 
+@strawberry_type(description="An edge in a connection.")
+class KeysetEdge(Edge[NodeType]):
+    """An edge in a keyset connection.
+
+    Its cursor contains the sort key of the node.
+
+    Attributes:
+        cursor:
+            A cursor for use in pagination
+        node:
+            The item at the end of the edge
+    """
+
+    cursor: str = field(description="A cursor for use in pagination")
+    node: NodeType = field(description="The item at the end of the edge")
+
+    CURSOR_PREFIX: ClassVar[str] = KEYSET_PREFIX
+
+
+@runtime_checkable
+class KeysetSource(Protocol[_NodeType_co]):
+    """A source of nodes ordered by a unique sort key.
+
+    Resolvers of `KeysetConnection` fields return a keyset source instead of
+    the nodes themselves, so that only the requested page is fetched, for
+    example by filtering and limiting a database query on the sort key.
+    """
+
+    def get_key(self, node: Any) -> Sequence[Any]:
+        """Return the sort key of a node, as a sequence of JSON values."""
+        ...
+
+    def fetch(
+        self, request: KeysetRequest
+    ) -> AwaitableOrValue[Iterable[_NodeType_co]] | AsyncIterable[_NodeType_co]:
+        """Return the nodes of the requested page.
+
+        At most `request.limit` nodes whose sort key is between `request.after`
+        and `request.before` (both excluded) must be returned, by ascending sort
+        key when `request.direction` is `"forward"` and by descending sort key
+        when it is `"backward"`.
+        """
+        ...
+
+
+@strawberry_type(description="A connection to a list of items.")
+class KeysetConnection(Connection[NodeType]):
+    """A connection paginating nodes by their sort key.
+
+    Unlike `ListConnection`, which skips the nodes before the requested page,
+    the page is fetched from a `KeysetSource` using the sort key of the cursor,
+    so that the cost of fetching a page doesn't depend on its position.
+
+    Attributes:
+        page_info:
+            Pagination data for this connection
+        edges:
+            Contains the nodes in this connection
+
+    """
+
+    page_info: PageInfo = field(description="Pagination data for this connection")
+    edges: list[KeysetEdge[NodeType]] = field(  # type: ignore[assignment]
+        description="Contains the nodes in this connection"
+    )
+
+    @classmethod
+    def resolve_connection(
+        cls,
+        nodes: NodeIterableType[NodeType],
+        *,
+        info: Info,
+        before: str | None = None,
+        after: str | None = None,
+        first: int | None = None,
+        last: int | None = None,
+        max_results: int | None = None,
+        **kwargs: Any,
+    ) -> AwaitableOrValue[Self]:
+        """Resolve a connection from a keyset source.
+
+        Args:
+            info: The strawberry execution info resolve the type name from.
+            nodes: The `KeysetSource` to fetch the nodes from.
+            before: Returns the items in the list that come before the specified cursor.
+            after: Returns the items in the list that come after the specified cursor.
+            first: Returns the first n items from the list.
+            last: Returns the last n items from the list.
+            max_results: The maximum number of results to resolve.
+            kwargs: Additional arguments passed to the resolver.
+
+        Returns:
+            The resolved `Connection`
+
+        """
+        source = cast("Any", nodes)
+        if not isinstance(source, KeysetSource):
+            raise TypeError(
+                f"{cls.__name__} requires a KeysetSource, received {source!r}"
+            )
+
+        type_def = get_object_definition(cls)
+        assert type_def
+        field_def = type_def.get_field("edges")
+        assert field_def
+
+        field = field_def.resolve_type(type_definition=type_def)
+        while isinstance(field, StrawberryContainer):
+            field = field.of_type
+
+        edge_class = cast("type[Edge[NodeType]]", field)
+
+        request = KeysetRequest.from_arguments(
+            info,
+            before=before,
+            after=after,
+            first=first,
+            last=last,
+            max_results=max_results,
+            prefix=edge_class.CURSOR_PREFIX,
+        )
+
+        selection = get_connection_selection(info)
+        if not selection.resolve_edges:
+            return cls(
+                edges=[],
+                page_info=PageInfo(
+                    start_cursor=None,
+                    end_cursor=None,
+                    has_previous_page=False,
+                    has_next_page=False,
+                ),
+            )
+
+        fetched = source.fetch(request)
+        page_kwargs = {
+            "request": request,
+            "selection": selection,
+            "edge_class": edge_class,
+            "info": info,
+            **kwargs,
+        }
+
+        if inspect.isawaitable(fetched):
+
+            async def resolve_awaitable_page() -> Self:
+                return cls._resolve_page(source, await fetched, **page_kwargs)
+
+            return resolve_awaitable_page()
+
+        if isinstance(fetched, AsyncIterable):
+
+            async def resolve_async_page() -> Self:
+                nodes = [node async for node in fetched]
+                return cls._resolve_page(source, nodes, **page_kwargs)
+
+            return resolve_async_page()
+
+        return cls._resolve_page(source, fetched, **page_kwargs)
+
+    @classmethod
+    def _resolve_page(
+        cls,
+        source: KeysetSource[Any],
+        nodes: Iterable[Any],
+        *,
+        request: KeysetRequest,
+        selection: ConnectionSelection,
+        edge_class: type[Edge[NodeType]],
+        info: Info,
+        **kwargs: Any,
+    ) -> Self:
+        page = list(nodes)
+        has_more = len(page) > request.page_size
+        # Remove the overfetched result
+        page = page[: request.page_size]
+
+        if request.direction == "backward":
+            page.reverse()
+            has_previous_page = has_more
+            has_next_page = request.before is not None
+        else:
+            has_previous_page = request.after is not None
+            has_next_page = has_more
+
+        edges: list[Any] = [
+            edge_class.resolve_edge(
+                cls.resolve_node(node, info=info, **kwargs) if selection.node else node,
+                cursor=encode_keyset_key(source.get_key(node)),
+            )
+            for node in page
+        ]
+
+        return cls(
+            edges=edges,
+            page_info=PageInfo(
+                start_cursor=edges[0].cursor if edges else None,
+                end_cursor=edges[-1].cursor if edges else None,
+                has_previous_page=has_previous_page,
+                has_next_page=has_next_page,
+            ),
+        )
+
+
 __all__ = [
+    "KEYSET_PREFIX",
     "PREFIX",
     "Connection",
     "Edge",
     "GlobalID",
     "GlobalIDValueError",
+    "KeysetConnection",
+    "KeysetEdge",
+    "KeysetSource",
     "ListConnection",
     "Node",
     "NodeID",
@@ -2,15 +2,24 @@ from __future__ import annotations
 
 import base64
 import dataclasses
+import json
 import sys
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 from typing_extensions import Self, assert_never
+from weakref import WeakKeyDictionary
+
+from graphql import FieldNode, FragmentSpreadNode, InlineFragmentNode
 
 from strawberry.types.base import StrawberryObjectDefinition
-from strawberry.types.nodes import InlineFragment
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Sequence
+
+    from graphql import FragmentDefinitionNode
+
     import strawberry
+    from strawberry.schema import Schema
+    from strawberry.schema.name_converter import NameConverter
 
 
 def from_base64(value: str) -> tuple[str, str]:
@@ -71,6 +80,133 @@ def to_base64(type_: str | type | StrawberryObjectDefinition, node_id: Any) -> s
     return base64.b64encode(f"{type_name}:{node_id}".encode()).decode()
 
 
+def _collect_fields(
+    nodes: Iterable[FieldNode],
+    fragments: dict[str, FragmentDefinitionNode],
+) -> dict[str, list[FieldNode]]:
+    """Collect the subfields of the given nodes, merging their fragments.
+
+    `@skip` and `@include` are ignored, so fields are collected even if they
+    end up not being resolved.
+    """
+    fields: dict[str, list[FieldNode]] = {}
+    stack = [node.selection_set for node in nodes]
+
+    while stack:
+        selection_set = stack.pop()
+        if selection_set is None:
+            continue
+
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                fields.setdefault(selection.name.value, []).append(selection)
+            elif isinstance(selection, InlineFragmentNode):
+                stack.append(selection.selection_set)
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = fragments.get(selection.name.value)
+                if fragment is not None:
+                    stack.append(fragment.selection_set)
+
+    return fields
+
+
+@dataclasses.dataclass(frozen=True)
+class ConnectionSelection:
+    """The parts of a connection requested by the selection set of its field.
+
+    Attributes:
+        edges:
+            Whether the `edges` field is selected
+        node:
+            Whether the `node` field of the edges is selected
+        cursor:
+            Whether the `cursor` field of the edges is selected
+        page_info:
+            Whether the `pageInfo` field is selected
+        total_count:
+            Whether a `totalCount` field is selected
+    """
+
+    edges: bool = False
+    node: bool = False
+    cursor: bool = False
+    page_info: bool = False
+    total_count: bool = False
+
+    @property
+    def resolve_edges(self) -> bool:
+        """Whether the edges are needed for the edges or the page info."""
+        return self.edges or self.page_info
+
+    @classmethod
+    def from_field_nodes(
+        cls,
+        field_nodes: Iterable[FieldNode],
+        fragments: dict[str, FragmentDefinitionNode],
+        name_converter: NameConverter,
+    ) -> Self:
+        def name(python_name: str) -> str:
+            return name_converter.apply_naming_config(python_name)
+
+        fields = _collect_fields(field_nodes, fragments)
+        edge_fields = _collect_fields(fields.get(name("edges"), ()), fragments)
+
+        return cls(
+            edges=name("edges") in fields,
+            node=name("node") in edge_fields,
+            cursor=name("cursor") in edge_fields,
+            page_info=name("page_info") in fields,
+            total_count=name("total_count") in fields,
+        )
+
+
+# The first field node of a connection field keeps its selections in this
+# attribute, so they are dropped with the parsed document. They are stored by
+# schema, with weak keys so that parsed documents don't keep schemas alive.
+_SELECTIONS_ATTRIBUTE = "_strawberry_connection_selections"
+
+
+def get_connection_selection(info: strawberry.Info) -> ConnectionSelection:
+    """Get the parts of the connection requested by the current field.
+
+    The selection only depends on the parsed document, so it is computed once
+    per field node and reused by every connection resolved for it, including
+    across executions of documents kept by the `ParserCache` extension.
+
+    Args:
+        info:
+            The strawberry execution info of the connection field
+
+    Returns:
+        The `ConnectionSelection` of the connection field.
+    """
+    raw_info = info._raw_info
+    field_nodes = raw_info.field_nodes
+    schemas: WeakKeyDictionary[Schema, dict[Hashable, ConnectionSelection]] | None = (
+        getattr(field_nodes[0], _SELECTIONS_ATTRIBUTE, None)
+    )
+
+    if schemas is None:
+        schemas = WeakKeyDictionary()
+        setattr(field_nodes[0], _SELECTIONS_ATTRIBUTE, schemas)
+
+    schema = info.schema
+    selections = schemas.get(schema)
+
+    if selections is None:
+        selections = schemas[schema] = {}
+
+    key = tuple(map(id, field_nodes[1:]))
+    selection = selections.get(key)
+
+    if selection is None:
+        selection = selections[key] = ConnectionSelection.from_field_nodes(
+            field_nodes, raw_info.fragments, schema.config.name_converter
+        )
+
+    return selection
+
+
 def should_resolve_list_connection_edges(info: strawberry.Info) -> bool:
     """Check if the user requested to resolve the `edges` field of a connection.
 
@@ -82,21 +218,7 @@ def should_resolve_list_connection_edges(info: strawberry.Info) -> bool:
         True if the user requested to resolve the `edges` field of a connection, False otherwise.
 
     """
-    resolve_for_field_names = {"edges", "pageInfo"}
-    # Recursively inspect the selection to check if the user requested to resolve the `edges` field.
-    stack = []
-    for selection_field in info.selected_fields:
-        stack.extend(selection_field.selections)
-    while stack:
-        selection = stack.pop()
-        if (
-            not isinstance(selection, InlineFragment)
-            and selection.name in resolve_for_field_names
-        ):
-            return True
-        if nested_selections := getattr(selection, "selections", None):
-            stack.extend(nested_selections)
-    return False
+    return get_connection_selection(info).resolve_edges
 
 
 @dataclasses.dataclass
@@ -187,9 +309,132 @@ class SliceMetadata:
         )
 
 
+def _validate_page_size(name: str, value: int, max_results: int) -> None:
+    if value < 0:
+        raise ValueError(f"Argument '{name}' must be a non-negative integer.")
+
+    if value > max_results:
+        raise ValueError(f"Argument '{name}' cannot be higher than {max_results}.")
+
+
+def encode_keyset_key(key: Sequence[Any]) -> str:
+    """Encode the sort key of a node, to be used in its cursor.
+
+    Args:
+        key:
+            The sort key of the node, a sequence of JSON serializable values
+
+    Returns:
+        The key encoded as a JSON array.
+
+    """
+    return json.dumps(list(key), separators=(",", ":"))
+
+
+def decode_keyset_cursor(prefix: str, cursor: str) -> tuple[Any, ...]:
+    """Decode the sort key encoded in a cursor.
+
+    Raises:
+        ValueError:
+            If the cursor isn't valid or has another prefix
+        TypeError:
+            If the cursor doesn't contain a sort key
+
+    """
+    cursor_prefix, payload = from_base64(cursor)
+    if cursor_prefix != prefix:
+        raise ValueError(f"{cursor!r} is not a keyset cursor")
+
+    key = json.loads(payload)
+    if not isinstance(key, list):
+        raise TypeError(f"{cursor!r} is not a keyset cursor")
+
+    return tuple(key)
+
+
+@dataclasses.dataclass(frozen=True)
+class KeysetRequest:
+    """The page of nodes requested from a keyset source.
+
+    Attributes:
+        after:
+            Only nodes whose sort key is greater than this key are requested
+        before:
+            Only nodes whose sort key is lower than this key are requested
+        limit:
+            The maximum number of nodes to return. This is one more than the
+            size of the page, to know if there are more nodes after it.
+        direction:
+            `"forward"` when the nodes must be returned by ascending sort key,
+            `"backward"` when they must be returned by descending sort key,
+            so that the last nodes of the range are returned.
+    """
+
+    after: tuple[Any, ...] | None
+    before: tuple[Any, ...] | None
+    limit: int
+    direction: Literal["forward", "backward"]
+
+    @property
+    def page_size(self) -> int:
+        return self.limit - 1
+
+    @classmethod
+    def from_arguments(
+        cls,
+        info: strawberry.Info,
+        *,
+        before: str | None = None,
+        after: str | None = None,
+        first: int | None = None,
+        last: int | None = None,
+        max_results: int | None = None,
+        prefix: str,
+    ) -> Self:
+        """Get the keyset request to use on KeysetConnection."""
+        max_results = (
+            max_results
+            if max_results is not None
+            else info.schema.config.relay_max_results
+        )
+
+        if first is not None and last is not None:
+            raise ValueError("Arguments 'first' and 'last' can't be used together.")
+
+        try:
+            after_key = decode_keyset_cursor(prefix, after) if after else None
+        except (TypeError, ValueError):
+            raise TypeError("Argument 'after' contains a non-existing value.") from None
+
+        try:
+            before_key = decode_keyset_cursor(prefix, before) if before else None
+        except (TypeError, ValueError):
+            raise TypeError(
+                "Argument 'before' contains a non-existing value."
+            ) from None
+
+        if last is not None:
+            _validate_page_size("last", last, max_results)
+            # Overfetch by 1 to check if we have a previous result
+            return cls(after_key, before_key, last + 1, "backward")
+
+        if first is not None:
+            _validate_page_size("first", first, max_results)
+
+        # Overfetch by 1 to check if we have a next result
+        limit = (first if first is not None else max_results) + 1
+
+        return cls(after_key, before_key, limit, "forward")
+
+
 __all__ = [
+    "ConnectionSelection",
+    "KeysetRequest",
     "SliceMetadata",
+    "decode_keyset_cursor",
+    "encode_keyset_key",
     "from_base64",
+    "get_connection_selection",
     "should_resolve_list_connection_edges",
     "to_base64",
 ]
@@ -129,7 +129,7 @@ class GraphQLView(
     async def create_streaming_response(
         self,
         request: Request,
-        stream: Callable[[], AsyncGenerator[str, None]],
+        stream: Callable[[], AsyncGenerator[bytes, None]],
         sub_response: TemporalResponse,
         headers: Mapping[str, str],
     ) -> HTTPResponse:
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class SchemaBuildProfile:
+    """Time spent building a schema, per phase and per type.
+
+    A profile is collected when `StrawberryConfig.profile_schema_build` is
+    enabled, and is available as `Schema.build_profile` once the schema is
+    built.
+
+    Attributes:
+        phases: The seconds spent in each phase of the build, in order.
+        types: The seconds spent converting each type, by GraphQL name. This
+            doesn't include the time spent converting the types it references.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.schema.config import StrawberryConfig
+
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(profile_schema_build=True)
+    )
+
+    print(schema.build_profile.report())
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self.types: dict[str, float] = {}
+        # The time spent in the nested types of each type being converted
+        self._nested_times: list[float] = []
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - start
+
+    @contextmanager
+    def type(self, name: str) -> Iterator[None]:
+        self._nested_times.append(0.0)
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            nested_time = self._nested_times.pop()
+
+            self.types[name] = self.types.get(name, 0.0) + elapsed - nested_time
+
+            if self._nested_times:
+                self._nested_times[-1] += elapsed
+
+    def report(self, limit: int | None = 20) -> str:
+        """Format the profile as a table of the phases and the slowest types.
+
+        Args:
+            limit: The number of types to include, all of them if `None`.
+        """
+        lines = [f"Schema built in {self.total * 1000:.2f}ms", "", "Phases:"]
+        lines.extend(
+            f"  {duration * 1000:10.2f}ms  {name}"
+            for name, duration in self.phases.items()
+        )
+
+        types = sorted(self.types.items(), key=lambda item: item[1], reverse=True)
+
+        lines.extend(["", f"Types ({len(types)}):"])
+        lines.extend(
+            f"  {duration * 1000:10.2f}ms  {name}" for name, duration in types[:limit]
+        )
+
+        return "\n".join(lines)
+
+
+__all__ = ["SchemaBuildProfile"]
@@ -10,6 +10,8 @@ from .name_converter import NameConverter
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
 
+    from strawberry.persisted_documents import PersistedDocumentsConfig
+    from strawberry.subscriptions.multiplexer import SubscriptionMultiplexingConfig
     from strawberry.types.scalar import ScalarDefinition
 
 
@@ -34,6 +36,15 @@ class StrawberryConfig:
             any type (including NewType) to be used as a GraphQL scalar with
             proper type checking support.
         batching_config: Configuration for operation batching.
+        persisted_documents: Configuration for persisted documents, allowing
+            clients to send the id of a document instead of its text.
+        subscription_multiplexing: Configuration for subscription multiplexing,
+            sharing one source stream between identical subscriptions.
+        profile_schema_build: Measure the time spent building the schema per
+            phase and per type, available as `Schema.build_profile`.
+        cache_schema_build: Keep the resolved annotations and converted names
+            between the schema builds of the process, which speeds up
+            building schemas from the same types repeatedly.
     """
 
     auto_camel_case: InitVar[bool] = None  # pyright: reportGeneralTypeIssues=false
@@ -47,6 +58,10 @@ class StrawberryConfig:
     _unsafe_disable_same_type_validation: bool = False
     scalar_map: Mapping[object, ScalarDefinition] = field(default_factory=dict)
     batching_config: BatchingConfig | None = None
+    persisted_documents: PersistedDocumentsConfig | None = None
+    subscription_multiplexing: SubscriptionMultiplexingConfig | None = None
+    profile_schema_build: bool = False
+    cache_schema_build: bool = False
 
     def __post_init__(
         self,
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from graphql.execution.middleware import MiddlewareManager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from graphql import GraphQLFieldResolver
+
+    from strawberry.extensions.base_extension import SchemaExtension
+    from strawberry.types.field import StrawberryField
+
+
+FieldTargets = dict[tuple[type["SchemaExtension"], "Callable[..., Any]"], bool]
+
+
+def get_resolver_field(resolver: Callable[..., Any]) -> StrawberryField | None:
+    """Return the Strawberry field a GraphQL resolver was created for, if any."""
+    return getattr(resolver, "_strawberry_field", None)
+
+
+class StrawberryMiddlewareManager(MiddlewareManager):
+    """Middleware manager only wrapping the fields targeted by each extension.
+
+    Whether an extension targets a field only depends on the extension class
+    and on the field, so the answer is stored in `targets`, which the schema
+    shares across requests.
+    """
+
+    def __init__(self, *extensions: SchemaExtension, targets: FieldTargets) -> None:
+        super().__init__(*extensions)
+
+        self.extensions = extensions
+        self.targets = targets
+        self._resolvers: dict[GraphQLFieldResolver, GraphQLFieldResolver] = {}
+
+    def get_field_resolver(
+        self, field_resolver: GraphQLFieldResolver
+    ) -> GraphQLFieldResolver:
+        resolver = self._resolvers.get(field_resolver)
+
+        if resolver is not None:
+            return resolver
+
+        resolver = field_resolver
+
+        for extension in self.extensions:
+            extension_class = type(extension)
+            key = (extension_class, field_resolver)
+            targeted = self.targets.get(key)
+
+            if targeted is None:
+                targeted = self.targets[key] = extension_class.targets_field(
+                    get_resolver_field(field_resolver)
+                )
+
+            if targeted:
+                resolver = partial(extension.resolve, resolver)
+
+        self._resolvers[field_resolver] = resolver
+
+        return resolver
+
+
+__all__ = ["StrawberryMiddlewareManager", "get_resolver_field"]
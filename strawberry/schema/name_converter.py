@@ -15,6 +15,7 @@ from strawberry.types.enum import EnumValue, StrawberryEnumDefinition
 from strawberry.types.lazy_type import LazyType
 from strawberry.types.scalar import ScalarDefinition
 from strawberry.types.union import StrawberryUnion
+from strawberry.utils.build_cache import cached_to_camel_case, is_build_cache_enabled
 from strawberry.utils.str_converters import capitalize_first, to_camel_case
 from strawberry.utils.typing import eval_type
 
@@ -35,6 +36,9 @@ class NameConverter:
 
     def apply_naming_config(self, name: str) -> str:
         if self.auto_camel_case:
+            if is_build_cache_enabled():
+                return cached_to_camel_case(name)
+
             name = to_camel_case(name)
 
         return name
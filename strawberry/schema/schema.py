@@ -4,6 +4,7 @@ import asyncio
 import warnings
 from asyncio import ensure_future
 from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import contextmanager, nullcontext
 from functools import lru_cache
 from inspect import isawaitable
 from typing import (
@@ -33,7 +34,6 @@ from graphql import (
     parse,
     validate_schema,
 )
-from graphql.execution.middleware import MiddlewareManager
 from graphql.type.directives import specified_directives
 from graphql.validation import validate
 
@@ -47,10 +47,28 @@ from strawberry.extensions.directives import (
     DirectivesExtensionSync,
 )
 from strawberry.extensions.runner import SchemaExtensionsRunner
+from strawberry.persisted_documents import (
+    PersistedQueryHashMismatchError,
+    PersistedQueryNotFoundError,
+    PersistedQueryNotSupportedError,
+    PersistedQueryRequiredError,
+    ValidatedDocument,
+    ValidatedDocumentCache,
+    compute_document_id,
+    get_persisted_query,
+    is_valid_persisted_query,
+)
 from strawberry.printer import print_schema
+from strawberry.schema.build_profile import SchemaBuildProfile
+from strawberry.schema.middleware import FieldTargets, StrawberryMiddlewareManager
 from strawberry.schema.schema_converter import GraphQLCoreConverter
 from strawberry.schema.validation_rules.maybe_null import MaybeNullValidationRule
 from strawberry.schema.validation_rules.one_of import OneOfInputValidationRule
+from strawberry.subscriptions.multiplexer import (
+    SubscriptionMultiplexer,
+    SubscriptionOverflowError,
+)
+from strawberry.subscriptions.scheduler import execution_limit
 from strawberry.types.base import (
     StrawberryObjectDefinition,
     WithStrawberryObjectDefinition,
@@ -65,6 +83,7 @@ from strawberry.types.graphql import OperationType
 from strawberry.utils import IS_GQL_32, IS_GQL_33
 from strawberry.utils.aio import aclosing
 from strawberry.utils.await_maybe import await_maybe
+from strawberry.utils.build_cache import schema_build_cache
 
 from . import compat
 from ._graphql_core import (
@@ -83,9 +102,10 @@ from .config import StrawberryConfig
 from .exceptions import CannotGetOperationTypeError, InvalidOperationTypeError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Iterable, Iterator, Mapping
     from typing import TypeAlias
 
+    from graphql.execution.middleware import MiddlewareManager
     from graphql.language import DocumentNode
     from graphql.pyutils import Path
     from graphql.type import GraphQLResolveInfo
@@ -333,102 +353,138 @@ class Schema(BaseSchema):
         )
         self.config = config or StrawberryConfig()
 
+        # Persisted documents that passed validation against this schema
+        persisted_documents = self.config.persisted_documents
+        # Whether each extension class wraps the resolver of each field
+        self._field_targets: FieldTargets = {}
+        self._validated_documents = ValidatedDocumentCache(
+            maxsize=persisted_documents.max_cached_documents
+            if persisted_documents
+            else None
+        )
+        # Shared streams of identical subscriptions
+        self._subscription_multiplexer = (
+            SubscriptionMultiplexer(self.config.subscription_multiplexing)
+            if self.config.subscription_multiplexing
+            else None
+        )
+
         self.schema_converter = GraphQLCoreConverter(
             self.config,
             scalar_overrides=scalar_overrides or {},  # type: ignore
             scalar_map=self.config.scalar_map,
             get_fields=self.get_fields,
         )
+        # The time spent building the schema, when `profile_schema_build` is set
+        self.build_profile = (
+            SchemaBuildProfile() if self.config.profile_schema_build else None
+        )
+        self.schema_converter.build_profile = self.build_profile
 
         self.directives = directives
         self.schema_directives = list(schema_directives)
 
-        query_type = self.schema_converter.from_object(
-            cast(
-                "type[WithStrawberryObjectDefinition]", query
-            ).__strawberry_definition__
-        )
-        mutation_type = (
-            self.schema_converter.from_object(
+        with self._build_phase("convert root types"):
+            query_type = self.schema_converter.from_object(
                 cast(
-                    "type[WithStrawberryObjectDefinition]", mutation
+                    "type[WithStrawberryObjectDefinition]", query
                 ).__strawberry_definition__
             )
-            if mutation
-            else None
-        )
-        subscription_type = (
-            self.schema_converter.from_object(
-                cast(
-                    "type[WithStrawberryObjectDefinition]", subscription
-                ).__strawberry_definition__
+            mutation_type = (
+                self.schema_converter.from_object(
+                    cast(
+                        "type[WithStrawberryObjectDefinition]", mutation
+                    ).__strawberry_definition__
+                )
+                if mutation
+                else None
+            )
+            subscription_type = (
+                self.schema_converter.from_object(
+                    cast(
+                        "type[WithStrawberryObjectDefinition]", subscription
+                    ).__strawberry_definition__
+                )
+                if subscription
+                else None
             )
-            if subscription
-            else None
-        )
 
-        graphql_directives = [
-            self.schema_converter.from_directive(directive) for directive in directives
-        ]
+            graphql_directives = [
+                self.schema_converter.from_directive(directive)
+                for directive in directives
+            ]
 
-        graphql_types = []
-        for type_ in types:
-            if compat.is_schema_directive(type_):
-                graphql_directives.append(
-                    self.schema_converter.from_schema_directive(type_)
-                )
-            else:
-                if (
-                    has_object_definition(type_)
-                    and type_.__strawberry_definition__.is_graphql_generic
-                ):
-                    type_ = StrawberryAnnotation(type_).resolve()  # noqa: PLW2901
-                graphql_type = self.schema_converter.from_maybe_optional(type_)
-                if isinstance(graphql_type, GraphQLNonNull):
-                    graphql_type = graphql_type.of_type
-                if not isinstance(graphql_type, GraphQLNamedType):
-                    raise TypeError(f"{graphql_type} is not a named GraphQL Type")
-                graphql_types.append(graphql_type)
+            graphql_types = []
+            for type_ in types:
+                if compat.is_schema_directive(type_):
+                    graphql_directives.append(
+                        self.schema_converter.from_schema_directive(type_)
+                    )
+                else:
+                    if (
+                        has_object_definition(type_)
+                        and type_.__strawberry_definition__.is_graphql_generic
+                    ):
+                        type_ = StrawberryAnnotation(type_).resolve()  # noqa: PLW2901
+                    graphql_type = self.schema_converter.from_maybe_optional(type_)
+                    if isinstance(graphql_type, GraphQLNonNull):
+                        graphql_type = graphql_type.of_type
+                    if not isinstance(graphql_type, GraphQLNamedType):
+                        raise TypeError(f"{graphql_type} is not a named GraphQL Type")
+                    graphql_types.append(graphql_type)
+
+        with self._build_phase("build GraphQL schema"):
+            try:
+                directives = specified_directives + tuple(graphql_directives)  # type: ignore
 
-        try:
-            directives = specified_directives + tuple(graphql_directives)  # type: ignore
-
-            if self.config.enable_experimental_incremental_execution:
-                directives = tuple(directives) + tuple(incremental_execution_directives)
-
-            self._schema = GraphQLSchema(
-                query=query_type,
-                mutation=mutation_type,
-                subscription=subscription_type if subscription else None,
-                directives=directives,  # type: ignore
-                types=graphql_types,
-                extensions={
-                    GraphQLCoreConverter.DEFINITION_BACKREF: self,
-                },
-            )
+                if self.config.enable_experimental_incremental_execution:
+                    directives = tuple(directives) + tuple(
+                        incremental_execution_directives
+                    )
+
+                self._schema = GraphQLSchema(
+                    query=query_type,
+                    mutation=mutation_type,
+                    subscription=subscription_type if subscription else None,
+                    directives=directives,  # type: ignore
+                    types=graphql_types,
+                    extensions={
+                        GraphQLCoreConverter.DEFINITION_BACKREF: self,
+                    },
+                )
 
-        except TypeError as error:
-            # GraphQL core throws a TypeError if there's any exception raised
-            # during the schema creation, so we check if the cause was a
-            # StrawberryError and raise it instead if that's the case.
+            except TypeError as error:
+                # GraphQL core throws a TypeError if there's any exception raised
+                # during the schema creation, so we check if the cause was a
+                # StrawberryError and raise it instead if that's the case.
 
-            from strawberry.exceptions import StrawberryException
+                from strawberry.exceptions import StrawberryException
 
-            if isinstance(error.__cause__, StrawberryException):
-                raise error.__cause__ from None
+                if isinstance(error.__cause__, StrawberryException):
+                    raise error.__cause__ from None
 
-            raise
+                raise
 
         # attach our schema to the GraphQL schema instance
         self._schema._strawberry_schema = self  # type: ignore
 
         self._warn_for_federation_directives()
-        self._resolve_node_ids()
-        self._extend_introspection()
+        # Node types by GraphQL name, to resolve global ids with a lookup
+        self._node_types: dict[str, type[relay.Node]] = {}
+        # The Node types resolving ids, by Python type and GraphQL type name
+        self._node_id_types: dict[tuple[type, str], type[relay.Node]] = {}
+        with self._build_phase("resolve node ids"):
+            self._resolve_node_ids()
+        with self._build_phase("extend introspection"):
+            self._extend_introspection()
 
         # Validate schema early because we want developers to know about
         # possible issues as soon as possible
-        errors = validate_schema(self._schema)
+        with self._build_phase("validate schema"):
+            errors = validate_schema(self._schema)
+
+        self.schema_converter.build_profile = None
+
         if errors:
             formatted_errors = "\n\n".join(f"❌ {error.message}" for error in errors)
             raise ValueError(f"Invalid Schema. Errors:\n\n{formatted_errors}")
@@ -471,12 +527,18 @@ class Schema(BaseSchema):
 
     def _get_middleware_manager(
         self, extensions: list[SchemaExtension]
-    ) -> MiddlewareManager:
+    ) -> MiddlewareManager | None:
         # Build a fresh middleware manager per request: the manager holds
         # references to extension instances, which are now constructed
         # per-request to avoid concurrency leaks (see #4369).
-        return MiddlewareManager(
-            *(ext for ext in extensions if ext._implements_resolve())
+        resolve_extensions = [ext for ext in extensions if ext._implements_resolve()]
+
+        if not resolve_extensions:
+            # Without middleware graphql-core doesn't have to wrap resolvers
+            return None
+
+        return StrawberryMiddlewareManager(
+            *resolve_extensions, targets=self._field_targets
         )
 
     def _create_execution_context(
@@ -516,6 +578,10 @@ class Schema(BaseSchema):
 
         return None
 
+    def get_node_type(self, name: str) -> type[relay.Node] | None:
+        """Get the Node type with the given GraphQL name, if any."""
+        return self._node_types.get(name)
+
     def get_field_for_type(
         self, field_name: str, type_name: str
     ) -> StrawberryField | None:
@@ -555,6 +621,12 @@ class Schema(BaseSchema):
         self, context: ExecutionContext, extensions_runner: SchemaExtensionsRunner
     ) -> PreExecutionError | None:
         """Parse, check the operation type, and validate before execution."""
+        try:
+            register_document = self._load_persisted_document(context)
+        except GraphQLError as error:
+            context.pre_execution_errors = [error]
+            return PreExecutionError(data=None, errors=[error])
+
         if not context.query and context.graphql_document is None:
             raise MissingQueryError
 
@@ -580,19 +652,35 @@ class Schema(BaseSchema):
             raise InvalidOperationTypeError(operation_type)
 
         async with extensions_runner.validation():
-            _run_validation(context)
+            is_validated = self._is_validated_persisted_document(context)
+            if not is_validated:
+                _run_validation(context)
             if context.pre_execution_errors:
                 return PreExecutionError(
                     data=None,
                     errors=context.pre_execution_errors,
                 )
 
+        if context.persisted_document_id is not None and not is_validated:
+            self._cache_persisted_document(context, register=register_document)
+
         return None
 
     def _prepare_operation_sync(
         self, context: ExecutionContext, extensions_runner: SchemaExtensionsRunner
     ) -> ExecutionResult | None:
         """Parse, check the operation type, and validate before execution."""
+        try:
+            register_document = self._load_persisted_document(context)
+        except GraphQLError as error:
+            context.pre_execution_errors = [error]
+            self._process_errors([error], context)
+            return ExecutionResult(
+                data=None,
+                errors=[error],
+                extensions=extensions_runner.get_extensions_results_sync(),
+            )
+
         if not context.query and context.graphql_document is None:
             raise MissingQueryError
 
@@ -618,7 +706,9 @@ class Schema(BaseSchema):
             raise InvalidOperationTypeError(operation_type)
 
         with extensions_runner.validation():
-            _run_validation(context)
+            is_validated = self._is_validated_persisted_document(context)
+            if not is_validated:
+                _run_validation(context)
             if context.pre_execution_errors:
                 self._process_errors(context.pre_execution_errors, context)
                 return ExecutionResult(
@@ -627,8 +717,106 @@ class Schema(BaseSchema):
                     extensions=extensions_runner.get_extensions_results_sync(),
                 )
 
+        if context.persisted_document_id is not None and not is_validated:
+            self._cache_persisted_document(context, register=register_document)
+
         return None
 
+    def _load_persisted_document(self, context: ExecutionContext) -> bool:
+        """Load the persisted document requested by the operation, if any.
+
+        Documents that already passed validation are reused as they are,
+        otherwise the text of the document is loaded from the store.
+
+        Returns whether the document sent by the client has to be registered
+        in the store once it passes validation.
+        """
+        persisted_query = get_persisted_query(context.operation_extensions)
+        persisted_documents = self.config.persisted_documents
+
+        if persisted_documents is None:
+            if persisted_query is not None and not context.query:
+                raise PersistedQueryNotSupportedError
+
+            return False
+
+        if persisted_query is None:
+            if persisted_documents.trusted_documents_only:
+                raise PersistedQueryRequiredError
+
+            return False
+
+        if not is_valid_persisted_query(persisted_query):
+            raise GraphQLError("Invalid `persistedQuery` extension")
+
+        document_id = persisted_query["sha256Hash"]
+        context.persisted_document_id = document_id
+        validated_document = self._validated_documents.get(document_id)
+
+        # Automatic persisted queries: the client sends the text along with
+        # the hash so that we can register it
+        if context.query and not persisted_documents.trusted_documents_only:
+            if compute_document_id(context.query) != document_id:
+                raise PersistedQueryHashMismatchError
+
+            if validated_document is not None:
+                context.graphql_document = validated_document.document
+
+            return validated_document is None
+
+        if validated_document is not None:
+            context.query = validated_document.query
+            context.graphql_document = validated_document.document
+
+            return False
+
+        query = persisted_documents.store.get(document_id)
+        if query is None:
+            raise PersistedQueryNotFoundError
+
+        context.query = query
+
+        return False
+
+    def _is_validated_persisted_document(self, context: ExecutionContext) -> bool:
+        if context.persisted_document_id is None:
+            return False
+
+        validated_document = self._validated_documents.get(
+            context.persisted_document_id
+        )
+
+        # Extensions might parse the document again or change the
+        # validation rules, in which case we have to validate it again
+        return (
+            validated_document is not None
+            and validated_document.document is context.graphql_document
+            and validated_document.validation_rules == context.validation_rules
+        )
+
+    def _cache_persisted_document(
+        self, context: ExecutionContext, *, register: bool
+    ) -> None:
+        assert context.persisted_document_id is not None
+        assert context.query is not None
+        assert context.graphql_document is not None
+
+        self._validated_documents.set(
+            context.persisted_document_id,
+            ValidatedDocument(
+                query=context.query,
+                document=context.graphql_document,
+                validation_rules=context.validation_rules,
+            ),
+        )
+
+        if register:
+            assert self.config.persisted_documents is not None
+
+            self.config.persisted_documents.store.set(
+                context.persisted_document_id, context.query
+            )
+
     async def _handle_execution_result(
         self,
         context: ExecutionContext,
@@ -674,7 +862,7 @@ class Schema(BaseSchema):
         self,
         execution_context: ExecutionContext,
         extensions_runner: SchemaExtensionsRunner,
-        middleware_manager: MiddlewareManager,
+        middleware_manager: MiddlewareManager | None,
         execute_function: Callable[..., Any],
         custom_context_kwargs: dict[str, Any],
     ) -> ResultType:
@@ -898,9 +1086,10 @@ class Schema(BaseSchema):
         self,
         execution_context: ExecutionContext,
         extensions_runner: SchemaExtensionsRunner,
-        middleware_manager: MiddlewareManager,
+        middleware_manager: MiddlewareManager | None,
         execution_context_class: type[GraphQLExecutionContext] | None = None,
         operation_extensions: dict[str, Any] | None = None,
+        multiplex: bool = True,
     ) -> StreamResult:
         async with extensions_runner.operation():
             try:
@@ -938,11 +1127,51 @@ class Schema(BaseSchema):
                     middleware_manager,
                     operation_extensions,
                 )
-                async with aclosing(result_source):
+                # Set by the WebSocket handlers to cap the executions per connection
+                limit = execution_limit.get()
+
+                async with limit or nullcontext(), aclosing(result_source):
                     async for result in result_source:
                         yield result
                 return
 
+            multiplexer = self._subscription_multiplexer
+            key = (
+                multiplexer.get_key(execution_context)
+                if multiplex and multiplexer is not None
+                else None
+            )
+
+            # Identical subscriptions share one stream, executed once per event
+            if key is not None:
+                assert multiplexer is not None
+
+                result_source = multiplexer.subscribe(
+                    key,
+                    lambda: self._create_stream(
+                        query=execution_context.query,
+                        variable_values=execution_context.variables,
+                        context_value=execution_context.context,
+                        root_value=execution_context.root_value,
+                        operation_name=execution_context.operation_name,
+                        operation_extensions=operation_extensions,
+                        allowed_operation_types=(OperationType.SUBSCRIPTION,),
+                        multiplex=False,
+                    ),
+                )
+                try:
+                    async with aclosing(result_source):
+                        async for result in result_source:
+                            yield result
+                # Slow subscribers are disconnected instead of stalling the others
+                except SubscriptionOverflowError as exc:
+                    yield await self._handle_execution_result(
+                        execution_context,
+                        OriginalExecutionResult(data=None, errors=[_coerce_error(exc)]),
+                        extensions_runner,
+                    )
+                return
+
             try:
                 async with extensions_runner.executing():
                     gql_33_kwargs = {
@@ -1010,7 +1239,7 @@ class Schema(BaseSchema):
         self,
         execution_context: ExecutionContext,
         extensions_runner: SchemaExtensionsRunner,
-        middleware_manager: MiddlewareManager,
+        middleware_manager: MiddlewareManager | None,
         operation_extensions: dict[str, Any] | None = None,
     ) -> StreamResult:
         """Run a query/mutation over a streaming transport.
@@ -1123,6 +1352,27 @@ class Schema(BaseSchema):
         if allowed_operation_types is None:
             allowed_operation_types = DEFAULT_ALLOWED_OPERATION_TYPES
 
+        return self._create_stream(
+            query=query,
+            variable_values=variable_values,
+            context_value=context_value,
+            root_value=root_value,
+            operation_name=operation_name,
+            operation_extensions=operation_extensions,
+            allowed_operation_types=allowed_operation_types,
+        )
+
+    def _create_stream(
+        self,
+        query: str | None,
+        variable_values: dict[str, Any] | None,
+        context_value: Any | None,
+        root_value: Any | None,
+        operation_name: str | None,
+        operation_extensions: dict[str, Any] | None,
+        allowed_operation_types: Iterable[OperationType],
+        multiplex: bool = True,
+    ) -> StreamResult:
         execution_context = self._create_execution_context(
             query=query,
             allowed_operation_types=allowed_operation_types,
@@ -1145,10 +1395,21 @@ class Schema(BaseSchema):
             middleware_manager=self._get_middleware_manager(extensions),
             execution_context_class=self.execution_context_class,
             operation_extensions=operation_extensions,
+            multiplex=multiplex,
         )
 
+    @contextmanager
+    def _build_phase(self, name: str) -> Iterator[None]:
+        profile = self.build_profile
+
+        with (
+            profile.phase(name) if profile else nullcontext(),
+            schema_build_cache() if self.config.cache_schema_build else nullcontext(),
+        ):
+            yield
+
     def _resolve_node_ids(self) -> None:
-        for concrete_type in self.schema_converter.type_map.values():
+        for type_name, concrete_type in self.schema_converter.type_map.items():
             type_def = concrete_type.definition
 
             # This can be a TypeDefinition, StrawberryEnumDefinition, ScalarDefinition
@@ -1156,6 +1417,10 @@ class Schema(BaseSchema):
             if not isinstance(type_def, StrawberryObjectDefinition):
                 continue
 
+            origin = type_def.origin
+            if isinstance(origin, type) and issubclass(origin, relay.Node):
+                self._node_types[type_name] = origin
+
             # Do not validate id_attr for interfaces. relay.Node itself and
             # any other interfdace that implements it are not required to
             # provide a NodeID annotation, only the concrete type implementing
@@ -1165,7 +1430,6 @@ class Schema(BaseSchema):
 
             # Call resolve_id_attr in here to make sure we raise provide
             # early feedback for missing NodeID annotations
-            origin = type_def.origin
             if issubclass(origin, relay.Node):
                 has_custom_resolve_id = False
                 for base in origin.__mro__:
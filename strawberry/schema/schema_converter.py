@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import sys
 import typing
@@ -15,6 +16,7 @@ from typing import (
 from typing_extensions import Protocol
 
 from graphql import (
+    EnumValueNode,
     GraphQLAbstractType,
     GraphQLArgument,
     GraphQLDirective,
@@ -54,19 +56,24 @@ from strawberry.schema.types.scalar import (
     DEFAULT_SCALAR_REGISTRY,
     _make_scalar_type,
 )
-from strawberry.types.arguments import StrawberryArgument, convert_arguments
+from strawberry.types.arguments import (
+    StrawberryArgument,
+    build_arguments_converter,
+)
 from strawberry.types.base import (
+    TYPE_RESOLUTION_CACHE_SIZE,
     StrawberryList,
     StrawberryMaybe,
     StrawberryObjectDefinition,
     StrawberryOptional,
     StrawberryType,
     get_object_definition,
+    get_type_resolution_key,
     has_object_definition,
 )
 from strawberry.types.cast import get_strawberry_type_cast
 from strawberry.types.enum import StrawberryEnumDefinition, has_enum_definition
-from strawberry.types.field import UNRESOLVED
+from strawberry.types.field import UNRESOLVED, StrawberryField
 from strawberry.types.lazy_type import LazyType
 from strawberry.types.private import is_private
 from strawberry.types.scalar import ScalarWrapper, scalar
@@ -89,10 +96,11 @@ if TYPE_CHECKING:
     )
 
     from strawberry.directive import StrawberryDirective
+    from strawberry.schema.build_profile import SchemaBuildProfile
     from strawberry.schema.config import StrawberryConfig
     from strawberry.schema_directive import StrawberrySchemaDirective
+    from strawberry.types.arguments import ArgumentConverter, ArgumentsConverter
     from strawberry.types.enum import EnumValue
-    from strawberry.types.field import StrawberryField
     from strawberry.types.info import Info
     from strawberry.types.scalar import ScalarDefinition
 
@@ -163,11 +171,29 @@ class CustomGraphQLEnumType(GraphQLEnumType):
         super().__init__(*args, **kwargs)
         self.wrapped_cls = enum.wrapped_cls
 
+        # Reverse lookups so that coercing a value doesn't scan every member.
+        # The first name wins for duplicated values, like the scan would, and
+        # unhashable values are only found by the scan.
+        self._names_by_value: dict[Any, str] = {}
+        self._members_by_name: dict[str, Any] = {}
+
+        for name, value in self.values.items():
+            with contextlib.suppress(TypeError):
+                self._names_by_value.setdefault(value.value, name)
+
+            with contextlib.suppress(Exception):
+                self._members_by_name[name] = self.wrapped_cls(value.value)
+
     def serialize(self, output_value: Any) -> str:
         return self.coerce_output_value(output_value)
 
     def coerce_output_value(self, output_value: Any) -> str:
         if isinstance(output_value, self.wrapped_cls):
+            try:
+                return self._names_by_value[output_value.value]
+            except (KeyError, TypeError):
+                pass
+
             for name, value in self.values.items():
                 if output_value.value == value.value:
                     return name
@@ -189,6 +215,11 @@ class CustomGraphQLEnumType(GraphQLEnumType):
     def coerce_input_value(
         self, input_value: str, hide_suggestions: bool = False
     ) -> Any:
+        if isinstance(input_value, str):
+            member = self._members_by_name.get(input_value)
+            if member is not None:
+                return member
+
         if IS_GQL_32:
             return self.wrapped_cls(super().parse_value(input_value))
 
@@ -209,6 +240,11 @@ class CustomGraphQLEnumType(GraphQLEnumType):
     def coerce_input_literal(
         self, value_node: ValueNode, hide_suggestions: bool = False
     ) -> Any:
+        if isinstance(value_node, EnumValueNode):
+            member = self._members_by_name.get(value_node.value)
+            if member is not None:
+                return member
+
         if IS_GQL_32:
             return self.wrapped_cls(super().parse_literal(value_node, None))
 
@@ -225,15 +261,9 @@ def get_arguments(
     source: Any,
     info: Info,
     kwargs: Any,
-    config: StrawberryConfig,
-    scalar_registry: Mapping[object, ScalarWrapper | ScalarDefinition],
+    arguments_converter: ArgumentsConverter,
 ) -> tuple[list[Any], dict[str, Any]]:
-    kwargs = convert_arguments(
-        kwargs,
-        field.arguments,
-        scalar_registry=scalar_registry,
-        config=config,
-    )
+    kwargs = arguments_converter(kwargs)
 
     # Let field extensions reshape the converted arguments before the resolver
     # is called (e.g. ``InputMutationExtension`` unpacks its ``input`` object
@@ -284,6 +314,36 @@ class GraphQLCoreConverter:
         self.config = config
         self.scalar_registry = self._get_scalar_registry(scalar_overrides, scalar_map)
         self.get_fields = get_fields
+        # Argument converters of input types, shared by all the fields
+        # so that each input type is only analyzed once
+        self._argument_converters: dict[type, ArgumentConverter] = {}
+        # Converters of the arguments of fields, for code converting them
+        # outside of their resolver, like lookaheads
+        self._arguments_converters: dict[StrawberryField, ArgumentsConverter] = {}
+        # Set while building a schema with `profile_schema_build` enabled
+        self.build_profile: SchemaBuildProfile | None = None
+
+    def get_arguments_converter(self, field: StrawberryField) -> ArgumentsConverter:
+        """Get the converter of the arguments of a field, built once per field."""
+        converter = self._arguments_converters.get(field)
+
+        if converter is None:
+            converter = self._arguments_converters[field] = build_arguments_converter(
+                field.arguments,
+                scalar_registry=self.scalar_registry,
+                config=self.config,
+                converters=self._argument_converters,
+            )
+
+        return converter
+
+    def _profile_type(
+        self, type_: StrawberryType
+    ) -> contextlib.AbstractContextManager[None]:
+        if self.build_profile is None:
+            return contextlib.nullcontext()
+
+        return self.build_profile.type(self.config.name_converter.from_type(type_))
 
     def _get_scalar_registry(
         self,
@@ -344,20 +404,21 @@ class GraphQLCoreConverter:
             assert isinstance(graphql_enum, CustomGraphQLEnumType)  # For mypy
             return graphql_enum
 
-        graphql_enum = CustomGraphQLEnumType(
-            enum=enum,
-            name=enum_name,
-            values={
-                self.config.name_converter.from_enum_value(
-                    enum, item
-                ): self.from_enum_value(item)
-                for item in enum.values
-            },
-            description=enum.description,
-            extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: enum,
-            },
-        )
+        with self._profile_type(enum):
+            graphql_enum = CustomGraphQLEnumType(
+                enum=enum,
+                name=enum_name,
+                values={
+                    self.config.name_converter.from_enum_value(
+                        enum, item
+                    ): self.from_enum_value(item)
+                    for item in enum.values
+                },
+                description=enum.description,
+                extensions={
+                    GraphQLCoreConverter.DEFINITION_BACKREF: enum,
+                },
+            )
 
         self.type_map[enum_name] = ConcreteType(
             definition=enum, implementation=graphql_enum
@@ -454,6 +515,9 @@ class GraphQLCoreConverter:
             subscribe = resolver
             resolver = lambda event, *_, **__: event  # noqa: E731
 
+        # Lets extensions decide which fields their `resolve` should wrap
+        resolver._strawberry_field = field  # type: ignore[attr-defined]
+
         graphql_arguments = {}
         for argument in field.arguments:
             argument_name = self.config.name_converter.from_argument(argument)
@@ -504,22 +568,24 @@ class GraphQLCoreConverter:
     def get_graphql_fields(
         self, type_definition: StrawberryObjectDefinition
     ) -> dict[str, GraphQLField]:
-        return _get_thunk_mapping(
-            type_definition=type_definition,
-            name_converter=self.config.name_converter.from_field,
-            field_converter=self.from_field,
-            get_fields=self.get_fields,
-        )
+        with self._profile_type(type_definition):
+            return _get_thunk_mapping(
+                type_definition=type_definition,
+                name_converter=self.config.name_converter.from_field,
+                field_converter=self.from_field,
+                get_fields=self.get_fields,
+            )
 
     def get_graphql_input_fields(
         self, type_definition: StrawberryObjectDefinition
     ) -> dict[str, GraphQLInputField]:
-        return _get_thunk_mapping(
-            type_definition=type_definition,
-            name_converter=self.config.name_converter.from_field,
-            field_converter=self.from_input_field,
-            get_fields=self.get_fields,
-        )
+        with self._profile_type(type_definition):
+            return _get_thunk_mapping(
+                type_definition=type_definition,
+                name_converter=self.config.name_converter.from_field,
+                field_converter=self.from_input_field,
+                get_fields=self.get_fields,
+            )
 
     def from_input_object(self, object_type: type) -> GraphQLInputObjectType:
         type_definition = object_type.__strawberry_definition__  # type: ignore
@@ -591,6 +657,10 @@ class GraphQLCoreConverter:
             if interface.resolve_type:
                 return interface.resolve_type
 
+            # The names of the types generic objects were resolved to, by the
+            # key of the object
+            resolved_types: dict[tuple[Any, ...], str] = {}
+
             def resolve_type(
                 obj: Any, info: GraphQLResolveInfo, abstract_type: GraphQLAbstractType
             ) -> Awaitable[str | None] | str | None:
@@ -603,10 +673,13 @@ class GraphQLCoreConverter:
                         return type_definition.name
 
                     # here we don't all the implementations of the generic
-                    # we need to find a way to find them, for now maybe
-                    # we can follow the union's approach and iterate over
-                    # all the types in the schema, but we should probably
-                    # optimize this
+                    # we need to find a way to find them, for now we follow
+                    # the union's approach and iterate over all the types in
+                    # the schema, remembering the result for the next objects
+                    key = get_type_resolution_key(obj)
+
+                    if key is not None and (cached_name := resolved_types.get(key)):
+                        return cached_name
 
                     return_type: GraphQLType | None = None
 
@@ -625,6 +698,12 @@ class GraphQLCoreConverter:
                     if return_type:
                         assert isinstance(return_type, GraphQLNamedType)
 
+                        if (
+                            key is not None
+                            and len(resolved_types) < TYPE_RESOLUTION_CACHE_SIZE
+                        ):
+                            resolved_types[key] = return_type.name
+
                         return return_type.name
 
                 # Revert to calling is_type_of for cases where a direct subclass
@@ -715,18 +794,45 @@ class GraphQLCoreConverter:
 
         return graphql_object_type
 
-    def from_resolver(
-        self, field: StrawberryField
-    ) -> Callable:  # TODO: Take StrawberryResolver
-        field.default_resolver = self.config.default_resolver
+    def _get_basic_field_resolver(self, field: StrawberryField) -> Callable:
+        """Return the resolver of a field without resolver nor extensions.
 
-        if field.is_basic_field:
+        Basic fields are resolved once per object, so they skip `get_result`
+        and look the attribute up directly. The resolver is still a function
+        set on the GraphQL field, so resolve middleware sees every field.
+        """
+        if type(field).get_result is not StrawberryField.get_result:
+            # Subclasses may customise how results are computed
 
             def _get_basic_result(_source: Any, *args: str, **kwargs: Any) -> Any:
                 # Call `get_result` without an info object or any args or
                 # kwargs because this is a basic field with no resolver.
                 return field.get_result(_source, info=None, args=[], kwargs={})
 
+            return _get_basic_result
+
+        python_name = field.python_name
+        default_resolver = field.default_resolver
+
+        if default_resolver is getattr:
+
+            def _get_attribute(_source: Any, *args: str, **kwargs: Any) -> Any:
+                return getattr(_source, python_name)
+
+            return _get_attribute
+
+        def _get_default_result(_source: Any, *args: str, **kwargs: Any) -> Any:
+            return default_resolver(_source, python_name)
+
+        return _get_default_result
+
+    def from_resolver(
+        self, field: StrawberryField
+    ) -> Callable:  # TODO: Take StrawberryResolver
+        field.default_resolver = self.config.default_resolver
+
+        if field.is_basic_field:
+            _get_basic_result = self._get_basic_field_resolver(field)
             _get_basic_result._is_default = True  # type: ignore
 
             return _get_basic_result
@@ -754,6 +860,15 @@ class GraphQLCoreConverter:
 
             extension_functions = build_field_extension_resolvers(field)
 
+            # extensions might change the arguments when applied, so we
+            # build the converter only after applying them
+            arguments_converter = build_arguments_converter(
+                field.arguments,
+                scalar_registry=self.scalar_registry,
+                config=self.config,
+                converters=self._argument_converters,
+            )
+
             def extension_resolver(
                 _source: Any,
                 info: Info,
@@ -766,8 +881,7 @@ class GraphQLCoreConverter:
                     source=_source,
                     info=info,
                     kwargs=kwargs,
-                    config=self.config,
-                    scalar_registry=self.scalar_registry,
+                    arguments_converter=arguments_converter,
                 )
 
                 resolver_requested_info = False
@@ -1,10 +1,11 @@
 import datetime
 import decimal
+import re
 import uuid
 from collections.abc import Callable
 from operator import methodcaller
+from typing import cast
 
-import dateutil.parser
 from graphql import GraphQLError
 
 from strawberry.types.scalar import ScalarDefinition
@@ -22,9 +23,65 @@ def wrap_parser(parser: Callable, type_: str) -> Callable:
     return inner
 
 
+# The ISO 8601 datetimes that `fromisoformat` parses like dateutil does, with
+# an optional offset of exactly `Z` or `±HH:MM` directly after the time
+ISO_DATETIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?"
+    r"(?P<offset>Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?"
+)
+
+# The dateutil timezones of the offsets parsed by `parse_datetime`
+_timezones: dict[str, datetime.tzinfo] = {}
+
+
+def _get_timezone(offset: str, parsed: datetime.datetime) -> datetime.tzinfo:
+    from dateutil import tz
+
+    utcoffset = cast("datetime.timedelta", parsed.utcoffset())
+    # dateutil returns the same timezones, which don't compare equal to the
+    # ones of the standard library
+    timezone = tz.UTC if not utcoffset else tz.tzoffset(None, utcoffset.total_seconds())
+    _timezones[offset] = timezone
+
+    return timezone
+
+
+def parse_datetime(value: str) -> datetime.datetime:
+    # `fromisoformat` is much faster than dateutil, but it accepts formats
+    # dateutil rejects, and before Python 3.11 it doesn't parse all the formats
+    # dateutil does, so it's only used for the most common format. dateutil
+    # parses the others and reports the errors
+    if (match := ISO_DATETIME_RE.fullmatch(value)) is not None:
+        offset = match["offset"]
+
+        try:
+            parsed = datetime.datetime.fromisoformat(
+                f"{value[:-1]}+00:00" if offset == "Z" else value
+            )
+        except ValueError:
+            pass
+        else:
+            if offset is None:
+                return parsed
+
+            if (timezone := _timezones.get(offset)) is None:
+                timezone = _get_timezone(offset, parsed)
+
+            return parsed.replace(tzinfo=timezone)
+
+    import dateutil.parser
+
+    try:
+        return dateutil.parser.isoparse(value)
+    except ValueError as e:
+        raise GraphQLError(  # noqa: B904
+            f'Value cannot represent a DateTime: "{value}". {e}'
+        )
+
+
 def parse_decimal(value: object) -> decimal.Decimal:
     try:
-        return decimal.Decimal(str(value))
+        return decimal.Decimal(value if isinstance(value, str) else str(value))
     except decimal.DecimalException:
         raise GraphQLError(f'Value cannot represent a Decimal: "{value}".')  # noqa: B904
 
@@ -47,7 +104,7 @@ DateTimeDefinition: ScalarDefinition = ScalarDefinition(
     description="Date with time (isoformat)",
     specified_by_url=None,
     serialize=isoformat,
-    parse_value=wrap_parser(dateutil.parser.isoparse, "DateTime"),
+    parse_value=parse_datetime,
     parse_literal=None,
     origin=datetime.datetime,
 )
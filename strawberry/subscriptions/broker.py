@@ -0,0 +1,371 @@
+"""A publish/subscribe broker for subscription resolvers.
+
+Resolvers listen to topics and yield the events published to them, whatever
+the integration serving the subscription:
+
+```python
+from collections.abc import AsyncGenerator
+
+import strawberry
+from strawberry.subscriptions.broker import Broker
+
+broker = Broker()
+
+
+@strawberry.type
+class Subscription:
+    @strawberry.subscription
+    async def score(self, game: str) -> AsyncGenerator[int, None]:
+        async with broker.subscribe(f"scores.{game}") as scores:
+            async for score in scores:
+                yield score
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    async def score(self, game: str, points: int) -> int:
+        await broker.publish(f"scores.{game}", points)
+        return points
+```
+
+Topics are made of segments separated by dots. Patterns can use `*` to match
+exactly one segment and end with `#` to match any number of segments, so
+`scores.*` matches `scores.final` and `scores.#` matches `scores` and
+`scores.final.home`.
+
+Published events are handed to every matching subscriber as is, without
+copying them, so they should not be mutated. Each subscriber buffers up to
+`buffer_size` events, when a subscriber falls behind its oldest events are
+dropped.
+
+By default events are only delivered within the process. A `BrokerBackend`
+connects the brokers of several processes through an external message bus.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+from collections import deque
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from typing_extensions import Self
+
+
+SINGLE_SEGMENT_WILDCARD = "*"
+MULTI_SEGMENT_WILDCARD = "#"
+
+# Number of published topics whose subscribers are remembered
+_MATCHES_CACHE_SIZE = 1024
+
+
+class BrokerBackend(abc.ABC):
+    """Exchange events between the brokers of several processes.
+
+    A broker with a backend publishes events through the backend only, and
+    delivers the events received from `listen` to its local subscribers,
+    including the events it published itself.
+    """
+
+    @abc.abstractmethod
+    async def publish(self, topic: str, event: Any) -> None:
+        """Send an event to every process listening to a matching pattern."""
+
+    @abc.abstractmethod
+    async def subscribe(self, pattern: str) -> None:
+        """Start receiving the events matching a pattern."""
+
+    @abc.abstractmethod
+    async def unsubscribe(self, pattern: str) -> None:
+        """Stop receiving the events matching a pattern."""
+
+    @abc.abstractmethod
+    def listen(self) -> AsyncIterator[tuple[str, Any]]:
+        """Iterate over the `(topic, event)` pairs received by this process.
+
+        Each event must be received once, even if it matches several of the
+        patterns this process subscribed to.
+        """
+
+
+def _split_pattern(pattern: str) -> list[str]:
+    segments = pattern.split(".")
+
+    if MULTI_SEGMENT_WILDCARD in segments[:-1]:
+        raise ValueError(
+            f"`{MULTI_SEGMENT_WILDCARD}` can only be the last segment of a pattern"
+        )
+
+    return segments
+
+
+def _split_topic(topic: str) -> list[str]:
+    segments = topic.split(".")
+
+    if SINGLE_SEGMENT_WILDCARD in segments or MULTI_SEGMENT_WILDCARD in segments:
+        raise ValueError("Events can't be published to patterns")
+
+    return segments
+
+
+class _TopicNode:
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TopicNode] = {}
+        self.subscriptions: set[BrokerSubscription] = set()
+
+    def is_empty(self) -> bool:
+        return not self.children and not self.subscriptions
+
+
+class BrokerSubscription:
+    """The events published to the topics matching a pattern.
+
+    Subscriptions receive events from the moment they are entered with
+    `async with` until they are closed, when exiting the `async with` block.
+    """
+
+    __slots__ = ("_buffer", "_waiter", "broker", "closed", "dropped", "pattern")
+
+    def __init__(self, broker: Broker, pattern: str, buffer_size: int) -> None:
+        self.broker = broker
+        self.pattern = pattern
+        self.closed = False
+        # Number of events dropped because the subscriber fell behind
+        self.dropped = 0
+        self._buffer: deque[Any] = deque(maxlen=buffer_size)
+        self._waiter: asyncio.Future[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __aiter__(self) -> BrokerSubscription:
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._buffer:
+            if self.closed:
+                raise StopAsyncIteration
+
+            self._waiter = asyncio.get_running_loop().create_future()
+
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        return self._buffer.popleft()
+
+    async def __aenter__(self) -> Self:
+        await self.broker._subscribe(self)
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if not self.closed:
+            self._end()
+            await self.broker._unsubscribe(self)
+
+    def _push(self, event: Any) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+
+        self._buffer.append(event)
+
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _end(self) -> None:
+        self.closed = True
+
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+class Broker:
+    """Deliver the events published to topics to the matching subscribers."""
+
+    def __init__(
+        self, backend: BrokerBackend | None = None, buffer_size: int = 100
+    ) -> None:
+        """Initialize the Broker.
+
+        Args:
+            backend: The backend connecting the brokers of several processes,
+                if `None` events are only delivered within the process.
+            buffer_size: The default number of events each subscriber buffers.
+        """
+        self.backend = backend
+        self.buffer_size = buffer_size
+        self._root = _TopicNode()
+        self._pattern_counts: dict[str, int] = {}
+        self._matches: dict[str, tuple[BrokerSubscription, ...]] = {}
+        self._reader: asyncio.Task | None = None
+
+    async def publish(self, topic: str, event: Any) -> None:
+        """Publish an event to the subscribers of the matching patterns."""
+        if self.backend is None:
+            self.deliver(topic, event)
+        else:
+            _split_topic(topic)
+            await self.backend.publish(topic, event)
+
+    def deliver(self, topic: str, event: Any) -> None:
+        """Hand an event to the local subscribers of the matching patterns."""
+        subscriptions = self._matches.get(topic)
+
+        if subscriptions is None:
+            subscriptions = self._match(topic)
+
+        for subscription in subscriptions:
+            subscription._push(event)
+
+    def subscribe(
+        self, pattern: str, buffer_size: int | None = None
+    ) -> BrokerSubscription:
+        """Subscribe to the topics matching a pattern.
+
+        The subscription starts receiving events once entered with `async with`.
+        """
+        _split_pattern(pattern)
+
+        return BrokerSubscription(self, pattern, buffer_size or self.buffer_size)
+
+    async def close(self) -> None:
+        """End all the subscriptions and stop reading from the backend."""
+        pending = [self._root]
+
+        while pending:
+            node = pending.pop()
+            pending.extend(node.children.values())
+
+            for subscription in node.subscriptions:
+                subscription._end()
+
+        if self._reader is not None:
+            self._reader.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await self._reader
+
+            self._reader = None
+
+        if self.backend is not None:
+            for pattern in self._pattern_counts:
+                await self.backend.unsubscribe(pattern)
+
+        self._root = _TopicNode()
+        self._pattern_counts.clear()
+        self._matches.clear()
+
+    async def _subscribe(self, subscription: BrokerSubscription) -> None:
+        node = self._root
+
+        for segment in _split_pattern(subscription.pattern):
+            node = node.children.setdefault(segment, _TopicNode())
+
+        node.subscriptions.add(subscription)
+        self._matches.clear()
+
+        count = self._pattern_counts.get(subscription.pattern, 0)
+        self._pattern_counts[subscription.pattern] = count + 1
+
+        if self.backend is not None:
+            if self._reader is None:
+                self._reader = asyncio.create_task(self._read(self.backend))
+
+            if not count:
+                await self.backend.subscribe(subscription.pattern)
+
+    def _match(self, topic: str) -> tuple[BrokerSubscription, ...]:
+        matches: list[BrokerSubscription] = []
+        nodes = [self._root]
+
+        for segment in _split_topic(topic):
+            next_nodes = []
+
+            for node in nodes:
+                if wildcard := node.children.get(MULTI_SEGMENT_WILDCARD):
+                    matches.extend(wildcard.subscriptions)
+
+                if child := node.children.get(segment):
+                    next_nodes.append(child)
+
+                if child := node.children.get(SINGLE_SEGMENT_WILDCARD):
+                    next_nodes.append(child)
+
+            if not next_nodes:
+                break
+
+            nodes = next_nodes
+        else:
+            for node in nodes:
+                matches.extend(node.subscriptions)
+
+                # `#` also matches zero segments
+                if wildcard := node.children.get(MULTI_SEGMENT_WILDCARD):
+                    matches.extend(wildcard.subscriptions)
+
+        subscriptions = tuple(matches)
+
+        if len(self._matches) >= _MATCHES_CACHE_SIZE:
+            self._matches.clear()
+
+        self._matches[topic] = subscriptions
+
+        return subscriptions
+
+    async def _unsubscribe(self, subscription: BrokerSubscription) -> None:
+        path = [self._root]
+
+        for segment in _split_pattern(subscription.pattern):
+            node = path[-1].children.get(segment)
+
+            if node is None:
+                return  # pragma: no cover
+
+            path.append(node)
+
+        if subscription not in path[-1].subscriptions:
+            # Already dropped by `close`
+            return
+
+        path[-1].subscriptions.discard(subscription)
+        self._matches.clear()
+
+        # Prune the branches left without subscriptions
+        for parent, segment, node in zip(
+            reversed(path[:-1]),
+            reversed(subscription.pattern.split(".")),
+            reversed(path[1:]),
+            strict=True,
+        ):
+            if not node.is_empty():
+                break
+
+            del parent.children[segment]
+
+        count = self._pattern_counts[subscription.pattern] - 1
+
+        if count:
+            self._pattern_counts[subscription.pattern] = count
+            return
+
+        del self._pattern_counts[subscription.pattern]
+
+        if self.backend is not None:
+            await self.backend.unsubscribe(subscription.pattern)
+
+    async def _read(self, backend: BrokerBackend) -> None:
+        async for topic, event in backend.listen():
+            self.deliver(topic, event)
+
+
+__all__ = ["Broker", "BrokerBackend", "BrokerSubscription"]
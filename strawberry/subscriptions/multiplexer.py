@@ -0,0 +1,244 @@
+"""Share one source stream between identical subscriptions.
+
+Without multiplexing every subscription runs its own source resolver and
+executes every event on its own, even when thousands of clients subscribe to
+the same operation with the same variables. With multiplexing enabled,
+identical subscriptions join a single shared stream: the source resolver runs
+once, each event is executed once and the same result object is handed to
+every subscriber.
+
+```python
+import strawberry
+from strawberry.schema.config import StrawberryConfig
+from strawberry.subscriptions.multiplexer import SubscriptionMultiplexingConfig
+
+schema = strawberry.Schema(
+    query=Query,
+    subscription=Subscription,
+    config=StrawberryConfig(
+        subscription_multiplexing=SubscriptionMultiplexingConfig(
+            context_key=lambda context: context["request"].user.id,
+        )
+    ),
+)
+```
+
+Two subscriptions are identical when they have the same document, operation
+name, variables, operation extensions and context key. The shared stream is
+executed with the context and root value of the subscription that started it,
+and keeps using them after that subscription leaves, so `context_key` must
+only treat contexts as equal when they are interchangeable.
+
+Subscribers that fall more than `max_buffered_events` events behind are
+disconnected with a `SubscriptionOverflowError`, so that one slow client
+can't stall the stream of every other subscriber.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from strawberry.persisted_documents import compute_document_id
+from strawberry.utils.aio import aclosing
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Hashable
+
+    from strawberry.types.execution import ExecutionContext
+
+
+_COMPLETE = object()
+_OVERFLOW = object()
+
+
+class SubscriptionOverflowError(Exception):
+    """Raised to a subscriber that fell too far behind its shared stream."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Subscription fell too far behind and was disconnected, "
+            "subscribe again to resume receiving events"
+        )
+
+
+@dataclass
+class SubscriptionMultiplexingConfig:
+    """Configuration for subscription multiplexing.
+
+    Attributes:
+        context_key: Returns the part of a subscription's context that can
+            change its results, for example the id of the current user.
+            Subscriptions are only shared when their context keys are equal,
+            return a constant to share subscriptions between all clients.
+            The shared stream runs with the context of the subscription that
+            started it, even after that subscription leaves, so contexts with
+            equal keys must be interchangeable.
+        max_buffered_events: How many events are buffered for each subscriber.
+            A subscriber that falls further behind is disconnected with a
+            `SubscriptionOverflowError` instead of stalling the shared stream.
+            If `None` buffers grow without bound.
+    """
+
+    context_key: Callable[[Any], Hashable]
+    max_buffered_events: int | None = 100
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+
+    # Raises `TypeError` for values that can't be compared safely
+    hash(value)
+    return type(value), value
+
+
+class _SharedSubscription:
+    def __init__(
+        self,
+        multiplexer: SubscriptionMultiplexer,
+        key: Hashable,
+        source: AsyncGenerator[Any, None],
+    ) -> None:
+        self.multiplexer = multiplexer
+        self.key = key
+        self.subscribers: list[asyncio.Queue[Any]] = []
+        self.done = False
+        self.task = asyncio.create_task(self.run(source))
+
+    def add_subscriber(self) -> asyncio.Queue[Any]:
+        # Unbounded, so that the stream never waits to put an event or the end
+        # marker, `max_buffered_events` is enforced by `publish`
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        self.subscribers.append(queue)
+
+        return queue
+
+    def disconnect(self, queue: asyncio.Queue[Any]) -> None:
+        self.subscribers.remove(queue)
+
+        # Drop the events it didn't read, it only gets the error now
+        while not queue.empty():
+            queue.get_nowait()
+
+        queue.put_nowait(_OVERFLOW)
+
+    def publish(self, result: Any) -> None:
+        max_buffered_events = self.multiplexer.config.max_buffered_events
+
+        # Copy the list, slow subscribers are disconnected while we publish
+        for queue in tuple(self.subscribers):
+            if max_buffered_events and queue.qsize() >= max_buffered_events:
+                self.disconnect(queue)
+            else:
+                queue.put_nowait(result)
+
+    async def remove_subscriber(self, queue: asyncio.Queue[Any]) -> None:
+        # Disconnected subscribers were already removed
+        if queue in self.subscribers:
+            self.subscribers.remove(queue)
+
+        if not self.subscribers and not self.done:
+            await self.close()
+
+    async def close(self) -> None:
+        self.done = True
+        self.multiplexer._forget(self)
+        self.task.cancel()
+
+        # Like unshared subscriptions, the source is closed once we return
+        await asyncio.wait((self.task,))
+
+    async def run(self, source: AsyncGenerator[Any, None]) -> None:
+        try:
+            async with aclosing(source):
+                async for result in source:
+                    self.publish(result)
+
+                    # Every subscriber was too slow, nobody is left to stream to
+                    if not self.subscribers:
+                        return
+        finally:
+            self.done = True
+            self.multiplexer._forget(self)
+
+            for queue in self.subscribers:
+                queue.put_nowait(_COMPLETE)
+
+
+class SubscriptionMultiplexer:
+    """Dedupe identical subscriptions into shared source streams."""
+
+    def __init__(self, config: SubscriptionMultiplexingConfig) -> None:
+        self.config = config
+        self._shared: dict[Hashable, _SharedSubscription] = {}
+
+    def __len__(self) -> int:
+        return len(self._shared)
+
+    def get_key(self, execution_context: ExecutionContext) -> Hashable | None:
+        """Return the identity of a subscription, `None` if it can't be shared."""
+        if execution_context.query is None:
+            return None
+
+        try:
+            return (
+                compute_document_id(execution_context.query),
+                execution_context.operation_name,
+                _freeze(execution_context.variables or {}),
+                _freeze(execution_context.operation_extensions or {}),
+                _freeze(self.config.context_key(execution_context.context)),
+            )
+        except TypeError:
+            return None
+
+    async def subscribe(
+        self,
+        key: Hashable,
+        create_source: Callable[[], AsyncGenerator[Any, None]],
+    ) -> AsyncGenerator[Any, None]:
+        """Stream the results of the shared subscription with the given key.
+
+        The source is created by the first subscriber, later subscribers only
+        receive the results produced after they joined. The source is closed
+        when its last subscriber leaves.
+
+        Raises:
+            SubscriptionOverflowError: When the subscriber falls more than
+                `max_buffered_events` results behind the shared stream.
+        """
+        shared = self._shared.get(key)
+
+        if shared is None or shared.done:
+            shared = self._shared[key] = _SharedSubscription(self, key, create_source())
+
+        queue = shared.add_subscriber()
+
+        try:
+            while True:
+                result = await queue.get()
+
+                if result is _COMPLETE:
+                    return
+
+                if result is _OVERFLOW:
+                    raise SubscriptionOverflowError
+
+                yield result
+        finally:
+            await shared.remove_subscriber(queue)
+
+    def _forget(self, shared: _SharedSubscription) -> None:
+        if self._shared.get(shared.key) is shared:
+            del self._shared[shared.key]
+
+
+__all__ = [
+    "SubscriptionMultiplexer",
+    "SubscriptionMultiplexingConfig",
+    "SubscriptionOverflowError",
+]
@@ -19,16 +19,17 @@ from strawberry.http.exceptions import (
     WebSocketDisconnected,
 )
 from strawberry.http.typevars import Context, RootValue
+from strawberry.http.websocket_frames import encode_message_frame
 from strawberry.schema.exceptions import CannotGetOperationTypeError
 from strawberry.subscriptions.protocols.graphql_transport_ws.types import (
     CompleteMessage,
     ConnectionInitMessage,
     Message,
-    NextMessagePayload,
     PingMessage,
     PongMessage,
     SubscribeMessage,
 )
+from strawberry.subscriptions.scheduler import WebSocketScheduler, execution_limit
 from strawberry.types.execution import ExecutionResult, PreExecutionError
 from strawberry.types.unset import UnsetType
 from strawberry.utils.aio import aclosing
@@ -70,6 +71,9 @@ class BaseGraphQLTransportWSHandler(Generic[Context, RootValue]):
         self.connection_acknowledged = False
         self.connection_timed_out = False
         self.operations: dict[str, Operation[Context, RootValue]] = {}
+        self.scheduler = WebSocketScheduler(
+            view.max_concurrent_executions_per_connection
+        )
 
     async def handle(self) -> None:
         self.on_request_accepted()
@@ -236,12 +240,16 @@ class BaseGraphQLTransportWSHandler(Generic[Context, RootValue]):
             )
             return
 
+        extensions = message["payload"].get("extensions")
+
         operation = Operation(
             self,
             message["id"],
             message["payload"]["query"],
             message["payload"].get("variables"),
             message["payload"].get("operationName"),
+            latest_value=isinstance(extensions, dict)
+            and extensions.get("latestValue") is True,
         )
 
         operation.task = asyncio.create_task(self.run_operation(operation))
@@ -250,6 +258,12 @@ class BaseGraphQLTransportWSHandler(Generic[Context, RootValue]):
 
     async def run_operation(self, operation: Operation[Context, RootValue]) -> None:
         """The operation task's top level method. Cleans-up and de-registers the operation once it is done."""
+        execution_limit.set(self.scheduler.execution_slots)
+        weight = await self.view.get_ws_operation_weight(
+            self.context, operation.operation_name
+        )
+        metrics = self.scheduler.add_operation(operation.id, weight)
+
         try:
             result_source = await self.schema.stream(
                 operation.query,
@@ -279,6 +293,9 @@ class BaseGraphQLTransportWSHandler(Generic[Context, RootValue]):
             self.operations.pop(operation.id, None)
 
             raise
+        finally:
+            self.scheduler.remove_operation(metrics)
+            await self.view.on_ws_operation_complete(self.context, metrics)
 
     async def _send_result_stream(
         self,
@@ -351,6 +368,26 @@ class BaseGraphQLTransportWSHandler(Generic[Context, RootValue]):
     async def send_message(self, message: Message) -> None:
         await self.websocket.send_json(message)
 
+    async def send_frame(
+        self, operation_id: str, frame: str, latest_value: bool = False
+    ) -> None:
+        """Send the already encoded `next` message of an operation.
+
+        Results are encoded once and sent as text frames, without going
+        through `send_message`. Override this method to log, filter or
+        re-encode them.
+
+        Args:
+            operation_id: The id of the operation sending the result.
+            frame: The encoded `next` message.
+            latest_value: Whether the frame can replace the previous one of
+                the operation still waiting to be sent.
+        """
+        if latest_value:
+            await self.websocket.send_latest(operation_id, frame)
+        else:
+            await self.websocket.send_text(frame)
+
     async def cleanup_operation(self, operation_id: str) -> None:
         if operation_id not in self.operations:
             return
@@ -368,6 +405,7 @@ class Operation(Generic[Context, RootValue]):
         "completed",
         "handler",
         "id",
+        "latest_value",
         "operation_name",
         "query",
         "task",
@@ -381,12 +419,15 @@ class Operation(Generic[Context, RootValue]):
         query: str,
         variables: dict[str, object] | None,
         operation_name: str | None,
+        latest_value: bool = False,
     ) -> None:
         self.handler = handler
         self.id = id
         self.query = query
         self.variables = variables
         self.operation_name = operation_name
+        # Slow clients only get the latest result of the operation
+        self.latest_value = latest_value
         self.completed = False
         self.task: asyncio.Task | None = None
 
@@ -397,7 +438,7 @@ class Operation(Generic[Context, RootValue]):
             self.completed = True
             # de-register the operation _before_ sending the final message
             self.handler.forget_id(self.id)
-        await self.handler.send_message(message)
+        await self.handler.scheduler.send(self.id, self.handler.send_message, message)
 
     async def send_initial_errors(self, errors: list[GraphQLError]) -> None:
         # Initial errors see https://github.com/enisdenjo/graphql-ws/blob/master/PROTOCOL.md#error
@@ -412,16 +453,15 @@ class Operation(Generic[Context, RootValue]):
         )
 
     async def send_next(self, execution_result: ExecutionResult) -> None:
-        next_payload: NextMessagePayload = {"data": execution_result.data}
-
-        if execution_result.errors:
-            next_payload["errors"] = [err.formatted for err in execution_result.errors]
+        if self.completed:
+            return
 
-        if execution_result.extensions:
-            next_payload["extensions"] = execution_result.extensions
+        # Encoded once per result, however many operations send it
+        payload = self.handler.view.websocket_payload_cache.encode(execution_result)
+        frame = encode_message_frame("next", self.id, payload)
 
-        await self.send_operation_message(
-            {"id": self.id, "type": "next", "payload": next_payload}
+        await self.handler.scheduler.send(
+            self.id, self.handler.send_frame, self.id, frame, self.latest_value
         )
 
 
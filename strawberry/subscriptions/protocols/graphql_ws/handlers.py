@@ -13,16 +13,17 @@ from typing import (
 from strawberry.exceptions import ConnectionRejectionError
 from strawberry.http.exceptions import NonTextMessageReceived, WebSocketDisconnected
 from strawberry.http.typevars import Context, RootValue
+from strawberry.http.websocket_frames import encode_message_frame
 from strawberry.subscriptions.protocols.graphql_ws.types import (
     CompleteMessage,
     ConnectionInitMessage,
     ConnectionTerminateMessage,
-    DataMessage,
     ErrorMessage,
     OperationMessage,
     StartMessage,
     StopMessage,
 )
+from strawberry.subscriptions.scheduler import WebSocketScheduler
 from strawberry.types.execution import ExecutionResult, PreExecutionError
 from strawberry.types.unset import UnsetType
 
@@ -56,7 +57,11 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
         self.keep_alive_task: asyncio.Task | None = None
         self.subscriptions: dict[str, AsyncGenerator] = {}
         self.tasks: dict[str, asyncio.Task] = {}
+        # Operations whose slow clients only get the latest result
+        self.latest_value_operations: set[str] = set()
         self.connection_acknowledged: bool = False
+        # graphql-ws only runs subscriptions, so executions are never limited
+        self.scheduler = WebSocketScheduler()
 
     async def handle(self) -> None:
         try:
@@ -160,6 +165,12 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
         query = payload["query"]
         operation_name = payload.get("operationName")
         variables = payload.get("variables")
+        extensions = payload.get("extensions")
+
+        if isinstance(extensions, dict) and extensions.get("latestValue") is True:
+            self.latest_value_operations.add(operation_id)
+        else:
+            self.latest_value_operations.discard(operation_id)
 
         result_handler = self.handle_async_results(
             operation_id, query, operation_name, variables
@@ -183,6 +194,9 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
         operation_name: str | None,
         variables: dict[str, object] | None,
     ) -> None:
+        weight = await self.view.get_ws_operation_weight(self.context, operation_name)
+        metrics = self.scheduler.add_operation(operation_id, weight)
+
         try:
             result_source = await self.schema.subscribe(
                 query=query,
@@ -199,7 +213,7 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
                 if is_first_result and isinstance(result, PreExecutionError):
                     assert result.errors
 
-                    await self.send_message(
+                    await self.send_operation_message(
                         ErrorMessage(
                             type="error",
                             id=operation_id,
@@ -211,10 +225,17 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
                 await self.send_data_message(result, operation_id)
                 is_first_result = False
 
-            await self.send_message(CompleteMessage(type="complete", id=operation_id))
+            await self.send_operation_message(
+                CompleteMessage(type="complete", id=operation_id)
+            )
 
         except asyncio.CancelledError:
-            await self.send_message(CompleteMessage(type="complete", id=operation_id))
+            await self.send_operation_message(
+                CompleteMessage(type="complete", id=operation_id)
+            )
+        finally:
+            self.scheduler.remove_operation(metrics)
+            await self.view.on_ws_operation_complete(self.context, metrics)
 
     async def cleanup_operation(self, operation_id: str) -> None:
         if operation_id in self.subscriptions:
@@ -226,6 +247,7 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
         with suppress(BaseException):
             await self.tasks[operation_id]
         del self.tasks[operation_id]
+        self.latest_value_operations.discard(operation_id)
 
     async def cleanup(self) -> None:
         for operation_id in list(self.tasks.keys()):
@@ -234,24 +256,45 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
     async def send_data_message(
         self, execution_result: ExecutionResult, operation_id: str
     ) -> None:
-        data_message: DataMessage = {
-            "type": "data",
-            "id": operation_id,
-            "payload": {"data": execution_result.data},
-        }
-
-        if execution_result.errors:
-            data_message["payload"]["errors"] = [
-                err.formatted for err in execution_result.errors
-            ]
-
-        if execution_result.extensions:
-            data_message["payload"]["extensions"] = execution_result.extensions
+        # Encoded once per result, however many operations send it
+        payload = self.view.websocket_payload_cache.encode(execution_result)
+        frame = encode_message_frame("data", operation_id, payload)
+
+        await self.scheduler.send(
+            operation_id,
+            self.send_frame,
+            operation_id,
+            frame,
+            operation_id in self.latest_value_operations,
+        )
 
-        await self.send_message(data_message)
+    async def send_operation_message(
+        self, message: ErrorMessage | CompleteMessage
+    ) -> None:
+        await self.scheduler.send(message["id"], self.send_message, message)
 
     async def send_message(self, message: OperationMessage) -> None:
         await self.websocket.send_json(message)
 
+    async def send_frame(
+        self, operation_id: str, frame: str, latest_value: bool = False
+    ) -> None:
+        """Send the already encoded `data` message of an operation.
+
+        Results are encoded once and sent as text frames, without going
+        through `send_message`. Override this method to log, filter or
+        re-encode them.
+
+        Args:
+            operation_id: The id of the operation sending the result.
+            frame: The encoded `data` message.
+            latest_value: Whether the frame can replace the previous one of
+                the operation still waiting to be sent.
+        """
+        if latest_value:
+            await self.websocket.send_latest(operation_id, frame)
+        else:
+            await self.websocket.send_text(frame)
+
 
 __all__ = ["BaseGraphQLWSHandler"]
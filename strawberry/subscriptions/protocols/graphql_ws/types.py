@@ -13,6 +13,7 @@ class StartMessagePayload(TypedDict):
     query: str
     variables: NotRequired[dict[str, object]]
     operationName: NotRequired[str]
+    extensions: NotRequired[dict[str, object]]
 
 
 class StartMessage(TypedDict):
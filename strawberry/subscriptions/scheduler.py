@@ -0,0 +1,184 @@
+"""Share a WebSocket connection fairly between its operations.
+
+Every operation of a connection writes its messages to the same socket. The
+`WebSocketScheduler` of a connection orders concurrent writes with weighted
+fair queuing: each message gets a virtual finish time that grows faster for
+operations sending more, relative to their weight, and waiting messages are
+written in order of finish time. A chatty subscription therefore can't delay
+the messages of the other operations of its connection, and because each
+operation waits for its turn, it can't queue more than one message at a time.
+
+The scheduler also measures the queue depth and send latency of each
+operation, and limits how many queries and mutations of a connection execute
+at the same time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+# The limit of concurrent query and mutation executions of the current
+# connection, checked by the schema when it executes an operation
+execution_limit: ContextVar[asyncio.Semaphore | None] = ContextVar(
+    "execution_limit", default=None
+)
+
+
+@dataclass
+class OperationMetrics:
+    """Metrics of the messages sent by an operation.
+
+    Attributes:
+        operation_id: The id of the operation.
+        weight: The share of the connection given to the operation.
+        queued: The number of messages waiting for the socket.
+        max_queued: The highest number of messages waiting for the socket.
+        sent: The number of messages sent.
+        send_latency: The total time spent waiting for and writing to the
+            socket, in seconds.
+        max_send_latency: The longest time taken to send a message, in seconds.
+    """
+
+    operation_id: str
+    weight: float = 1.0
+    queued: int = 0
+    max_queued: int = 0
+    sent: int = 0
+    send_latency: float = 0
+    max_send_latency: float = 0
+
+    @property
+    def average_send_latency(self) -> float:
+        return self.send_latency / self.sent if self.sent else 0
+
+
+class WebSocketScheduler:
+    """Order the messages sent by the operations of a connection."""
+
+    def __init__(self, max_concurrent_executions: int | None = None) -> None:
+        """Initialize the WebSocketScheduler.
+
+        Args:
+            max_concurrent_executions: How many queries and mutations of the
+                connection can execute at the same time. If `None` they are
+                not limited.
+        """
+        self.metrics: dict[str, OperationMetrics] = {}
+        self.execution_slots = (
+            asyncio.Semaphore(max_concurrent_executions)
+            if max_concurrent_executions is not None
+            else None
+        )
+        self._virtual_time = 0.0
+        self._finish_times: dict[str, float] = {}
+        self._waiting: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._sending = False
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of messages waiting for the socket."""
+        return sum(not waiter.done() for *_, waiter in self._waiting)
+
+    def add_operation(self, operation_id: str, weight: float = 1.0) -> OperationMetrics:
+        if weight <= 0:
+            raise ValueError("Operation weights must be positive")
+
+        metrics = self.metrics[operation_id] = OperationMetrics(operation_id, weight)
+
+        return metrics
+
+    def remove_operation(self, metrics: OperationMetrics) -> None:
+        # The id may already have been reused by another operation
+        if self.metrics.get(metrics.operation_id) is metrics:
+            del self.metrics[metrics.operation_id]
+            self._finish_times.pop(metrics.operation_id, None)
+
+    async def send(
+        self,
+        operation_id: str,
+        send: Callable[..., Awaitable[None]],
+        *args: Any,
+    ) -> None:
+        """Call `send(*args)` once it is the turn of the operation."""
+        started_at = time.perf_counter()
+        metrics = self.metrics.get(operation_id)
+        weight = metrics.weight if metrics else 1.0
+
+        finish_time = (
+            max(self._virtual_time, self._finish_times.get(operation_id, 0.0))
+            + 1 / weight
+        )
+        self._finish_times[operation_id] = finish_time
+
+        if self._sending:
+            await self._wait_turn(finish_time, metrics)
+        else:
+            self._sending = True
+
+        self._virtual_time = finish_time
+
+        try:
+            await send(*args)
+        finally:
+            self._next_turn()
+
+        if metrics is not None:
+            latency = time.perf_counter() - started_at
+            metrics.sent += 1
+            metrics.send_latency += latency
+            metrics.max_send_latency = max(metrics.max_send_latency, latency)
+
+    async def _wait_turn(
+        self, finish_time: float, metrics: OperationMetrics | None
+    ) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (finish_time, next(self._counter), waiter))
+
+        if metrics is not None:
+            metrics.queued += 1
+            metrics.max_queued = max(metrics.max_queued, metrics.queued)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Pass the turn on if it was given to us while being cancelled
+            if waiter.done() and not waiter.cancelled():
+                self._next_turn()
+
+            raise
+        finally:
+            if metrics is not None:
+                metrics.queued -= 1
+
+    def _next_turn(self) -> None:
+        if not self._waiting:
+            self._sending = False
+            return
+
+        # Give the turn on the next iteration of the loop, once the operation
+        # that just sent had a chance to queue its next message
+        asyncio.get_running_loop().call_soon(self._give_turn)
+
+    def _give_turn(self) -> None:
+        while self._waiting:
+            *_, waiter = heapq.heappop(self._waiting)
+
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._sending = False
+
+
+__all__ = ["OperationMetrics", "WebSocketScheduler", "execution_limit"]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import inspect
+from collections import OrderedDict
+from functools import cache
 from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
+    TypeAlias,
     cast,
     get_args,
     get_origin,
@@ -22,10 +25,11 @@ from strawberry.types.base import (
 from strawberry.types.enum import StrawberryEnumDefinition, has_enum_definition
 from strawberry.types.lazy_type import LazyType, StrawberryLazyReference
 from strawberry.types.maybe import Some
+from strawberry.types.private import is_private
 from strawberry.types.unset import UNSET
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Iterable, Mapping
 
     from strawberry.schema.config import StrawberryConfig
     from strawberry.types.base import StrawberryType
@@ -135,134 +139,305 @@ class StrawberryArgument:
         return isinstance(self.type, StrawberryMaybe)
 
 
-def _is_leaf_type(
-    type_: StrawberryType | type,
-    scalar_registry: Mapping[object, ScalarWrapper | ScalarDefinition],
-    skip_classes: tuple[type, ...] = (),
-) -> bool:
-    if type_ in skip_classes:
-        return False
+ArgumentConverter: TypeAlias = "Callable[[Any], Any]"
+ArgumentsConverter: TypeAlias = "Callable[[Mapping[str, Any]], dict[str, Any]]"
 
-    if is_scalar(type_, scalar_registry):
-        return True
 
-    if isinstance(type_, StrawberryEnumDefinition):
-        return True
+def _convert_leaf(value: object) -> object:
+    return value
 
-    if isinstance(type_, LazyType):
-        return _is_leaf_type(type_.resolve_type(), scalar_registry)
 
-    return False
+@cache
+def _get_global_id_converters() -> tuple[ArgumentConverter, ArgumentConverter]:
+    """Return the converters of global ids and lists of global ids.
 
+    They're created once, when first used, since `strawberry.relay` can't be
+    imported by this module.
+    """
+    from strawberry.relay.types import GlobalID
 
-def _is_optional_leaf_type(
-    type_: StrawberryType | type,
-    scalar_registry: Mapping[object, ScalarWrapper | ScalarDefinition],
-    skip_classes: tuple[type, ...] = (),
-) -> bool:
-    if type_ in skip_classes:
-        return False
+    from_id = GlobalID.from_id
+    from_ids = GlobalID.from_ids
 
-    if isinstance(type_, StrawberryOptional):
-        return _is_leaf_type(type_.of_type, scalar_registry, skip_classes)
+    def convert_global_id(value: object) -> object:
+        if value is None or value is UNSET:
+            return value
+
+        return from_id(value)  # type: ignore[arg-type]
 
-    return False
+    def convert_global_id_list(value: object) -> object:
+        if value is None or value is UNSET:
+            return value
 
+        values = cast("list", value)
 
-def convert_argument(
-    value: object,
+        # Nullable items are converted one by one
+        if None in values:
+            return [convert_global_id(item) for item in values]
+
+        return from_ids(values)
+
+    return convert_global_id, convert_global_id_list
+
+
+def _convert_no_arguments(value: Mapping[str, Any]) -> dict[str, Any]:
+    return {}
+
+
+def build_argument_converter(
     type_: StrawberryType | type,
     scalar_registry: Mapping[object, ScalarWrapper | ScalarDefinition],
     config: StrawberryConfig,
-) -> object:
+    converters: dict[type, ArgumentConverter] | None = None,
+) -> ArgumentConverter:
+    """Build a function that converts raw argument values of the given type.
+
+    All the type dispatching is done once, when building the converter, so
+    that converting a value only has to run the prebuilt closures.
+
+    Args:
+        type_: The Strawberry type of the values to convert
+        scalar_registry: The scalar registry of the schema
+        config: The config of the schema
+        converters: Cache of converters for input types, keyed by type.
+            Sharing it avoids rebuilding the converter of an input type used
+            in many places and allows building recursive input types.
+
+    Returns:
+        A function that takes the raw value and returns the converted value
+    """
     from strawberry.relay.types import GlobalID
 
+    convert_global_id, convert_global_id_list = _get_global_id_converters()
+
+    if converters is None:
+        converters = {}
+
     # TODO: move this somewhere else and make it first class
     # Handle StrawberryMaybe first, since it extends StrawberryOptional
     if isinstance(type_, StrawberryMaybe):
         # Check if this is Maybe[T | None] (has StrawberryOptional as of_type)
         if isinstance(type_.of_type, StrawberryOptional):
             # This is Maybe[T | None] - allows null values
-            res = convert_argument(value, type_.of_type, scalar_registry, config)
+            convert_optional = build_argument_converter(
+                type_.of_type, scalar_registry, config, converters
+            )
 
-            return Some(res)
+            def convert_maybe_optional(value: object) -> object:
+                return Some(convert_optional(value))
 
-        if value is None:
-            from strawberry.exceptions import StrawberryGraphQLError
+            return convert_maybe_optional
 
-            type_name = getattr(type_.of_type, "__name__", str(type_.of_type))
-            raise StrawberryGraphQLError(
-                f"Expected value of type '{type_name}', found null. "
-                f"Field of type 'Maybe[{type_name}]' cannot be explicitly set to null. "
-                f"Use 'Maybe[{type_name} | None]' if you need to allow null values."
-            )
+        convert_of_type = build_argument_converter(
+            type_.of_type, scalar_registry, config, converters
+        )
+        type_name = getattr(type_.of_type, "__name__", str(type_.of_type))
+
+        def convert_maybe(value: object) -> object:
+            if value is None:
+                from strawberry.exceptions import StrawberryGraphQLError
 
-        # This is Maybe[T] - validation for null values is handled by MaybeNullValidationRule
-        # Convert the value and wrap in Some()
-        res = convert_argument(value, type_.of_type, scalar_registry, config)
+                raise StrawberryGraphQLError(
+                    f"Expected value of type '{type_name}', found null. "
+                    f"Field of type 'Maybe[{type_name}]' cannot be explicitly set to null. "
+                    f"Use 'Maybe[{type_name} | None]' if you need to allow null values."
+                )
 
-        return Some(res)
+            # This is Maybe[T] - validation for null values is handled by
+            # MaybeNullValidationRule. Convert the value and wrap in Some()
+            return Some(convert_of_type(value))
+
+        return convert_maybe
 
     # Handle regular StrawberryOptional (not Maybe)
     if isinstance(type_, StrawberryOptional):
-        return convert_argument(value, type_.of_type, scalar_registry, config)
-
-    if value is None:
-        return None
+        return build_argument_converter(
+            type_.of_type, scalar_registry, config, converters
+        )
 
-    if value is UNSET:
-        return UNSET
+    if isinstance(type_, LazyType):
+        return build_argument_converter(
+            type_.resolve_type(), scalar_registry, config, converters
+        )
 
     if isinstance(type_, StrawberryList):
-        value_list = cast("Iterable", value)
+        convert_item = build_argument_converter(
+            type_.of_type, scalar_registry, config, converters
+        )
 
-        if _is_leaf_type(
-            type_.of_type, scalar_registry, skip_classes=(GlobalID,)
-        ) or _is_optional_leaf_type(
-            type_.of_type, scalar_registry, skip_classes=(GlobalID,)
-        ):
-            return value_list
+        # Lists of leaf values are already coerced by GraphQL core
+        if convert_item is _convert_leaf:
+            return _convert_leaf
 
-        value_list = cast("Iterable", value)
+        # Lists of global ids are parsed at once
+        if convert_item is convert_global_id:
+            return convert_global_id_list
 
-        return [
-            convert_argument(x, type_.of_type, scalar_registry, config)
-            for x in value_list
-        ]
+        def convert_list(value: object) -> object:
+            if value is None or value is UNSET:
+                return value
 
-    if _is_leaf_type(type_, scalar_registry):
-        if type_ is GlobalID:
-            return GlobalID.from_id(value)  # type: ignore
+            return [convert_item(item) for item in cast("Iterable", value)]
 
-        return value
+        return convert_list
 
-    if isinstance(type_, LazyType):
-        return convert_argument(value, type_.resolve_type(), scalar_registry, config)
+    if type_ is GlobalID:
+        return convert_global_id
 
-    if has_enum_definition(type_):
-        enum_definition: StrawberryEnumDefinition = type_.__strawberry_definition__
-        return convert_argument(value, enum_definition, scalar_registry, config)
+    if (
+        is_scalar(type_, scalar_registry)
+        or isinstance(type_, StrawberryEnumDefinition)
+        or has_enum_definition(type_)
+    ):
+        return _convert_leaf
 
     if has_object_definition(type_):
-        kwargs = {}
+        object_type = cast("type", type_)
+
+        if object_type in converters:
+            return converters[object_type]
 
         type_definition = type_.__strawberry_definition__
-        for field in type_definition.fields:
+        fields: list[tuple[str, str, ArgumentConverter]] = []
+
+        def convert_object(value: object) -> object:
+            if value is None or value is UNSET:
+                return value
+
             value = cast("Mapping", value)
-            graphql_name = config.name_converter.from_field(field)
-
-            if graphql_name in value:
-                kwargs[field.python_name] = convert_argument(
-                    value[graphql_name],
-                    field.resolve_type(type_definition=type_definition),
-                    scalar_registry,
-                    config,
+            kwargs = {}
+
+            for graphql_name, python_name, convert_field in fields:
+                if graphql_name in value:
+                    kwargs[python_name] = convert_field(value[graphql_name])
+
+            return object_type(**kwargs)
+
+        # Register the converter before building the fields' converters,
+        # so that recursive input types reuse it instead of looping forever
+        converters[object_type] = convert_object
+
+        for field in type_definition.fields:
+            if is_private(field.type):
+                continue
+
+            fields.append(
+                (
+                    config.name_converter.from_field(field),
+                    field.python_name,
+                    build_argument_converter(
+                        field.resolve_type(type_definition=type_definition),
+                        scalar_registry,
+                        config,
+                        converters,
+                    ),
                 )
+            )
+
+        return convert_object
+
+    def convert_unsupported(value: object) -> object:
+        if value is None or value is UNSET:
+            return value
 
-        type_ = cast("type", type_)
-        return type_(**kwargs)
+        raise UnsupportedTypeError(type_)
 
-    raise UnsupportedTypeError(type_)
+    return convert_unsupported
+
+
+def build_arguments_converter(
+    arguments: list[StrawberryArgument],
+    scalar_registry: Mapping[object, ScalarWrapper | ScalarDefinition],
+    config: StrawberryConfig,
+    converters: dict[type, ArgumentConverter] | None = None,
+) -> ArgumentsConverter:
+    """Build a function that converts a field's raw arguments to actual types.
+
+    The returned function behaves like `convert_arguments`, but the argument
+    names and converters are computed only once.
+    """
+    if not arguments:
+        return _convert_no_arguments
+
+    if converters is None:
+        converters = {}
+
+    argument_converters: list[tuple[str, str, ArgumentConverter]] = []
+
+    for argument in arguments:
+        assert argument.python_name
+
+        argument_converters.append(
+            (
+                config.name_converter.from_argument(argument),
+                argument.python_name,
+                build_argument_converter(
+                    argument.type, scalar_registry, config, converters
+                ),
+            )
+        )
+
+    def convert(value: Mapping[str, Any]) -> dict[str, Any]:
+        kwargs = {}
+
+        for name, python_name, convert_value in argument_converters:
+            if name in value:
+                kwargs[python_name] = convert_value(value[name])
+
+        return kwargs
+
+    return convert
+
+
+CONVERTERS_CACHE_SIZE = 256
+
+# The most recently used converters built by `convert_argument` and
+# `convert_arguments`, for callers without a schema. Code with a schema uses
+# the converters of its schema converter instead. Converters are cached by
+# type (or arguments) and by the ids of the scalar registry and config, which
+# are kept with each converter so that their ids aren't reused by other
+# objects while the converter is cached.
+_cached_converters: OrderedDict[
+    tuple[object, int, int],
+    tuple[Callable[[Any], Any], Mapping[object, Any], StrawberryConfig],
+] = OrderedDict()
+
+
+def _get_cached_converter(
+    key: object,
+    scalar_registry: Mapping[object, ScalarWrapper | ScalarDefinition],
+    config: StrawberryConfig,
+    build: Callable[[], Callable[[Any], Any]],
+) -> Callable[[Any], Any]:
+    cache_key = (key, id(scalar_registry), id(config))
+
+    if (cached := _cached_converters.get(cache_key)) is not None:
+        _cached_converters.move_to_end(cache_key)
+        return cached[0]
+
+    converter = build()
+    _cached_converters[cache_key] = (converter, scalar_registry, config)
+
+    if len(_cached_converters) > CONVERTERS_CACHE_SIZE:
+        _cached_converters.popitem(last=False)
+
+    return converter
+
+
+def convert_argument(
+    value: object,
+    type_: StrawberryType | type,
+    scalar_registry: Mapping[object, ScalarWrapper | ScalarDefinition],
+    config: StrawberryConfig,
+) -> object:
+    convert = _get_cached_converter(
+        type_,
+        scalar_registry,
+        config,
+        lambda: build_argument_converter(type_, scalar_registry, config),
+    )
+
+    return convert(value)
 
 
 def convert_arguments(
@@ -279,24 +454,14 @@ def convert_arguments(
     if not arguments:
         return {}
 
-    kwargs = {}
-
-    for argument in arguments:
-        assert argument.python_name
-
-        name = config.name_converter.from_argument(argument)
-
-        if name in value:
-            current_value = value[name]
-
-            kwargs[argument.python_name] = convert_argument(
-                value=current_value,
-                type_=argument.type,
-                config=config,
-                scalar_registry=scalar_registry,
-            )
+    convert = _get_cached_converter(
+        tuple(arguments),
+        scalar_registry,
+        config,
+        lambda: build_arguments_converter(arguments, scalar_registry, config),
+    )
 
-    return kwargs
+    return convert(value)
 
 
 def argument(
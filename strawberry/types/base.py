@@ -480,7 +480,59 @@ class StrawberryObjectDefinition(StrawberryType):
         return any(isinstance(directive, OneOf) for directive in self.directives)
 
 
+# The number of objects' keys the type resolvers of unions and interfaces
+# remember, which is only reached when types are created dynamically
+TYPE_RESOLUTION_CACHE_SIZE = 1024
+
+
+def get_type_resolution_key(root: Any) -> tuple[Any, ...] | None:
+    """Get a key to cache the concrete type an object is resolved to.
+
+    `StrawberryObjectDefinition.is_implemented_by` only looks at the type of
+    the object and, for generic types, at the type of the values of its
+    generic fields, so this returns those types: objects with the same key
+    are implemented by the same types.
+
+    Returns `None` if the object can't be checked with `is_implemented_by`.
+    """
+    if not has_object_definition(root):
+        return None
+
+    type_definition = root.__strawberry_definition__
+
+    if not type_definition.is_graphql_generic:
+        return (type(root),)
+
+    key: list[Any] = [type(root)]
+
+    for field in type_definition.fields:
+        if not field.is_graphql_generic:
+            continue
+
+        value = getattr(root, field.name)
+        generic_field_type = field.type
+
+        while isinstance(generic_field_type, StrawberryList):
+            generic_field_type = generic_field_type.of_type
+
+            if not isinstance(value, (list, tuple)):
+                return None
+
+            if len(value) == 0:
+                # Any type matches an empty list, like in `is_implemented_by`
+                key.append(None)
+                return tuple(key)
+
+            value = value[0]
+
+        if isinstance(generic_field_type, StrawberryTypeVar):
+            key.append(type(value))
+
+    return tuple(key)
+
+
 __all__ = [
+    "TYPE_RESOLUTION_CACHE_SIZE",
     "StrawberryContainer",
     "StrawberryList",
     "StrawberryObjectDefinition",
@@ -489,5 +541,6 @@ __all__ = [
     "StrawberryTypeVar",
     "WithStrawberryObjectDefinition",
     "get_object_definition",
+    "get_type_resolution_key",
     "has_object_definition",
 ]
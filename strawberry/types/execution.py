@@ -52,6 +52,8 @@ class ExecutionContext:
     pre_execution_errors: list[GraphQLError] | None = None
     result: GraphQLExecutionResult | None = None
     extensions_results: dict[str, Any] = dataclasses.field(default_factory=dict)
+    # The id of the persisted document requested by the operation, if any
+    persisted_document_id: str | None = None
 
     operation_extensions: dict[str, Any] | None = None
 
@@ -9,6 +9,7 @@ from typing import (
 )
 from typing_extensions import TypeVar
 
+from .lookahead import get_lookahead
 from .nodes import convert_selections
 
 if TYPE_CHECKING:
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
     from strawberry.types.arguments import StrawberryArgument
     from strawberry.types.field import FieldType, StrawberryField
 
+    from .lookahead import LookaheadField
     from .nodes import Selection
 
 ContextType = TypeVar("ContextType", default=Any)
@@ -90,6 +92,11 @@ class Info(Generic[ContextType, RootValueType]):
         info = self._raw_info
         return convert_selections(info, info.field_nodes)
 
+    @cached_property
+    def lookahead(self) -> LookaheadField:
+        """The fields that will be resolved on the current field's result."""
+        return get_lookahead(self)
+
     @property
     def context(self) -> ContextType:
         """The context passed to the query execution."""
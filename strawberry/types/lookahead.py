@@ -0,0 +1,398 @@
+"""A typed view of the fields selected below the field being resolved.
+
+`Info.selected_fields` mirrors the raw selection set: fragments are kept as
+they were written, `@skip` and `@include` are not applied and the selections
+don't know about the schema. `Info.lookahead` instead returns the tree of
+fields that will actually be resolved, with fragments merged, conditional
+fields removed, arguments converted to their Python values, and each field
+linked to its `StrawberryField`. That's the information needed to build a
+single database query with the right joins and columns.
+
+Subfields are only computed when accessed. The fields collected from the
+selection sets of an operation only depend on its document and on the values
+of the variables used by `@skip` and `@include`, so they are kept on the
+operation and collected once, even across executions of documents kept by the
+`ParserCache` extension. Lookaheads themselves hold the variables and the
+converted arguments of an execution, and are never cached.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLIncludeDirective,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLSkipDirective,
+    GraphQLUnionType,
+    InlineFragmentNode,
+    get_named_type,
+)
+from graphql.execution.values import get_argument_values, get_directive_values
+from graphql.type.introspection import (
+    SchemaMetaFieldDef,
+    TypeMetaFieldDef,
+    TypeNameMetaFieldDef,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from graphql import (
+        FragmentDefinitionNode,
+        GraphQLField,
+        GraphQLOutputType,
+        GraphQLSchema,
+        NamedTypeNode,
+        OperationDefinitionNode,
+        SelectionSetNode,
+    )
+
+    from strawberry.schema import Schema
+    from strawberry.types.base import StrawberryType
+    from strawberry.types.field import StrawberryField
+    from strawberry.types.info import Info
+
+
+# The fields collected for each runtime type and field nodes, by the values of
+# the conditional variables
+CollectedFields: TypeAlias = "dict[Hashable, list[list[FieldNode]]]"
+
+
+class _OperationFields:
+    """The collected fields of an operation, which don't depend on a request."""
+
+    def __init__(
+        self,
+        operation: OperationDefinitionNode,
+        fragments: dict[str, FragmentDefinitionNode],
+    ) -> None:
+        from strawberry.execution.plan import get_conditional_variables
+
+        self.conditional_variables = tuple(
+            sorted(
+                {
+                    name
+                    for node in (operation, *fragments.values())
+                    for name in get_conditional_variables(node)
+                }
+            )
+        )
+        # Weak keys, so that parsed documents don't keep their schemas alive
+        self.fields: WeakKeyDictionary[Schema, CollectedFields] = WeakKeyDictionary()
+
+
+class _LookaheadContext(NamedTuple):
+    schema: Schema
+    fragments: dict[str, FragmentDefinitionNode]
+    variable_values: dict[str, Any]
+    collected_fields: CollectedFields
+    conditions: tuple[Any, ...]
+
+
+@dataclasses.dataclass
+class LookaheadField:
+    """A field selected in the current operation, with its subfields.
+
+    Attributes:
+        name:
+            The GraphQL name of the field
+        python_name:
+            The Python name of the field, the same as `name` for introspection
+            fields like `__typename`
+        alias:
+            The alias of the field, if any
+        parent_type:
+            The GraphQL name of the object type the field is resolved on
+        field:
+            The Strawberry field, or `None` for introspection fields
+        arguments:
+            The arguments of the field converted to their Python values, by
+            their Python name
+    """
+
+    name: str
+    python_name: str
+    alias: str | None
+    parent_type: str
+    field: StrawberryField | None
+    arguments: dict[str, Any]
+    _nodes: list[FieldNode] = dataclasses.field(repr=False, compare=False)
+    _return_type: GraphQLOutputType | None = dataclasses.field(
+        repr=False, compare=False
+    )
+    _context: _LookaheadContext = dataclasses.field(repr=False, compare=False)
+
+    @property
+    def response_key(self) -> str:
+        """The key of the field in the response."""
+        return self.alias or self.name
+
+    @property
+    def type(self) -> StrawberryType | type | None:
+        """The Strawberry type of the field, or `None` for introspection fields."""
+        return self.field.type if self.field is not None else None
+
+    @cached_property
+    def selections(self) -> list[LookaheadField]:
+        """The subfields that will be resolved for this field.
+
+        For fields returning an interface or a union, the subfields are
+        collected for every possible object type, and a subfield selected on
+        several types is returned once per type, with its `parent_type` set.
+        """
+        named_type = get_named_type(self._return_type)
+
+        if isinstance(named_type, GraphQLObjectType):
+            runtime_types = [named_type]
+        elif isinstance(named_type, (GraphQLInterfaceType, GraphQLUnionType)):
+            runtime_types = list(
+                self._context.schema._schema.get_possible_types(named_type)
+            )
+        else:
+            return []
+
+        return [
+            _build_lookahead(runtime_type, nodes, self._context)
+            for runtime_type in runtime_types
+            for nodes in _collect_subfields(runtime_type, self._nodes, self._context)
+        ]
+
+    def get(self, name: str, *, type_name: str | None = None) -> LookaheadField | None:
+        """Get a selected subfield by its Python name.
+
+        Args:
+            name:
+                The Python name of the subfield
+            type_name:
+                The GraphQL name of the object type the subfield is resolved
+                on, for fields returning an interface or a union
+
+        Returns:
+            The first matching subfield, or `None` if it isn't selected.
+        """
+        for selection in self.selections:
+            if selection.python_name == name and (
+                type_name is None or selection.parent_type == type_name
+            ):
+                return selection
+
+        return None
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+
+def _should_include(
+    node: FieldNode | InlineFragmentNode | FragmentSpreadNode,
+    variable_values: dict[str, Any],
+) -> bool:
+    skip = get_directive_values(GraphQLSkipDirective, node, variable_values)
+    if skip is not None and skip["if"] is True:
+        return False
+
+    include = get_directive_values(GraphQLIncludeDirective, node, variable_values)
+    return include is None or include["if"] is not False
+
+
+def _fragment_matches(
+    schema: GraphQLSchema,
+    type_condition: NamedTypeNode | None,
+    runtime_type: GraphQLObjectType,
+) -> bool:
+    if type_condition is None:
+        return True
+
+    conditional_type = schema.get_type(type_condition.name.value)
+
+    if conditional_type is runtime_type:
+        return True
+
+    if isinstance(conditional_type, (GraphQLInterfaceType, GraphQLUnionType)):
+        return schema.is_sub_type(conditional_type, runtime_type)
+
+    return False
+
+
+def _collect_fields(
+    runtime_type: GraphQLObjectType,
+    selection_set: SelectionSetNode,
+    context: _LookaheadContext,
+    fields: dict[str, list[FieldNode]],
+    visited_fragments: set[str],
+) -> None:
+    """Collect the fields of a selection set resolved on `runtime_type`.
+
+    This follows graphql-core's field collection: fields are grouped by their
+    response key, and fragments are merged if they apply to the type.
+    """
+    schema = context.schema._schema
+
+    for selection in selection_set.selections:
+        if not _should_include(selection, context.variable_values):  # type: ignore[arg-type]
+            continue
+
+        if isinstance(selection, FieldNode):
+            response_key = (selection.alias or selection.name).value
+            fields.setdefault(response_key, []).append(selection)
+        elif isinstance(selection, InlineFragmentNode):
+            if _fragment_matches(schema, selection.type_condition, runtime_type):
+                _collect_fields(
+                    runtime_type,
+                    selection.selection_set,
+                    context,
+                    fields,
+                    visited_fragments,
+                )
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment_name = selection.name.value
+
+            if fragment_name in visited_fragments:
+                continue
+
+            visited_fragments.add(fragment_name)
+            fragment = context.fragments.get(fragment_name)
+
+            if fragment is not None and _fragment_matches(
+                schema, fragment.type_condition, runtime_type
+            ):
+                _collect_fields(
+                    runtime_type,
+                    fragment.selection_set,
+                    context,
+                    fields,
+                    visited_fragments,
+                )
+
+
+def _collect_subfields(
+    runtime_type: GraphQLObjectType,
+    nodes: list[FieldNode],
+    context: _LookaheadContext,
+) -> list[list[FieldNode]]:
+    key = (runtime_type.name, *map(id, nodes), *context.conditions)
+    collected = context.collected_fields.get(key)
+
+    if collected is None:
+        fields: dict[str, list[FieldNode]] = {}
+        visited_fragments: set[str] = set()
+
+        for node in nodes:
+            if node.selection_set is not None:
+                _collect_fields(
+                    runtime_type,
+                    node.selection_set,
+                    context,
+                    fields,
+                    visited_fragments,
+                )
+
+        collected = context.collected_fields[key] = list(fields.values())
+
+    return collected
+
+
+def _get_field_def(
+    schema: GraphQLSchema, parent_type: GraphQLObjectType, name: str
+) -> GraphQLField | None:
+    if name == "__typename":
+        return TypeNameMetaFieldDef
+
+    if parent_type is schema.query_type:
+        if name == "__schema":
+            return SchemaMetaFieldDef
+
+        if name == "__type":
+            return TypeMetaFieldDef
+
+    return parent_type.fields.get(name)
+
+
+def _build_lookahead(
+    parent_type: GraphQLObjectType,
+    nodes: list[FieldNode],
+    context: _LookaheadContext,
+) -> LookaheadField:
+    from strawberry.schema.schema_converter import GraphQLCoreConverter
+
+    node = nodes[0]
+    name = node.name.value
+    schema = context.schema
+    field_def = _get_field_def(schema._schema, parent_type, name)
+    field: StrawberryField | None = None
+    arguments: dict[str, Any] = {}
+
+    if field_def is not None:
+        field = field_def.extensions.get(GraphQLCoreConverter.DEFINITION_BACKREF)
+
+    if field is not None and field.arguments:
+        convert_arguments = schema.schema_converter.get_arguments_converter(field)
+        arguments = convert_arguments(
+            get_argument_values(field_def, node, context.variable_values)  # type: ignore[arg-type]
+        )
+
+    return LookaheadField(
+        name=name,
+        python_name=field.python_name if field is not None else name,
+        alias=node.alias.value if node.alias else None,
+        parent_type=parent_type.name,
+        field=field,
+        arguments=arguments,
+        _nodes=nodes,
+        _return_type=field_def.type if field_def is not None else None,
+        _context=context,
+    )
+
+
+# Operation nodes keep their collected fields in this attribute, so they are
+# dropped with the parsed document
+_FIELDS_ATTRIBUTE = "_strawberry_lookahead_fields"
+
+
+def get_lookahead(info: Info) -> LookaheadField:
+    """Get the lookahead of the field being resolved.
+
+    Args:
+        info:
+            The strawberry execution info of the field
+
+    Returns:
+        The `LookaheadField` of the field, whose `selections` are the fields
+        that will be resolved on its result.
+    """
+    raw_info = info._raw_info
+    operation_fields: _OperationFields | None = getattr(
+        raw_info.operation, _FIELDS_ATTRIBUTE, None
+    )
+
+    if operation_fields is None:
+        operation_fields = _OperationFields(raw_info.operation, raw_info.fragments)
+        setattr(raw_info.operation, _FIELDS_ATTRIBUTE, operation_fields)
+
+    schema = info.schema
+    collected_fields = operation_fields.fields.get(schema)
+
+    if collected_fields is None:
+        collected_fields = operation_fields.fields[schema] = {}
+
+    variable_values = raw_info.variable_values
+    context = _LookaheadContext(
+        schema,
+        raw_info.fragments,
+        variable_values,
+        collected_fields,
+        tuple(
+            variable_values.get(name) for name in operation_fields.conditional_variables
+        ),
+    )
+
+    return _build_lookahead(raw_info.parent_type, list(raw_info.field_nodes), context)
+
+
+__all__ = ["LookaheadField", "get_lookahead"]
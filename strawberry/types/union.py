@@ -23,8 +23,10 @@ from strawberry.exceptions import (
 )
 from strawberry.exceptions.handler import should_use_rich_exceptions
 from strawberry.types.base import (
+    TYPE_RESOLUTION_CACHE_SIZE,
     StrawberryOptional,
     StrawberryType,
+    get_type_resolution_key,
     has_object_definition,
 )
 from strawberry.types.lazy_type import LazyType
@@ -166,6 +168,10 @@ class StrawberryUnion(StrawberryType):
         raise ValueError("Cannot use union type directly")
 
     def get_type_resolver(self, type_map: TypeMap) -> GraphQLTypeResolver:
+        # The names of the types resolved by matching against every known type,
+        # by the key of the object they were resolved for
+        resolved_types: dict[tuple[Any, ...], str] = {}
+
         def _resolve_union_type(
             root: Any, info: GraphQLResolveInfo, type_: GraphQLAbstractType
         ) -> str:
@@ -185,6 +191,11 @@ class StrawberryUnion(StrawberryType):
                 # Couldn't resolve using `is_type_of`
                 raise WrongReturnTypeForUnion(info.field_name, str(type(root)))
 
+            key = get_type_resolution_key(root)
+
+            if key is not None and (cached_name := resolved_types.get(key)):
+                return cached_name
+
             return_type: GraphQLType | None
 
             # Iterate over all of our known types and find the first concrete
@@ -220,6 +231,9 @@ class StrawberryUnion(StrawberryType):
 
             assert isinstance(return_type, GraphQLNamedType)
 
+            if key is not None and len(resolved_types) < TYPE_RESOLUTION_CACHE_SIZE:
+                resolved_types[key] = return_type.name
+
             return return_type.name
 
         return _resolve_union_type
@@ -0,0 +1,51 @@
+"""Memoization shared by the schema builds of a process.
+
+Building a schema resolves the annotation of every field and converts the name
+of every field and argument. When `StrawberryConfig.cache_schema_build` is
+enabled, those results are kept between builds, so that building a schema from
+the same types again, like in test suites or multi-tenant applications,
+doesn't redo that work.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from strawberry.utils.str_converters import to_camel_case
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+NAME_CACHE_SIZE = 8192
+
+_enabled: ContextVar[bool] = ContextVar("schema_build_cache", default=False)
+
+
+@contextmanager
+def schema_build_cache(enabled: bool = True) -> Iterator[None]:
+    """Enable (or disable) the build cache for the schema built in this block."""
+    token = _enabled.set(enabled)
+
+    try:
+        yield
+    finally:
+        _enabled.reset(token)
+
+
+def is_build_cache_enabled() -> bool:
+    return _enabled.get()
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def cached_to_camel_case(name: str) -> str:
+    return to_camel_case(name)
+
+
+__all__ = [
+    "cached_to_camel_case",
+    "is_build_cache_enabled",
+    "schema_build_cache",
+]
@@ -1,9 +1,10 @@
 import pytest
 from pytest_codspeed import BenchmarkFixture
 
+import strawberry
 from strawberry.schema.config import StrawberryConfig
 from strawberry.schema.types.scalar import DEFAULT_SCALAR_REGISTRY
-from strawberry.types.arguments import convert_argument
+from strawberry.types.arguments import build_argument_converter, convert_argument
 from strawberry.types.base import StrawberryList
 
 
@@ -19,3 +20,28 @@ def test_convert_argument_large_list(benchmark: BenchmarkFixture, ntypes):
         assert test_value == result
 
     benchmark(run)
+
+
+@pytest.mark.parametrize("ntypes", [2**k for k in range(10, 15, 2)])
+def test_prebuilt_converter_nested_inputs(benchmark: BenchmarkFixture, ntypes):
+    @strawberry.input
+    class Tag:
+        name: str
+
+    @strawberry.input
+    class Item:
+        id: int
+        tags: list[Tag]
+
+    test_value = [
+        {"id": i, "tags": [{"name": "a"}, {"name": "b"}]} for i in range(ntypes)
+    ]
+    converter = build_argument_converter(
+        StrawberryList(Item), DEFAULT_SCALAR_REGISTRY, StrawberryConfig()
+    )
+
+    def run():
+        result = converter(test_value)
+        assert len(result) == ntypes
+
+    benchmark(run)
@@ -0,0 +1,37 @@
+from enum import Enum
+
+import pytest
+from pytest_codspeed import BenchmarkFixture
+
+import strawberry
+
+# Like a country or currency code, with hundreds of members
+Code = Enum("Code", {f"CODE_{i}": f"code-{i}" for i in range(300)})  # type: ignore[misc]
+strawberry.enum(Code)
+CODES = list(Code)
+
+
+@strawberry.type
+class Row:
+    code: Code
+
+
+@pytest.mark.parametrize("nrows", [1_000, 100_000])
+def test_serialize_large_enum(benchmark: BenchmarkFixture, nrows: int):
+    rows = [Row(code=CODES[i % len(CODES)]) for i in range(nrows)]
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def rows(self) -> list[Row]:
+            return rows
+
+    schema = strawberry.Schema(query=Query)
+
+    def run():
+        result = schema.execute_sync("{ rows { code } }")
+        assert not result.errors
+        assert result.data
+        assert result.data["rows"][-1]["code"] == CODES[(nrows - 1) % len(CODES)].name
+
+    benchmark(run)
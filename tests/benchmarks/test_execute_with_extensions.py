@@ -7,6 +7,8 @@ import pytest
 from pytest_codspeed.plugin import BenchmarkFixture
 
 import strawberry
+from strawberry.execution.plan import CompiledExecutionContext
+from strawberry.extensions import ParserCache
 from strawberry.extensions.base_extension import SchemaExtension
 from strawberry.utils.await_maybe import AwaitableOrValue
 
@@ -53,3 +55,31 @@ def test_execute(
     results = benchmark(run)
 
     assert results.errors is None
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("items", [1_000, 10_000], ids=lambda x: f"items_{x}")
+@pytest.mark.parametrize(
+    "execution_context_class",
+    [None, CompiledExecutionContext],
+    ids=["default", "compiled"],
+)
+def test_execute_with_parser_cache(
+    benchmark: BenchmarkFixture,
+    items: int,
+    execution_context_class: type[CompiledExecutionContext] | None,
+):
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[lambda: ParserCache(maxsize=None)],
+        execution_context_class=execution_context_class,
+    )
+
+    def run():
+        return asyncio.run(
+            schema.execute(items_query, variable_values={"count": items})
+        )
+
+    results = benchmark(run)
+
+    assert results.errors is None
@@ -40,3 +40,21 @@ def test_execute_large_query(
         large_query,
         variable_values={"count": 1},
     )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [10, 100], ids=lambda x: f"items_{x}")
+def test_execute_large_query_basic_fields(benchmark: BenchmarkFixture, count: int):
+    from strawberry.extensions import ParserCache
+
+    # Cache the parsed document so that resolving the basic `name` and
+    # `index` fields of every item dominates the benchmark
+    schema = Schema(query=Query, extensions=[ParserCache])
+
+    result = benchmark(
+        schema.execute_sync,
+        large_query,
+        variable_values={"count": count},
+    )
+
+    assert not result.errors
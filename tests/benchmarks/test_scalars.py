@@ -0,0 +1,101 @@
+import datetime
+import decimal
+import uuid
+
+import pytest
+from pytest_codspeed import BenchmarkFixture
+
+import strawberry
+
+
+@strawberry.input
+class PaymentInput:
+    created_at: datetime.datetime
+    due_on: datetime.date
+    amount: decimal.Decimal
+    reference: uuid.UUID
+
+
+@strawberry.type
+class Payment:
+    created_at: datetime.datetime
+    due_on: datetime.date
+    at: datetime.time
+    amount: decimal.Decimal
+    reference: uuid.UUID
+
+
+def _payment(i: int) -> Payment:
+    created_at = datetime.datetime(
+        2024, 1, 1, tzinfo=datetime.timezone.utc
+    ) + datetime.timedelta(minutes=i)
+
+    return Payment(
+        created_at=created_at,
+        due_on=created_at.date(),
+        at=created_at.time(),
+        amount=decimal.Decimal(i) / 100,
+        reference=uuid.UUID(int=i),
+    )
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def payments(self, count: int) -> list[Payment]:
+        return [_payment(i) for i in range(count)]
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    def create_payments(self, payments: list[PaymentInput]) -> int:
+        return len(payments)
+
+
+schema = strawberry.Schema(query=Query, mutation=Mutation)
+
+
+@pytest.mark.parametrize("count", [1_000, 10_000])
+def test_parse_scalar_inputs(benchmark: BenchmarkFixture, count: int):
+    payments = [
+        {
+            "createdAt": payment.created_at.isoformat(),
+            "dueOn": payment.due_on.isoformat(),
+            "amount": str(payment.amount),
+            "reference": str(payment.reference),
+        }
+        for payment in map(_payment, range(count))
+    ]
+
+    def run():
+        result = schema.execute_sync(
+            """
+            mutation ($payments: [PaymentInput!]!) {
+                createPayments(payments: $payments)
+            }
+            """,
+            variable_values={"payments": payments},
+        )
+        assert not result.errors
+        assert result.data == {"createPayments": count}
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("count", [1_000, 10_000])
+def test_serialize_scalar_outputs(benchmark: BenchmarkFixture, count: int):
+    def run():
+        result = schema.execute_sync(
+            """
+            query ($count: Int!) {
+                payments(count: $count) { createdAt dueOn at amount reference }
+            }
+            """,
+            variable_values={"count": count},
+        )
+        assert not result.errors
+        assert result.data
+        assert len(result.data["payments"]) == count
+
+    benchmark(run)
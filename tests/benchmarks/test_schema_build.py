@@ -0,0 +1,60 @@
+from typing import Generic, TypeVar
+
+import pytest
+from pytest_codspeed import BenchmarkFixture
+
+import strawberry
+from strawberry.schema.config import StrawberryConfig
+
+T = TypeVar("T")
+
+
+@strawberry.type
+class Page(Generic[T]):
+    items: list[T]
+    total_count: int
+
+
+def create_query(ntypes: int) -> type:
+    types = [
+        strawberry.type(
+            type(
+                f"Type{i}",
+                (),
+                {
+                    "__annotations__": {
+                        "id": strawberry.ID,
+                        "display_name": str,
+                        "item_count": int,
+                        "average_score": float | None,
+                    }
+                },
+            )
+        )
+        for i in range(ntypes)
+    ]
+    fields = {}
+
+    for i, type_ in enumerate(types):
+        fields[f"type_{i}"] = strawberry.field(graphql_type=type_ | None, default=None)
+        fields[f"page_{i}"] = strawberry.field(
+            graphql_type=Page[type_] | None,  # type: ignore[valid-type]
+            default=None,
+        )
+
+    return strawberry.type(type("Query", (), fields))
+
+
+@pytest.mark.parametrize("ntypes", [50, 500])
+@pytest.mark.parametrize("cache_schema_build", [False, True])
+def test_build_large_schema(
+    benchmark: BenchmarkFixture, ntypes: int, cache_schema_build: bool
+):
+    query = create_query(ntypes)
+    config = StrawberryConfig(cache_schema_build=cache_schema_build)
+
+    def run():
+        schema = strawberry.Schema(query=query, config=config)
+        assert len(schema.schema_converter.type_map) > 2 * ntypes
+
+    benchmark(run)
@@ -314,3 +314,26 @@ def test_annotated_enum_as_resolver_parameter():
     result = schema.execute_sync("{ colorName(color: RED) }")
     assert result.errors is None
     assert result.data == {"colorName": "red"}
+
+
+def test_enum_with_unhashable_values():
+    @strawberry.enum
+    class Range(Enum):
+        LOW = [0, 10]
+        HIGH = [10, 100]
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def ranges(self, ranges: list[Range], high: Range) -> list[Range]:
+            assert ranges == [Range.LOW, Range.HIGH]
+            assert high is Range.HIGH
+            return [*ranges, high]
+
+    schema = strawberry.Schema(query=Query)
+    result = schema.execute_sync(
+        "query ($high: Range!) { ranges(ranges: [LOW, HIGH], high: $high) }",
+        variable_values={"high": "HIGH"},
+    )
+    assert result.errors is None
+    assert result.data == {"ranges": ["LOW", "HIGH", "HIGH"]}
@@ -1,7 +1,13 @@
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
 from graphql import located_error
 
 import strawberry
 from strawberry.types import Info
+from strawberry.utils.await_maybe import AwaitableOrValue
 
 
 def test_fetch_entities():
@@ -495,3 +501,260 @@ async def test_can_use_async_resolve_reference_multiple_representations():
     assert not result.errors
 
     assert result.data == {"_entities": [{"upc": "B00005N5PF"}, {"upc": "B00005N5PG"}]}
+
+
+ENTITIES_QUERY = """
+    query ($representations: [_Any!]!) {
+        _entities(representations: $representations) {
+            ... on Product {
+                upc
+            }
+            ... on Review {
+                id
+            }
+        }
+    }
+"""
+
+
+def test_resolve_references_in_bulk():
+    calls = []
+
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        def resolve_references(
+            cls, info: strawberry.Info, representations: list[dict[str, Any]]
+        ) -> list["Product"]:
+            calls.append((info.field_name, representations))
+            return [Product(upc=r["upc"]) for r in representations]
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: int
+
+        @classmethod
+        def resolve_reference(cls, id: int) -> "Review":
+            return Review(id=id)
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> list[Product]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query, types=[Review])
+
+    result = schema.execute_sync(
+        ENTITIES_QUERY,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Review", "id": 1},
+                {"__typename": "Product", "upc": "2"},
+            ]
+        },
+    )
+
+    assert not result.errors
+    assert result.data == {"_entities": [{"upc": "1"}, {"id": 1}, {"upc": "2"}]}
+    assert calls == [("_entities", [{"upc": "1"}, {"upc": "2"}])]
+
+
+async def test_resolve_references_in_bulk_concurrently():
+    started = 0
+    all_started = asyncio.Event()
+
+    async def wait_for_other_types() -> None:
+        nonlocal started
+        started += 1
+        if started == 2:
+            all_started.set()
+
+        await asyncio.wait_for(all_started.wait(), timeout=1)
+
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        async def resolve_references(
+            cls, representations: list[dict[str, Any]]
+        ) -> list["Product"]:
+            await wait_for_other_types()
+            return [Product(upc=r["upc"]) for r in representations]
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: int
+
+        @classmethod
+        async def resolve_references(
+            cls, representations: list[dict[str, Any]]
+        ) -> list["Review"]:
+            await wait_for_other_types()
+            return [Review(id=r["id"]) for r in representations]
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> list[Product]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query, types=[Review])
+
+    result = await schema.execute(
+        ENTITIES_QUERY,
+        variable_values={
+            "representations": [
+                {"__typename": "Review", "id": 1},
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Review", "id": 2},
+            ]
+        },
+    )
+
+    assert not result.errors
+    assert result.data == {"_entities": [{"id": 1}, {"upc": "1"}, {"id": 2}]}
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+async def test_resolve_references_errors(is_async: bool):
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        def resolve_references(
+            cls, representations: list[dict[str, Any]]
+        ) -> list["Product"]:
+            raise Exception("Product not available")
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: int
+
+        @classmethod
+        def resolve_references(
+            cls, representations: list[dict[str, Any]]
+        ) -> AwaitableOrValue[list["Review"]]:
+            async def resolve() -> list[Review]:
+                return []
+
+            return resolve() if is_async else []
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> list[Product]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query, types=[Review])
+
+    result = await schema.execute(
+        ENTITIES_QUERY,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Review", "id": 1},
+            ]
+        },
+    )
+
+    assert result.data == {"_entities": [None, None]}
+    assert result.errors is not None
+    assert [error.message for error in result.errors] == [
+        "Product not available",
+        "Review.resolve_references returned 0 results for 1 representations",
+    ]
+
+
+def test_resolve_references_generator_errors():
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        def resolve_references(
+            cls, representations: list[dict[str, Any]]
+        ) -> Iterator["Product"]:
+            yield cls(upc=representations[0]["upc"])
+            raise Exception("Product not available")
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: int
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> list[Product]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query, types=[Review])
+
+    result = schema.execute_sync(
+        ENTITIES_QUERY,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Review", "id": 1},
+                {"__typename": "Product", "upc": "2"},
+            ]
+        },
+    )
+
+    assert result.data == {"_entities": [None, {"id": 1}, None]}
+    assert result.errors is not None
+    assert [error.message for error in result.errors] == [
+        "Product not available",
+        "Product not available",
+    ]
+
+
+def test_entity_resolvers_are_only_built_for_requested_types():
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: strawberry.ID
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self) -> list[Product]:  # pragma: no cover
+            return []
+
+        @strawberry.field
+        def reviews(self) -> list[Review]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query)
+
+    assert schema._entity_resolvers == {}
+
+    query = """
+        query ($representations: [_Any!]!) {
+            _entities(representations: $representations) {
+                ... on Product {
+                    upc
+                }
+            }
+        }
+    """
+    for _ in range(2):
+        result = schema.execute_sync(
+            query,
+            variable_values={
+                "representations": [{"__typename": "Product", "upc": "1"}]
+            },
+        )
+
+        assert not result.errors
+        assert result.data == {"_entities": [{"upc": "1"}]}
+
+    assert list(schema._entity_resolvers) == ["Product"]
@@ -0,0 +1,132 @@
+import contextlib
+import json
+
+import pytest
+from pytest_mock import MockerFixture
+
+from strawberry.http.base import BaseView
+from strawberry.http.codecs import JSONCodec, MsgspecCodec, OrjsonCodec
+
+from .clients.base import HttpClient
+from .test_sse import create_sse_http_client, get_response_text, parse_sse_events
+
+
+@pytest.fixture(params=[JSONCodec, OrjsonCodec, MsgspecCodec])
+def json_codec(request: pytest.FixtureRequest, mocker: MockerFixture) -> JSONCodec:
+    codec_class = request.param
+
+    if codec_class is OrjsonCodec:
+        pytest.importorskip("orjson")
+    elif codec_class is MsgspecCodec:
+        pytest.importorskip("msgspec")
+
+    codec = codec_class()
+    mocker.patch.object(BaseView, "json_codec", codec)
+
+    with contextlib.suppress(ImportError):
+        from strawberry.django.views import BaseView as DjangoBaseView
+
+        mocker.patch.object(DjangoBaseView, "json_codec", codec)
+
+    return codec
+
+
+@pytest.mark.parametrize("codec_class", [JSONCodec, OrjsonCodec, MsgspecCodec])
+def test_codecs_round_trip(codec_class: type[JSONCodec]):
+    if codec_class is OrjsonCodec:
+        pytest.importorskip("orjson")
+    elif codec_class is MsgspecCodec:
+        pytest.importorskip("msgspec")
+
+    codec = codec_class()
+    data = {"data": {"hello": "Hello é", "items": [1, 2.5, None, True]}}
+
+    assert codec.decode(codec.encode(data)) == data
+    assert codec.decode(json.dumps(data)) == data
+    assert codec.decode(json.dumps(data).encode()) == data
+
+
+@pytest.mark.parametrize("codec_class", [JSONCodec, OrjsonCodec, MsgspecCodec])
+def test_codecs_raise_json_decode_errors(codec_class: type[JSONCodec]):
+    if codec_class is OrjsonCodec:
+        pytest.importorskip("orjson")
+    elif codec_class is MsgspecCodec:
+        pytest.importorskip("msgspec")
+
+    with pytest.raises(json.JSONDecodeError):
+        codec_class().decode(b"{ h")
+
+
+async def test_queries_use_the_views_json_codec(
+    http_client: HttpClient, json_codec: JSONCodec, mocker: MockerFixture
+):
+    decode = mocker.spy(json_codec, "decode")
+    encode = mocker.spy(json_codec, "encode")
+
+    response = await http_client.query(
+        query="query Hello($name: String) { hello(name: $name) }",
+        variables={"name": "é"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].split(";")[0] == "application/json"
+    assert response.json["data"] == {"hello": "Hello é"}
+    assert decode.call_count == 1
+    assert encode.call_count == 1
+
+
+async def test_invalid_json_with_the_views_json_codec(
+    http_client: HttpClient, json_codec: JSONCodec
+):
+    response = await http_client.post(
+        url="/graphql",
+        data=b"{ h",
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 400
+    assert "Unable to parse request body as JSON" in response.text
+
+
+async def test_sse_uses_the_views_json_codec(
+    http_client_class: type[HttpClient], json_codec: JSONCodec
+):
+    http_client = create_sse_http_client(http_client_class)
+
+    response = await http_client.query(
+        query='subscription { echo(message: "Hello world", delay: 0.01) }',
+        headers={
+            "accept": "text/event-stream",
+            "content-type": "application/json",
+        },
+    )
+
+    assert response.status_code == 200
+    assert parse_sse_events(await get_response_text(response)) == [
+        (
+            "next",
+            {
+                "data": {"echo": "Hello world"},
+                "extensions": {"example": "example"},
+            },
+        ),
+        ("complete", ""),
+    ]
+
+
+@pytest.mark.parametrize("codec_class", [JSONCodec, OrjsonCodec])
+def test_encode_json_string_is_deprecated(codec_class: type[JSONCodec]):
+    if codec_class is OrjsonCodec:
+        pytest.importorskip("orjson")
+
+    from strawberry.asgi import GraphQL
+    from tests.views.schema import schema
+
+    view = GraphQL(schema)
+    view.json_codec = codec_class()
+
+    with pytest.deprecated_call(match="`encode_json_string` is deprecated"):
+        encoded = view.encode_json_string({"data": {"hello": "é"}})
+
+    assert isinstance(encoded, str)
+    assert json.loads(encoded) == {"data": {"hello": "é"}}
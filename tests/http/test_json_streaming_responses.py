@@ -0,0 +1,68 @@
+import contextlib
+import json
+
+import pytest
+from pytest_mock import MockerFixture
+
+from strawberry.http.async_base_view import AsyncBaseHTTPView
+from tests.views.schema import schema
+
+from .clients.base import HttpClient
+from .test_sse import get_response_text
+
+
+@pytest.fixture
+def http_client(
+    http_client_class: type[HttpClient], mocker: MockerFixture
+) -> HttpClient:
+    with contextlib.suppress(ImportError):
+        import django
+
+        if django.VERSION < (4, 2):
+            pytest.skip(reason="Django < 4.2 doesn't async streaming responses")
+
+    with contextlib.suppress(ImportError):
+        from tests.http.clients.async_flask import AsyncFlaskHttpClient
+
+        if http_client_class is AsyncFlaskHttpClient:
+            pytest.skip(reason="AsyncFlaskHttpClient doesn't support streaming")
+
+    mocker.patch.object(AsyncBaseHTTPView, "stream_json_responses", True)
+    mocker.patch.object(AsyncBaseHTTPView, "json_stream_chunk_size", 16)
+
+    return http_client_class(schema)
+
+
+async def test_streams_json_responses(http_client: HttpClient):
+    response = await http_client.query(
+        query='{ first: hello second: hello(name: "é") alwaysFail }'
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].split(";")[0] == "application/json"
+    assert json.loads(await get_response_text(response)) == {
+        "data": {"first": "Hello world", "second": "Hello é", "alwaysFail": None},
+        "errors": [
+            {
+                "message": "You are not authorized",
+                "locations": [{"line": 1, "column": 41}],
+                "path": ["alwaysFail"],
+            }
+        ],
+        "extensions": {"example": "example"},
+    }
+
+
+async def test_streamed_responses_keep_status_code_and_headers(
+    http_client: HttpClient,
+):
+    response = await http_client.query(
+        query='{ returns401 setHeader(name: "Jake") }',
+    )
+
+    assert response.status_code == 401
+    assert response.headers["x-name"] == "Jake"
+    assert json.loads(await get_response_text(response))["data"] == {
+        "returns401": "hey",
+        "setHeader": "Jake",
+    }
@@ -0,0 +1,94 @@
+import json
+from urllib.parse import urlencode
+
+import pytest
+
+import strawberry
+from strawberry.persisted_documents import (
+    InMemoryDocumentStore,
+    PersistedDocumentsConfig,
+    compute_document_id,
+)
+from strawberry.schema.config import StrawberryConfig
+from tests.http.clients.base import HttpClient
+from tests.views.schema import Mutation, Query
+
+QUERY = "{ hello }"
+DOCUMENT_ID = compute_document_id(QUERY)
+PERSISTED_QUERY = {"persistedQuery": {"version": 1, "sha256Hash": DOCUMENT_ID}}
+
+
+@pytest.fixture
+def persisted_documents_http_client(
+    http_client_class: type[HttpClient],
+) -> HttpClient:
+    return http_client_class(
+        schema=strawberry.Schema(
+            query=Query,
+            mutation=Mutation,
+            config=StrawberryConfig(
+                persisted_documents=PersistedDocumentsConfig(
+                    store=InMemoryDocumentStore()
+                )
+            ),
+        )
+    )
+
+
+async def test_automatic_persisted_queries(
+    persisted_documents_http_client: HttpClient,
+):
+    response = await persisted_documents_http_client.post(
+        url="/graphql",
+        json={"extensions": PERSISTED_QUERY},
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["errors"] == [
+        {
+            "message": "PersistedQueryNotFound",
+            "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+        }
+    ]
+
+    response = await persisted_documents_http_client.query(
+        query=QUERY, extensions=PERSISTED_QUERY
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+
+    response = await persisted_documents_http_client.post(
+        url="/graphql",
+        json={"extensions": PERSISTED_QUERY},
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+
+
+async def test_persisted_query_via_get(persisted_documents_http_client: HttpClient):
+    await persisted_documents_http_client.query(query=QUERY, extensions=PERSISTED_QUERY)
+
+    response = await persisted_documents_http_client.get(
+        url=f"/graphql?{urlencode({'extensions': json.dumps(PERSISTED_QUERY)})}",
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+
+
+async def test_invalid_persisted_query_extension(
+    persisted_documents_http_client: HttpClient,
+):
+    response = await persisted_documents_http_client.post(
+        url="/graphql",
+        json={"extensions": {"persistedQuery": {"version": 2, "sha256Hash": "abc"}}},
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 400
+    assert "`persistedQuery` extension must be an object" in response.text
@@ -276,7 +276,7 @@ async def test_sse_subscription_sends_heartbeat_while_idle():
 
     stream = view._stream_result(None, result(), transport)
     chunks = [chunk async for chunk in stream()]
-    body = "".join(chunks)
+    body = b"".join(chunks).decode()
 
     assert ": ping\r\n\r\n" in body
     assert parse_sse_events(body) == [
@@ -5,6 +5,7 @@ from strawberry.http.base import BaseView
 from strawberry.http.streaming import (
     MultipartSubscriptionTransport,
     MultipartTransport,
+    stream_json,
 )
 from strawberry.subscriptions import MULTIPART_SUBSCRIPTION_PROTOCOL
 
@@ -15,7 +16,22 @@ def test_multipart_transport_encode_multipart_data_uses_utf8_byte_length() -> No
 
     data = transport.encode_multipart_data({"value": "\u00e9"}, lambda _: encoded_json)
 
-    assert f"Content-Length: {len(encoded_json.encode())}\r\n" in data
+    assert f"Content-Length: {len(encoded_json.encode())}\r\n".encode() in data
+
+
+def test_multipart_transport_encode_multipart_data_accepts_bytes() -> None:
+    transport = MultipartTransport()
+
+    data = transport.encode_multipart_data(
+        {"value": "\u00e9"}, lambda _: '{"value":"\u00e9"}'.encode()
+    )
+
+    assert data == (
+        b"\r\n"
+        b"Content-Type: application/json; charset=utf-8\r\n"
+        b"Content-Length: 14\r\n"
+        b"\r\n" + '{"value":"\u00e9"}'.encode() + b"\r\n---"
+    )
 
 
 async def test_multipart_transport_streams_data() -> None:
@@ -29,9 +45,9 @@ async def test_multipart_transport_streams_data() -> None:
     result = [chunk async for chunk in stream()]
 
     assert transport.headers == {"Content-Type": 'multipart/mixed; boundary="-"'}
-    assert result[0] == "---"
-    assert '"data": {"ok": true}' in result[1]
-    assert result[-1] == "--\r\n"
+    assert result[0] == b"---"
+    assert b'"data": {"ok": true}' in result[1]
+    assert result[-1] == b"--\r\n"
 
 
 def test_multipart_subscription_transport_accepts_content_type() -> None:
@@ -72,10 +88,10 @@ def test_multipart_subscription_transport_encodes_messages() -> None:
     assert transport.headers == {
         "Content-Type": "multipart/mixed;boundary=custom;subscriptionSpec=1.0,application/json"
     }
-    assert '"payload": {"data": {"ok": true}}' in next_message
-    assert next_message.endswith("\r\n--custom")
-    assert heartbeat_message.endswith("{}\r\n--custom")
-    assert transport.encode_complete() == "\r\n--custom--\r\n"
+    assert b'"payload": {"data": {"ok": true}}' in next_message
+    assert next_message.endswith(b"\r\n--custom")
+    assert heartbeat_message.endswith(b"{}\r\n--custom")
+    assert transport.encode_complete() == b"\r\n--custom--\r\n"
 
 
 def test_base_view_caches_stream_transport_map() -> None:
@@ -137,3 +153,55 @@ def test_base_view_only_instantiates_enabled_stream_transports() -> None:
         is None
     )
     assert MockTransport.calls == 0
+
+
+async def test_stream_json_encodes_the_whole_document() -> None:
+    data = {
+        "data": {"items": [{"id": i, "tags": ["a", "b"]} for i in range(100)]},
+        "errors": [{"message": "é", "path": ["items", 0]}],
+        "extensions": {"nested": [[1, 2], [], [3]]},
+    }
+
+    stream = stream_json(data, json.dumps, chunk_size=256)
+    chunks = [chunk async for chunk in stream()]
+
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 256 for chunk in chunks[:-1])
+    assert json.loads(b"".join(chunks)) == data
+
+
+async def test_stream_json_converts_keys_like_the_codec() -> None:
+    data = {"data": None, "extensions": {1: "a", None: 2, "nested": {2.5: True}}}
+
+    stream = stream_json(data, json.dumps, chunk_size=1)
+    encoded = b"".join([chunk async for chunk in stream()])
+
+    assert (
+        json.loads(encoded)
+        == json.loads(json.dumps(data))
+        == {
+            "data": None,
+            "extensions": {"1": "a", "null": 2, "nested": {"2.5": True}},
+        }
+    )
+
+
+async def test_stream_json_encodes_list_elements_lazily() -> None:
+    encoded: list[object] = []
+
+    def encode_json(data: object) -> bytes:
+        encoded.append(data)
+        return json.dumps(data).encode()
+
+    data = {"data": {"items": [{"id": i} for i in range(10)]}}
+    stream = stream_json(data, encode_json, chunk_size=1)()
+
+    first_chunk = await stream.__anext__()
+
+    assert first_chunk == b"{"
+    assert encoded == []
+
+    rest = [chunk async for chunk in stream]
+
+    assert json.loads(first_chunk + b"".join(rest)) == data
+    assert encoded == ["data", "items", *data["data"]["items"]]
@@ -1,12 +1,23 @@
+import gc
+import weakref
 from collections.abc import Iterable
 from typing import Annotated, Any, Optional
 from typing_extensions import Self
 
 import pytest
+from pytest_mock import MockerFixture
 
 import strawberry
+from strawberry.extensions import ParserCache
 from strawberry.permission import BasePermission
-from strawberry.relay import Connection, Node, PageInfo, to_base64
+from strawberry.relay import (
+    Connection,
+    ConnectionSelection,
+    Node,
+    PageInfo,
+    get_connection_selection,
+    to_base64,
+)
 from strawberry.relay.types import Edge, ListConnection
 from strawberry.schema.config import StrawberryConfig
 
@@ -267,3 +278,145 @@ def test_max_results(
     assert result.data is not None
     assert isinstance(result.data["users"]["edges"], list)
     assert len(result.data["users"]["edges"]) == expected
+
+
+selections: list[ConnectionSelection] = []
+
+
+@strawberry.type
+class CountedUserConnection(ListConnection[User]):
+    total_count: int = 0
+
+    @classmethod
+    def resolve_connection(
+        cls,
+        nodes: Iterable[User],
+        *,
+        info: strawberry.Info,
+        **kwargs: Any,
+    ) -> Self:
+        selection = get_connection_selection(info)
+        selections.append(selection)
+
+        connection = super().resolve_connection(nodes, info=info, **kwargs)
+        assert isinstance(connection, CountedUserConnection)
+        if selection.total_count:
+            connection.total_count = len(list(nodes))
+
+        return connection
+
+
+def _users_schema(config: StrawberryConfig | None = None) -> strawberry.Schema:
+    @strawberry.type
+    class Query:
+        @strawberry.relay.connection(CountedUserConnection)
+        def users(self) -> list[User]:
+            return [User(id=str(i)) for i in range(3)]
+
+    return strawberry.Schema(query=Query, config=config, extensions=[ParserCache])
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        (
+            "{ users { totalCount } }",
+            ConnectionSelection(total_count=True),
+        ),
+        (
+            "{ users { edges { cursor } pageInfo { hasNextPage } } }",
+            ConnectionSelection(edges=True, cursor=True, page_info=True),
+        ),
+        (
+            """
+            query {
+                users { ...Users }
+            }
+
+            fragment Users on CountedUserConnection {
+                ... on CountedUserConnection {
+                    edges { ...Edge }
+                }
+                totalCount
+            }
+
+            fragment Edge on UserEdge {
+                node { name }
+            }
+            """,
+            ConnectionSelection(edges=True, node=True, total_count=True),
+        ),
+        (
+            "{ users { pageInfo { hasNextPage } users: totalCount } }",
+            ConnectionSelection(page_info=True, total_count=True),
+        ),
+    ],
+)
+def test_connection_selection(query: str, expected: ConnectionSelection):
+    selections.clear()
+
+    result = _users_schema().execute_sync(query)
+
+    assert result.errors is None
+    assert selections == [expected]
+
+
+def test_connection_selection_without_auto_camel_case():
+    selections.clear()
+    schema = _users_schema(StrawberryConfig(auto_camel_case=False))
+
+    result = schema.execute_sync("{ users { page_info { end_cursor } total_count } }")
+
+    assert result.errors is None
+    assert selections == [ConnectionSelection(page_info=True, total_count=True)]
+
+
+def test_connection_selection_is_cached_per_document():
+    selections.clear()
+    schema = _users_schema()
+    query = "{ users { totalCount edges { node { name } } } }"
+
+    for _ in range(2):
+        result = schema.execute_sync(query)
+        assert result.errors is None
+        assert result.data == {
+            "users": {
+                "totalCount": 3,
+                "edges": [{"node": {"name": "John"}} for _ in range(3)],
+            }
+        }
+
+    assert len(selections) == 2
+    assert selections[0] is selections[1]
+
+
+def test_list_connection_skips_nodes_that_are_not_selected(mocker: MockerFixture):
+    resolve_node = mocker.spy(CountedUserConnection, "resolve_node")
+    schema = _users_schema()
+
+    result = schema.execute_sync("{ users { edges { cursor } } }")
+
+    assert result.errors is None
+    assert len(result.data["users"]["edges"]) == 3
+    resolve_node.assert_not_called()
+
+    result = schema.execute_sync("{ users { edges { node { name } } } }")
+
+    assert result.errors is None
+    assert resolve_node.call_count == 3
+
+
+def test_connection_selections_dont_keep_the_schema_alive():
+    selections.clear()
+    schema = _users_schema()
+
+    # Kept by the parser cache, along with its connection selections
+    result = schema.execute_sync("{ users { totalCount } }")
+    assert result.errors is None
+    assert selections == [ConnectionSelection(total_count=True)]
+
+    schema_ref = weakref.ref(schema)
+    del schema, result
+    gc.collect()
+
+    assert schema_ref() is None
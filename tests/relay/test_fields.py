@@ -188,6 +188,36 @@ def test_query_nodes():
     }
 
 
+def test_query_nodes_with_repeated_ids():
+    result = schema.execute_sync(
+        """
+        query TestQuery ($ids: [ID!]!) {
+            nodes (ids: $ids) {
+                ... on Fruit {
+                    id
+                    name
+                }
+            }
+        }
+        """,
+        variable_values={
+            "ids": [
+                to_base64("Fruit", 4),
+                to_base64("Fruit", 2),
+                to_base64("Fruit", 4),
+            ],
+        },
+    )
+    assert result.errors is None
+    assert result.data == {
+        "nodes": [
+            {"id": to_base64("Fruit", 4), "name": "Grape"},
+            {"id": to_base64("Fruit", 2), "name": "Apple"},
+            {"id": to_base64("Fruit", 4), "name": "Grape"},
+        ],
+    }
+
+
 def test_query_nodes_optional():
     result = schema.execute_sync(
         """
@@ -0,0 +1,255 @@
+import bisect
+from collections.abc import AsyncIterator, Iterable, Sequence
+from typing import Any
+
+import pytest
+
+import strawberry
+from strawberry import relay
+from strawberry.relay.utils import to_base64
+
+
+@strawberry.type
+class Fruit(relay.Node):
+    id: relay.NodeID[int]
+    name: str
+
+
+FRUITS = [
+    Fruit(id=id_, name=name)
+    for id_, name in enumerate(
+        ["Apple", "Banana", "Cherry", "Grape", "Lemon", "Mango", "Orange"], start=1
+    )
+]
+
+
+class FruitSource:
+    """Fetches the fruits ordered by name, like an indexed query would."""
+
+    def __init__(self) -> None:
+        self.requests: list[relay.KeysetRequest] = []
+        self.keys = [self.get_key(fruit) for fruit in FRUITS]
+
+    def get_key(self, node: Fruit) -> Sequence[Any]:
+        return (node.name, node.id)
+
+    def fetch(self, request: relay.KeysetRequest) -> Iterable[Fruit]:
+        self.requests.append(request)
+
+        start = (
+            bisect.bisect_right(self.keys, request.after)
+            if request.after is not None
+            else 0
+        )
+        end = (
+            bisect.bisect_left(self.keys, request.before)
+            if request.before is not None
+            else len(FRUITS)
+        )
+
+        if request.direction == "backward":
+            return FRUITS[max(start, end - request.limit) : end][::-1]
+
+        return FRUITS[start : start + request.limit][: end - start]
+
+
+class AsyncFruitSource(FruitSource):
+    async def fetch(self, request: relay.KeysetRequest) -> Iterable[Fruit]:  # type: ignore[override]
+        return super().fetch(request)
+
+
+class AsyncIterableFruitSource(FruitSource):
+    async def _iterate(self, request: relay.KeysetRequest) -> AsyncIterator[Fruit]:
+        for fruit in super().fetch(request):
+            yield fruit
+
+    def fetch(self, request: relay.KeysetRequest) -> AsyncIterator[Fruit]:  # type: ignore[override]
+        return self._iterate(request)
+
+
+sources: dict[str, FruitSource] = {}
+
+
+@strawberry.type
+class Query:
+    @relay.connection(relay.KeysetConnection[Fruit])
+    def fruits(self) -> relay.KeysetSource[Fruit]:
+        return sources["sync"]
+
+    @relay.connection(relay.KeysetConnection[Fruit])
+    async def fruits_async(self) -> relay.KeysetSource[Fruit]:
+        return sources["async"]
+
+    @relay.connection(relay.KeysetConnection[Fruit])
+    def fruits_async_iterable(self) -> FruitSource:
+        return sources["async_iterable"]
+
+    @relay.connection(relay.KeysetConnection[Fruit])
+    def fruits_list(self) -> Iterable[Fruit]:
+        return FRUITS
+
+
+schema = strawberry.Schema(query=Query)
+
+QUERY = """
+query TestQuery(
+    $first: Int, $last: Int, $after: String, $before: String
+) {
+    %s(first: $first, last: $last, after: $after, before: $before) {
+        edges {
+            cursor
+            node {
+                name
+            }
+        }
+        pageInfo {
+            hasNextPage
+            hasPreviousPage
+            startCursor
+            endCursor
+        }
+    }
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def fruit_sources() -> dict[str, FruitSource]:
+    sources.update(
+        {
+            "sync": FruitSource(),
+            "async": AsyncFruitSource(),
+            "async_iterable": AsyncIterableFruitSource(),
+        }
+    )
+    return sources
+
+
+def _cursor(fruit: Fruit) -> str:
+    return to_base64("keyset", f'["{fruit.name}",{fruit.id}]')
+
+
+async def _query(field: str, **variables: Any) -> dict[str, Any]:
+    result = await schema.execute(QUERY % field, variable_values=variables)
+    assert result.errors is None
+    assert result.data is not None
+    return result.data[field]
+
+
+def _names(connection: dict[str, Any]) -> list[str]:
+    return [edge["node"]["name"] for edge in connection["edges"]]
+
+
+@pytest.mark.parametrize(
+    ("field", "source"),
+    [
+        ("fruits", "sync"),
+        ("fruitsAsync", "async"),
+        ("fruitsAsyncIterable", "async_iterable"),
+    ],
+)
+async def test_paginate_forwards(
+    fruit_sources: dict[str, FruitSource], field: str, source: str
+):
+    first_page = await _query(field, first=3)
+
+    assert _names(first_page) == ["Apple", "Banana", "Cherry"]
+    assert first_page["edges"][0]["cursor"] == _cursor(FRUITS[0])
+    assert first_page["pageInfo"] == {
+        "hasNextPage": True,
+        "hasPreviousPage": False,
+        "startCursor": _cursor(FRUITS[0]),
+        "endCursor": _cursor(FRUITS[2]),
+    }
+
+    second_page = await _query(
+        field, first=3, after=first_page["pageInfo"]["endCursor"]
+    )
+    last_page = await _query(field, first=3, after=second_page["pageInfo"]["endCursor"])
+
+    assert _names(second_page) == ["Grape", "Lemon", "Mango"]
+    assert second_page["pageInfo"]["hasNextPage"] is True
+    assert second_page["pageInfo"]["hasPreviousPage"] is True
+    assert _names(last_page) == ["Orange"]
+    assert last_page["pageInfo"]["hasNextPage"] is False
+
+    # The sort key and the overfetched page size are pushed to the source
+    assert fruit_sources[source].requests == [
+        relay.KeysetRequest(after=None, before=None, limit=4, direction="forward"),
+        relay.KeysetRequest(
+            after=("Cherry", 3), before=None, limit=4, direction="forward"
+        ),
+        relay.KeysetRequest(
+            after=("Mango", 6), before=None, limit=4, direction="forward"
+        ),
+    ]
+
+
+async def test_paginate_backwards(fruit_sources: dict[str, FruitSource]):
+    last_page = await _query("fruits", last=3)
+
+    assert _names(last_page) == ["Lemon", "Mango", "Orange"]
+    assert last_page["pageInfo"]["hasPreviousPage"] is True
+    assert last_page["pageInfo"]["hasNextPage"] is False
+
+    previous_page = await _query(
+        "fruits", last=3, before=last_page["pageInfo"]["startCursor"]
+    )
+
+    assert _names(previous_page) == ["Banana", "Cherry", "Grape"]
+    assert previous_page["pageInfo"]["hasPreviousPage"] is True
+    assert previous_page["pageInfo"]["hasNextPage"] is True
+    assert fruit_sources["sync"].requests[-1] == relay.KeysetRequest(
+        after=None, before=("Lemon", 5), limit=4, direction="backward"
+    )
+
+
+async def test_paginate_between_cursors():
+    connection = await _query(
+        "fruits", first=10, after=_cursor(FRUITS[1]), before=_cursor(FRUITS[4])
+    )
+
+    assert _names(connection) == ["Cherry", "Grape"]
+    assert connection["pageInfo"]["hasNextPage"] is False
+    assert connection["pageInfo"]["hasPreviousPage"] is True
+
+
+async def test_max_results_is_the_default_page_size():
+    connection = await schema.execute(
+        "{ fruits { edges { node { name } } } }",
+    )
+
+    assert connection.errors is None
+    assert len(connection.data["fruits"]["edges"]) == len(FRUITS)
+
+
+@pytest.mark.parametrize(
+    ("variables", "message"),
+    [
+        ({"after": to_base64("arrayconnection", "1")}, "Argument 'after' contains"),
+        ({"before": to_base64("keyset", '{"a":1}')}, "Argument 'before' contains"),
+        ({"first": 1, "last": 1}, "can't be used together"),
+        ({"first": -1}, "Argument 'first' must be a non-negative integer."),
+        ({"last": 101}, "Argument 'last' cannot be higher than 100."),
+    ],
+)
+async def test_invalid_arguments(variables: dict[str, Any], message: str):
+    result = await schema.execute(QUERY % "fruits", variable_values=variables)
+
+    assert result.errors is not None
+    assert message in result.errors[0].message
+
+
+async def test_requires_a_keyset_source():
+    result = await schema.execute(QUERY % "fruitsList", variable_values={})
+
+    assert result.errors is not None
+    assert "KeysetConnection requires a KeysetSource" in result.errors[0].message
+
+
+def test_schema():
+    schema_str = str(schema)
+
+    assert "fruits(\n" in schema_str
+    assert "): FruitKeysetConnection!" in schema_str
+    assert "edges: [FruitKeysetEdge!]!" in schema_str
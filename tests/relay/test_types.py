@@ -45,6 +45,29 @@ def test_global_id_from_id_error(value: Any):
         relay.GlobalID.from_id(value)
 
 
+def test_global_id_from_ids():
+    values = [to_base64("Fruit", 1), to_base64("Fruit", "a:b"), to_base64("Fruit", 1)]
+
+    global_ids = relay.GlobalID.from_ids(values)
+
+    assert global_ids == [relay.GlobalID.from_id(value) for value in values]
+    # Repeated values are only parsed once
+    assert global_ids[0] is global_ids[2]
+
+
+@pytest.mark.parametrize("value", ["foobar", "Zm9vYmFy", "ZnLDqWU=", "fõõ", 123])
+def test_global_id_from_ids_error(value: Any):
+    with pytest.raises(relay.GlobalIDValueError):
+        relay.GlobalID.from_ids([to_base64("Fruit", 1), value])
+
+
+def test_schema_get_node_type():
+    assert schema.get_node_type("Fruit") is Fruit
+    assert schema.get_node_type("Node") is relay.Node
+    assert schema.get_node_type("Query") is None
+    assert schema.get_node_type("Unknown") is None
+
+
 def test_global_id_resolve_type():
     gid = relay.GlobalID(type_name="Fruit", node_id="1")
     type_ = gid.resolve_type(fake_info)
@@ -1,5 +1,7 @@
 import contextlib
+import gc
 import json
+import weakref
 from typing import Any
 from unittest.mock import patch
 
@@ -7,10 +9,12 @@ import pytest
 from graphql import ExecutionResult as GraphQLExecutionResult
 from graphql import GraphQLError
 from graphql import execute as original_execute
+from pytest_mock import MockerFixture
 
 import strawberry
 from strawberry.exceptions import StrawberryGraphQLError
 from strawberry.extensions import SchemaExtension
+from strawberry.types.field import StrawberryField
 
 from .conftest import ExampleExtension, ExecType, SchemaHelper, hook_wrap
 
@@ -1007,3 +1011,154 @@ def test_raise_if_hook_is_not_callable(default_query_types_and_query: SchemaHelp
     assert isinstance(result.errors[0].original_error, ValueError)
     assert result.errors[0].message.startswith("Hook on_operation on <")
     assert result.errors[0].message.endswith("> must be callable, received 'ABC'")
+
+
+def test_hooks_are_analyzed_once_per_extension_class(mocker: MockerFixture):
+    from strawberry.extensions.context import ExtensionContextManagerBase
+
+    class MyExtension(SchemaExtension):
+        def on_operation(self):
+            yield
+
+        def on_execute(self):
+            pass
+
+    @strawberry.type
+    class Query:
+        hello: str = "world"
+
+    schema = strawberry.Schema(query=Query, extensions=[MyExtension])
+    build_hook_plan = mocker.spy(ExtensionContextManagerBase, "build_hook_plan")
+
+    for _ in range(3):
+        result = schema.execute_sync("{ hello }", root_value=Query())
+        assert result.data == {"hello": "world"}
+
+    # One plan per lifecycle stage, shared by every request
+    assert build_hook_plan.call_count == 4
+
+
+def test_replaced_hooks_are_analyzed_again(monkeypatch: pytest.MonkeyPatch):
+    calls: list[str] = []
+
+    class MyExtension(SchemaExtension):
+        def on_operation(self):
+            calls.append("original")
+            yield
+
+    @strawberry.type
+    class Query:
+        hello: str = "world"
+
+    schema = strawberry.Schema(query=Query, extensions=[MyExtension])
+    schema.execute_sync("{ hello }")
+
+    def on_operation(self_: SchemaExtension) -> None:
+        calls.append("replaced")
+
+    monkeypatch.setattr(MyExtension, "on_operation", on_operation)
+    schema.execute_sync("{ hello }")
+
+    assert calls == ["original", "replaced"]
+
+
+def test_hook_plans_are_freed_with_their_extension_class():
+    from strawberry.extensions.context import OperationContextManager, _hook_plans
+
+    class MyExtension(SchemaExtension):
+        def on_operation(self):
+            yield
+
+    OperationContextManager([MyExtension()])
+    assert MyExtension in _hook_plans
+
+    extension_class = weakref.ref(MyExtension)
+    del MyExtension
+    gc.collect()
+
+    assert extension_class() is None
+
+
+def test_no_middleware_without_resolve_extensions():
+    @strawberry.type
+    class Query:
+        hello: str = "world"
+
+    class ResolveExtension(SchemaExtension):
+        def resolve(self, _next, root, info, *args: Any, **kwargs: Any) -> Any:
+            return _next(root, info, *args, **kwargs)
+
+    schema = strawberry.Schema(query=Query, extensions=[ExampleExtension])
+
+    assert schema._get_middleware_manager(schema.get_extensions()) is None
+
+    schema = strawberry.Schema(query=Query, extensions=[ResolveExtension])
+
+    assert schema._get_middleware_manager(schema.get_extensions()) is not None
+
+
+def test_resolve_only_wraps_targeted_fields():
+    resolved: list[str] = []
+
+    @strawberry.type
+    class Person:
+        name: str = "Jess"
+
+        @strawberry.field
+        def age(self) -> int:
+            return 30
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def person(self) -> Person:
+            return Person()
+
+    class CustomResolversOnly(SchemaExtension):
+        @classmethod
+        def targets_field(cls, field: StrawberryField | None) -> bool:
+            return field is not None and field.base_resolver is not None
+
+        def resolve(self, _next, root, info, *args: Any, **kwargs: Any) -> Any:
+            resolved.append(info.field_name)
+            return _next(root, info, *args, **kwargs)
+
+    schema = strawberry.Schema(query=Query, extensions=[CustomResolversOnly])
+
+    result = schema.execute_sync("{ __typename person { name age } }")
+
+    assert not result.errors
+    assert result.data == {
+        "__typename": "Query",
+        "person": {"name": "Jess", "age": 30},
+    }
+    assert resolved == ["person", "age"]
+
+
+def test_targeted_fields_are_computed_once_per_extension_class(
+    mocker: MockerFixture,
+):
+    @strawberry.type
+    class Query:
+        hello: str = "world"
+
+        @strawberry.field
+        def goodbye(self) -> str:
+            return "world"
+
+    class ResolveExtension(SchemaExtension):
+        def resolve(self, _next, root, info, *args: Any, **kwargs: Any) -> Any:
+            return _next(root, info, *args, **kwargs)
+
+    targets_field = mocker.spy(ResolveExtension, "targets_field")
+    schema = strawberry.Schema(query=Query, extensions=[ResolveExtension])
+
+    for _ in range(3):
+        result = schema.execute_sync("{ hello goodbye }", root_value=Query())
+
+        assert result.data == {"hello": "world", "goodbye": "world"}
+
+    assert [call.args[0].name for call in targets_field.call_args_list] == [
+        "hello",
+        "goodbye",
+    ]
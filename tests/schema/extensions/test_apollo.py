@@ -344,3 +344,25 @@ async def test_concurrent_subscribe_has_isolated_extensions():
     await asyncio.gather(run(), run())
     assert len(contexts) == 2
     assert contexts[0] != contexts[1], "each subscription must have its own context"
+
+
+def test_tracing_only_wraps_custom_resolvers():
+    @strawberry.type
+    class Person:
+        name: str = "Jess"
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def person(self) -> Person:
+            return Person()
+
+    schema = strawberry.Schema(query=Query, extensions=[ApolloTracingExtensionSync])
+    manager = schema._get_middleware_manager(schema.get_extensions())
+    assert manager is not None
+
+    name_resolver = schema._schema.get_type("Person").fields["name"].resolve
+    person_resolver = schema._schema.query_type.fields["person"].resolve
+
+    assert manager.get_field_resolver(name_resolver) is name_resolver
+    assert manager.get_field_resolver(person_resolver) is not person_resolver
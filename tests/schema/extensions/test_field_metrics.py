@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+import strawberry
+from strawberry.extensions import FieldMetrics, FieldMetricsExtension
+from strawberry.extensions.field_metrics import FieldStats, field_metrics
+
+
+@strawberry.type
+class Person:
+    name: str = "Jane"
+
+    @strawberry.field
+    def age(self) -> int:
+        return 42
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def person(self) -> Person:
+        return Person()
+
+    @strawberry.field
+    async def slow_person(self) -> Person:
+        await asyncio.sleep(0.01)
+        return Person()
+
+    @strawberry.field
+    def fail(self) -> str | None:
+        raise ValueError("Nope")
+
+    @strawberry.field
+    async def fail_async(self) -> str | None:
+        raise ValueError("Nope")
+
+
+def _schema(metrics: FieldMetrics, sample_rate: float = 1.0) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        extensions=[
+            lambda: FieldMetricsExtension(metrics=metrics, sample_rate=sample_rate)
+        ],
+    )
+
+
+def test_records_field_resolvers():
+    metrics = FieldMetrics()
+    schema = _schema(metrics)
+
+    for _ in range(3):
+        result = schema.execute_sync("{ person { name age } fail }")
+        assert result.data == {"person": {"name": "Jane", "age": 42}, "fail": None}
+
+    person = metrics.get("Query", "person")
+    assert person is not None
+    assert person.count == 3
+    assert person.errors == 0
+    assert sum(person.bucket_counts) == 3
+    assert person.total_time > 0
+    assert person.max_time <= person.total_time
+
+    age = metrics.get("Person", "age")
+    assert age is not None
+    assert age.count == 3
+
+    fail = metrics.get("Query", "fail")
+    assert fail is not None
+    assert fail.count == 3
+    assert fail.errors == 3
+
+    # Fields without a custom resolver are not measured
+    assert metrics.get("Person", "name") is None
+
+
+async def test_records_async_field_resolvers():
+    metrics = FieldMetrics()
+    schema = _schema(metrics)
+
+    result = await schema.execute("{ slowPerson { age } failAsync }")
+
+    assert result.data == {"slowPerson": {"age": 42}, "failAsync": None}
+
+    slow_person = metrics.get("Query", "slowPerson")
+    assert slow_person is not None
+    assert slow_person.count == 1
+    assert slow_person.total_time >= 0.01
+
+    fail_async = metrics.get("Query", "failAsync")
+    assert fail_async is not None
+    assert fail_async.errors == 1
+
+
+@pytest.mark.parametrize(("random", "recorded"), [(0.2, True), (0.6, False)])
+def test_samples_operations(mocker: MockerFixture, random: float, recorded: bool):
+    mocker.patch(
+        "strawberry.extensions.field_metrics.random.random", return_value=random
+    )
+    metrics = FieldMetrics()
+    schema = _schema(metrics, sample_rate=0.5)
+
+    result = schema.execute_sync("{ person { age } }")
+
+    assert result.errors is None
+    assert (metrics.get("Query", "person") is not None) is recorded
+    assert (metrics.get("Person", "age") is not None) is recorded
+
+
+def test_invalid_sample_rate():
+    with pytest.raises(ValueError, match="sample_rate must be between 0 and 1"):
+        FieldMetricsExtension(sample_rate=2)
+
+
+def test_uses_the_default_registry():
+    field_metrics.reset()
+    schema = strawberry.Schema(query=Query, extensions=[FieldMetricsExtension])
+
+    schema.execute_sync("{ person { age } }")
+
+    assert [stats.field_name for stats in field_metrics] == ["person", "age"]
+    field_metrics.reset()
+    assert list(field_metrics) == []
+
+
+def test_stats():
+    stats = FieldStats("Query", "person", buckets=(0.1, 1.0))
+
+    stats.observe(0.05)
+    stats.observe(0.1)
+    stats.observe(0.5, error=True)
+    stats.observe(2.0)
+
+    assert stats.bucket_counts == [2, 1, 1]
+    assert stats.cumulative_buckets() == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+    assert stats.to_dict() == {
+        "parentType": "Query",
+        "fieldName": "person",
+        "count": 4,
+        "errors": 1,
+        "totalTime": 2.65,
+        "averageTime": 0.6625,
+        "maxTime": 2.0,
+        "buckets": {"0.1": 2, "1.0": 3, "+Inf": 4},
+    }
+
+
+def test_export():
+    metrics = FieldMetrics(buckets=(1.0, 0.1))
+    metrics.observe("Query", "person", 0.5)
+    metrics.observe("Query", "person", 0.05, error=True)
+    metrics.observe("Query", "fail", 2.0)
+
+    assert [stats.field_name for stats in metrics.hottest(1)] == ["fail"]
+    assert metrics.snapshot()["Query.person"]["buckets"] == {
+        "0.1": 1,
+        "1.0": 2,
+        "+Inf": 2,
+    }
+    assert metrics.to_prometheus(prefix="app") == (
+        "# HELP app_duration_seconds Time spent resolving the field.\n"
+        "# TYPE app_duration_seconds histogram\n"
+        'app_duration_seconds_bucket{parent_type="Query",field="person",le="0.1"} 1\n'
+        'app_duration_seconds_bucket{parent_type="Query",field="person",le="1.0"} 2\n'
+        'app_duration_seconds_bucket{parent_type="Query",field="person",le="+Inf"} 2\n'
+        'app_duration_seconds_sum{parent_type="Query",field="person"} 0.55\n'
+        'app_duration_seconds_count{parent_type="Query",field="person"} 2\n'
+        'app_duration_seconds_bucket{parent_type="Query",field="fail",le="0.1"} 0\n'
+        'app_duration_seconds_bucket{parent_type="Query",field="fail",le="1.0"} 0\n'
+        'app_duration_seconds_bucket{parent_type="Query",field="fail",le="+Inf"} 1\n'
+        'app_duration_seconds_sum{parent_type="Query",field="fail"} 2.0\n'
+        'app_duration_seconds_count{parent_type="Query",field="fail"} 1\n'
+        "# HELP app_errors_total Errors raised resolving the field.\n"
+        "# TYPE app_errors_total counter\n"
+        'app_errors_total{parent_type="Query",field="person"} 1\n'
+        'app_errors_total{parent_type="Query",field="fail"} 0\n'
+    )
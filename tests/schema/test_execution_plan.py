@@ -0,0 +1,232 @@
+import asyncio
+import gc
+from typing import Any
+
+import pytest
+from graphql import parse
+
+import strawberry
+from strawberry.execution.plan import CompiledExecutionContext, ExecutionPlanCache
+from strawberry.extensions import ParserCache, SchemaExtension
+from strawberry.utils import IS_GQL_33
+
+pytestmark = pytest.mark.skipif(
+    IS_GQL_33, reason="Execution plans are only used with graphql-core 3.2"
+)
+
+
+@strawberry.type
+class Item:
+    id: int
+
+    @strawberry.field
+    def multiply(self, factor: int = 2) -> int:
+        return self.id * factor
+
+    @strawberry.field
+    def path(self, info: strawberry.Info) -> str:
+        return ".".join(str(key) for key in info.path.as_list())
+
+    @strawberry.field
+    def fail(self) -> int | None:
+        raise ValueError("This field always fails")
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def items(self, count: int = 2) -> list[Item]:
+        return [Item(id=i) for i in range(count)]
+
+
+calls: list[str] = []
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    async def first(self) -> str:
+        calls.append("first started")
+        await asyncio.sleep(0)
+        calls.append("first finished")
+        return "first"
+
+    @strawberry.mutation
+    async def second(self) -> str:
+        calls.append("second")
+        return "second"
+
+
+QUERY = """
+query Items($count: Int!, $skip: Boolean!) {
+  items(count: $count) {
+    id
+    tripled: multiply(factor: 3) @skip(if: $skip)
+    ...ItemFields
+  }
+}
+
+fragment ItemFields on Item {
+  multiply
+  path
+}
+"""
+
+
+@pytest.fixture
+def plan_cache(monkeypatch: pytest.MonkeyPatch) -> ExecutionPlanCache:
+    plan_cache = ExecutionPlanCache()
+    monkeypatch.setattr(CompiledExecutionContext, "plan_cache", plan_cache)
+
+    return plan_cache
+
+
+def _create_schema(extensions: list[Any] | None = None) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        mutation=Mutation,
+        extensions=[lambda: ParserCache(maxsize=None), *(extensions or [])],
+        execution_context_class=CompiledExecutionContext,
+    )
+
+
+@pytest.mark.parametrize("skip", [False, True])
+async def test_results_match_default_execution(
+    plan_cache: ExecutionPlanCache, skip: bool
+):
+    schema = _create_schema()
+    default_schema = strawberry.Schema(query=Query)
+    variables = {"count": 3, "skip": skip}
+
+    for _ in range(2):
+        result = await schema.execute(QUERY, variable_values=variables)
+        expected = await default_schema.execute(QUERY, variable_values=variables)
+
+        assert not result.errors
+        assert result.data == expected.data
+
+
+async def test_reuses_plans_of_the_same_document(plan_cache: ExecutionPlanCache):
+    schema = _create_schema()
+    plans = set()
+
+    original_get_plan = plan_cache.get_plan
+
+    def get_plan(*args: Any) -> Any:
+        plan = original_get_plan(*args)
+        plans.add(id(plan))
+        return plan
+
+    plan_cache.get_plan = get_plan  # type: ignore[method-assign]
+
+    for count in (1, 2, 3):
+        result = await schema.execute(
+            QUERY, variable_values={"count": count, "skip": False}
+        )
+        assert not result.errors
+
+    assert len(plans) == 1
+    assert len(plan_cache) == 1
+
+
+async def test_conditional_variables_select_the_plan(plan_cache: ExecutionPlanCache):
+    schema = _create_schema()
+
+    included = await schema.execute(QUERY, variable_values={"count": 1, "skip": False})
+    skipped = await schema.execute(QUERY, variable_values={"count": 1, "skip": True})
+    included_again = await schema.execute(
+        QUERY, variable_values={"count": 1, "skip": False}
+    )
+
+    assert included.data == {
+        "items": [{"id": 0, "tripled": 0, "multiply": 0, "path": "items.0.path"}]
+    }
+    assert skipped.data == {"items": [{"id": 0, "multiply": 0, "path": "items.0.path"}]}
+    assert included_again.data == included.data
+
+
+async def test_drops_plans_with_their_document(plan_cache: ExecutionPlanCache):
+    schema = strawberry.Schema(
+        query=Query, execution_context_class=CompiledExecutionContext
+    )
+
+    result = await schema.execute("{ items { id } }")
+
+    assert not result.errors
+    gc.collect()
+    assert len(plan_cache) == 0
+
+
+def test_plans_are_per_schema(plan_cache: ExecutionPlanCache):
+    @strawberry.type
+    class OtherQuery:
+        @strawberry.field
+        def items(self) -> list[str]:
+            return ["a"]
+
+    schema = _create_schema()
+    other_schema = strawberry.Schema(
+        query=OtherQuery,
+        extensions=[lambda: ParserCache(maxsize=None)],
+        execution_context_class=CompiledExecutionContext,
+    )
+
+    assert schema.execute_sync("{ __typename }").data == {"__typename": "Query"}
+    assert other_schema.execute_sync("{ __typename }").data == {
+        "__typename": "OtherQuery"
+    }
+
+
+async def test_runs_resolve_extensions(plan_cache: ExecutionPlanCache):
+    resolved: list[str] = []
+
+    class TrackResolve(SchemaExtension):
+        def resolve(self, _next, root, info, *args: Any, **kwargs: Any) -> Any:
+            resolved.append(info.field_name)
+            return _next(root, info, *args, **kwargs)
+
+    schema = _create_schema(extensions=[TrackResolve])
+
+    for _ in range(2):
+        result = await schema.execute("{ items(count: 1) { multiply(factor: 5) } }")
+
+        assert result.data == {"items": [{"multiply": 0}]}
+
+    assert resolved == ["items", "multiply"] * 2
+
+
+async def test_locates_errors(plan_cache: ExecutionPlanCache):
+    schema = _create_schema()
+
+    result = await schema.execute("{ items(count: 1) { id fail } }")
+
+    assert result.data == {"items": [{"id": 0, "fail": None}]}
+    assert result.errors
+    assert result.errors[0].message == "This field always fails"
+    assert result.errors[0].path == ["items", 0, "fail"]
+
+
+async def test_executes_mutations_serially(plan_cache: ExecutionPlanCache):
+    schema = _create_schema()
+    calls.clear()
+
+    result = await schema.execute("mutation { first second }")
+
+    assert result.data == {"first": "first", "second": "second"}
+    assert calls == ["first started", "first finished", "second"]
+
+
+def test_plans_are_shared_by_documents_not_by_text(plan_cache: ExecutionPlanCache):
+    schema = strawberry.Schema(query=Query)
+    first = parse("{ items { id } }")
+    second = parse("{ items { id } }")
+
+    first_plan = plan_cache.get_plan(
+        schema._schema, first, {}, first.definitions[0], {}
+    )
+    second_plan = plan_cache.get_plan(
+        schema._schema, second, {}, second.definitions[0], {}
+    )
+
+    assert first_plan is not second_plan
+    assert len(plan_cache) == 2
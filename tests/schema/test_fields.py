@@ -1,9 +1,12 @@
 import dataclasses
 import textwrap
 from operator import getitem
+from typing import Any
 
 import strawberry
+from strawberry.extensions import SchemaExtension
 from strawberry.printer import print_schema
+from strawberry.resolvers import is_default_resolver
 from strawberry.schema.config import StrawberryConfig
 from strawberry.types.field import StrawberryField
 
@@ -74,6 +77,36 @@ def test_can_change_default_resolver():
     assert result.data["user"]["name"] == "Patrick"
 
 
+def test_resolve_extensions_see_basic_fields():
+    resolved: list[str] = []
+
+    class TrackResolve(SchemaExtension):
+        def resolve(self, _next, root, info, *args: Any, **kwargs: Any) -> Any:
+            resolved.append(info.field_name)
+            return _next(root, info, *args, **kwargs)
+
+    @strawberry.type
+    class User:
+        name: str
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def user(self) -> User:
+            return User(name="Patrick")
+
+    schema = strawberry.Schema(query=Query, extensions=[TrackResolve])
+
+    result = schema.execute_sync("{ user { name } }")
+
+    assert not result.errors
+    assert result.data == {"user": {"name": "Patrick"}}
+    assert resolved == ["user", "name"]
+
+    user_type = schema._schema.type_map["User"]
+    assert is_default_resolver(user_type.fields["name"].resolve)  # type: ignore
+
+
 def test_field_metadata():
     @strawberry.type
     class Query:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Generic, TypeVar
 
 import pytest
 from pytest_mock import MockerFixture
@@ -423,3 +423,40 @@ def test_resolve_type_on_interface_returning_interface():
     assert result.data
     assert result.data["one"] == {"id": "1", "__typename": "Video"}
     assert result.data["two"] == {"id": "2", "__typename": "Image"}
+
+
+def test_interface_resolves_each_generic_specialization(mocker: MockerFixture):
+    T = TypeVar("T")
+
+    @strawberry.interface
+    class Node:
+        id: strawberry.ID
+
+    @strawberry.type
+    class Box(Node, Generic[T]):
+        content: T
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def nodes(self) -> list[Node]:
+            return [
+                Box(id=strawberry.ID(str(i)), content=i if i % 2 else str(i))
+                for i in range(6)
+            ]
+
+    schema = strawberry.Schema(query=Query, types=[Box[int], Box[str]])
+    spy_is_implemented_by = mocker.spy(StrawberryObjectDefinition, "is_implemented_by")
+    call_counts = []
+
+    for _ in range(2):
+        result = schema.execute_sync("{ nodes { __typename } }")
+
+        assert not result.errors
+        assert result.data == {
+            "nodes": [{"__typename": "StrBox"}, {"__typename": "IntBox"}] * 3
+        }
+        call_counts.append(spy_is_implemented_by.call_count)
+
+    # The types are only searched for the first object of each specialization
+    assert call_counts[0] == call_counts[1]
@@ -0,0 +1,263 @@
+import gc
+import weakref
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+import strawberry
+from strawberry.extensions import ParserCache
+from strawberry.types import lookahead as lookahead_module
+from strawberry.types.lookahead import LookaheadField
+
+lookaheads: list[LookaheadField] = []
+
+
+@strawberry.interface
+class Node:
+    id: strawberry.ID
+
+
+@strawberry.type
+class Author(Node):
+    full_name: str
+
+
+@strawberry.type
+class Comment(Node):
+    body: str
+
+
+@strawberry.input
+class PostFilter:
+    min_likes: int = 0
+
+
+@strawberry.type
+class Post(Node):
+    title: str
+    author: Author
+
+    @strawberry.field
+    def comments(self, first: int = 10) -> list[Comment]:
+        return [Comment(id=strawberry.ID("c1"), body="Nice")][:first]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def posts(
+        self, info: strawberry.Info, filter: PostFilter | None = None
+    ) -> list[Post]:
+        lookaheads.append(info.lookahead)
+        return [
+            Post(
+                id=strawberry.ID(str(i)),
+                title="Hello",
+                author=Author(id=strawberry.ID("a1"), full_name="Jane"),
+            )
+            for i in range(2)
+        ]
+
+    @strawberry.field
+    def search(self, info: strawberry.Info) -> list[Node]:
+        lookaheads.append(info.lookahead)
+        return []
+
+
+schema = strawberry.Schema(query=Query, extensions=[ParserCache])
+
+
+@pytest.fixture(autouse=True)
+def clear_lookaheads():
+    lookaheads.clear()
+
+
+def _execute(query: str, **variables: Any) -> LookaheadField:
+    result = schema.execute_sync(query, variable_values=variables)
+    assert result.errors is None
+    assert len(lookaheads) == 1
+    return lookaheads.pop()
+
+
+def _tree(lookahead: LookaheadField) -> dict[str, Any]:
+    return {
+        selection.response_key: _tree(selection) if selection.selections else None
+        for selection in lookahead.selections
+    }
+
+
+def test_lookahead_of_the_current_field():
+    lookahead = _execute(
+        """
+        query {
+            allPosts: posts(filter: { minLikes: 3 }) {
+                title
+            }
+        }
+        """
+    )
+
+    assert lookahead.name == "posts"
+    assert lookahead.python_name == "posts"
+    assert lookahead.alias == "allPosts"
+    assert lookahead.response_key == "allPosts"
+    assert lookahead.parent_type == "Query"
+    assert lookahead.field is schema.get_type_by_name("Query").get_field("posts")
+    assert lookahead.arguments == {"filter": PostFilter(min_likes=3)}
+
+
+def test_lookahead_merges_fragments():
+    lookahead = _execute(
+        """
+        query {
+            posts {
+                ...PostFields
+                ... on Post {
+                    author { fullName }
+                }
+                author { id }
+            }
+        }
+
+        fragment PostFields on Post {
+            title
+            comments(first: 1) { body }
+        }
+        """
+    )
+
+    assert _tree(lookahead) == {
+        "title": None,
+        "comments": {"body": None},
+        "author": {"fullName": None, "id": None},
+    }
+
+    comments = lookahead.get("comments")
+    assert comments is not None
+    assert comments.arguments == {"first": 1}
+    assert comments.parent_type == "Post"
+
+    author = lookahead.get("author")
+    assert author is not None
+    assert author.type is Author
+    assert author.get("full_name") is not None
+    assert "full_name" in author
+    assert "title" not in author
+
+
+@pytest.mark.parametrize(
+    ("with_author", "without_title", "expected"),
+    [
+        (True, False, {"title": None, "author": {"id": None}}),
+        (False, True, {}),
+    ],
+)
+def test_lookahead_applies_skip_and_include(
+    with_author: bool, without_title: bool, expected: dict[str, Any]
+):
+    lookahead = _execute(
+        """
+        query ($withAuthor: Boolean!, $withoutTitle: Boolean!) {
+            posts {
+                title @skip(if: $withoutTitle)
+                ... @include(if: $withAuthor) {
+                    author { id }
+                }
+                comments @include(if: false) { body }
+            }
+        }
+        """,
+        withAuthor=with_author,
+        withoutTitle=without_title,
+    )
+
+    assert _tree(lookahead) == expected
+
+
+def test_lookahead_of_abstract_types():
+    lookahead = _execute(
+        """
+        query {
+            search {
+                __typename
+                id
+                ... on Post { title }
+                ... on Comment { body }
+            }
+        }
+        """
+    )
+
+    assert sorted(
+        (selection.parent_type, selection.python_name)
+        for selection in lookahead.selections
+    ) == [
+        ("Author", "__typename"),
+        ("Author", "id"),
+        ("Comment", "__typename"),
+        ("Comment", "body"),
+        ("Comment", "id"),
+        ("Post", "__typename"),
+        ("Post", "id"),
+        ("Post", "title"),
+    ]
+
+    typename = lookahead.get("__typename")
+    assert typename is not None
+    assert typename.field is None
+    assert typename.type is None
+    assert lookahead.get("title", type_name="Comment") is None
+    assert lookahead.get("title", type_name="Post") is not None
+
+
+def test_fields_are_collected_once_per_operation_and_conditions(
+    mocker: MockerFixture,
+):
+    collect_fields = mocker.spy(lookahead_module, "_collect_fields")
+    query = """
+        query ($first: Int!, $withAuthor: Boolean!) {
+            posts {
+                comments(first: $first) { body }
+                author @include(if: $withAuthor) { fullName }
+            }
+        }
+    """
+
+    for variables in (
+        {"first": 1, "withAuthor": True},
+        {"first": 2, "withAuthor": True},
+        {"first": 1, "withAuthor": False},
+    ):
+        result = schema.execute_sync(query, variable_values=variables)
+        assert result.errors is None
+
+    first, other_arguments, without_author = lookaheads
+
+    assert first is not other_arguments
+    assert first.selections[0].arguments == {"first": 1}
+    assert other_arguments.selections[0].arguments == {"first": 2}
+    assert collect_fields.call_count == 1
+
+    assert [field.name for field in without_author.selections] == ["comments"]
+    assert collect_fields.call_count == 2
+
+
+def test_lookaheads_dont_keep_the_variables_alive():
+    query = """
+        query ($filter: PostFilter!) {
+            posts(filter: $filter) { title }
+        }
+    """
+
+    result = schema.execute_sync(query, variable_values={"filter": {"minLikes": 3}})
+    assert result.errors is None
+
+    post_filter = lookaheads.pop().arguments["filter"]
+    assert post_filter == PostFilter(min_likes=3)
+
+    post_filter_ref = weakref.ref(post_filter)
+    del post_filter
+    gc.collect()
+
+    assert post_filter_ref() is None
@@ -0,0 +1,206 @@
+import json
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from graphql import DocumentNode, GraphQLError, ValidationRule
+
+import strawberry
+from strawberry.extensions import AddValidationRules
+from strawberry.persisted_documents import (
+    InMemoryDocumentStore,
+    ManifestDocumentStore,
+    PersistedDocumentsConfig,
+    compute_document_id,
+)
+from strawberry.schema.config import StrawberryConfig
+
+QUERY = "{ hello }"
+DOCUMENT_ID = compute_document_id(QUERY)
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+
+def _persisted_query(document_id: str = DOCUMENT_ID) -> dict:
+    return {"persistedQuery": {"version": 1, "sha256Hash": document_id}}
+
+
+def _create_schema(**kwargs: Any) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        config=StrawberryConfig(persisted_documents=PersistedDocumentsConfig(**kwargs)),
+    )
+
+
+async def test_unknown_document_id_is_not_found():
+    schema = _create_schema()
+
+    result = await schema.execute(None, operation_extensions=_persisted_query())
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].message == "PersistedQueryNotFound"
+    assert result.errors[0].extensions == {"code": "PERSISTED_QUERY_NOT_FOUND"}
+
+
+async def test_registers_documents_sent_with_their_hash():
+    store = InMemoryDocumentStore()
+    schema = _create_schema(store=store)
+
+    result = await schema.execute(QUERY, operation_extensions=_persisted_query())
+
+    assert not result.errors
+    assert result.data == {"hello": "world"}
+    assert store.get(DOCUMENT_ID) == QUERY
+
+    result = await schema.execute(None, operation_extensions=_persisted_query())
+
+    assert not result.errors
+    assert result.data == {"hello": "world"}
+
+
+async def test_does_not_register_invalid_documents():
+    store = InMemoryDocumentStore()
+    schema = _create_schema(store=store)
+    query = "{ unknown }"
+
+    result = await schema.execute(
+        query, operation_extensions=_persisted_query(compute_document_id(query))
+    )
+
+    assert result.errors
+    assert store.get(compute_document_id(query)) is None
+
+
+async def test_rejects_hash_that_does_not_match_the_query():
+    schema = _create_schema()
+
+    result = await schema.execute(
+        QUERY, operation_extensions=_persisted_query("not-the-hash")
+    )
+
+    assert result.errors
+    assert result.errors[0].message == "provided sha does not match query"
+
+
+def test_skips_parsing_and_validation_of_known_documents():
+    schema = _create_schema(store=InMemoryDocumentStore({DOCUMENT_ID: QUERY}))
+
+    result = schema.execute_sync(None, operation_extensions=_persisted_query())
+    assert result.data == {"hello": "world"}
+
+    with (
+        patch("strawberry.schema.schema.parse") as parse,
+        patch("strawberry.schema.schema.validate") as validate,
+    ):
+        result = schema.execute_sync(None, operation_extensions=_persisted_query())
+
+    assert result.data == {"hello": "world"}
+    parse.assert_not_called()
+    validate.assert_not_called()
+
+
+def test_validates_again_when_validation_rules_change():
+    class RejectEverything(ValidationRule):
+        def enter_document(self, node: DocumentNode, *args: Any) -> None:
+            self.report_error(GraphQLError("Nope"))
+
+    persisted_documents = PersistedDocumentsConfig(
+        store=InMemoryDocumentStore({DOCUMENT_ID: QUERY})
+    )
+    schema = strawberry.Schema(
+        query=Query,
+        config=StrawberryConfig(persisted_documents=persisted_documents),
+    )
+    strict_schema = strawberry.Schema(
+        query=Query,
+        extensions=[lambda: AddValidationRules([RejectEverything])],
+        config=StrawberryConfig(persisted_documents=persisted_documents),
+    )
+
+    assert not schema.execute_sync(None, operation_extensions=_persisted_query()).errors
+
+    result = strict_schema.execute_sync(None, operation_extensions=_persisted_query())
+
+    assert result.errors
+    assert result.errors[0].message == "Nope"
+
+
+async def test_trusted_documents_only_rejects_documents_sent_as_text():
+    schema = _create_schema(
+        store=InMemoryDocumentStore({DOCUMENT_ID: QUERY}),
+        trusted_documents_only=True,
+    )
+
+    result = await schema.execute(QUERY)
+
+    assert result.errors
+    assert result.errors[0].extensions == {"code": "PERSISTED_QUERY_ID_REQUIRED"}
+
+    result = await schema.execute(None, operation_extensions=_persisted_query())
+
+    assert result.data == {"hello": "world"}
+
+
+async def test_trusted_documents_only_does_not_register_documents():
+    query = "{ __typename }"
+    store = InMemoryDocumentStore()
+    schema = _create_schema(store=store, trusted_documents_only=True)
+
+    result = await schema.execute(
+        query, operation_extensions=_persisted_query(compute_document_id(query))
+    )
+
+    assert result.errors
+    assert result.errors[0].message == "PersistedQueryNotFound"
+    assert store.get(compute_document_id(query)) is None
+
+
+async def test_persisted_query_without_configuration_is_not_supported():
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute(None, operation_extensions=_persisted_query())
+
+    assert result.errors
+    assert result.errors[0].message == "PersistedQueryNotSupported"
+
+
+def test_in_memory_store_evicts_least_recently_used_documents():
+    store = InMemoryDocumentStore({"a": "{ a }", "b": "{ b }"}, maxsize=2)
+
+    assert store.get("a") == "{ a }"
+
+    store.set("c", "{ c }")
+
+    assert store.get("a") == "{ a }"
+    assert store.get("b") is None
+    assert store.get("c") == "{ c }"
+
+
+@pytest.mark.parametrize(
+    "manifest",
+    [
+        {DOCUMENT_ID: QUERY},
+        {
+            "format": "apollo-persisted-query-manifest",
+            "version": 1,
+            "operations": [
+                {"id": DOCUMENT_ID, "name": None, "type": "query", "body": QUERY}
+            ],
+        },
+    ],
+)
+def test_manifest_store(tmp_path, manifest):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest))
+
+    store = ManifestDocumentStore(path)
+    store.set("other", "{ other }")
+
+    assert store.get(DOCUMENT_ID) == QUERY
+    assert store.get("other") is None
@@ -0,0 +1,162 @@
+from enum import Enum
+from typing import Generic, TypeVar
+
+from pytest_mock import MockerFixture
+
+import strawberry
+from strawberry.annotation import StrawberryAnnotation
+from strawberry.schema.build_profile import SchemaBuildProfile
+from strawberry.schema.config import StrawberryConfig
+from strawberry.utils.build_cache import (
+    is_build_cache_enabled,
+    schema_build_cache,
+)
+
+T = TypeVar("T")
+
+
+@strawberry.enum
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@strawberry.type
+class Edge(Generic[T]):
+    node: T
+
+
+@strawberry.input
+class Filter:
+    first_name: str | None = None
+
+
+@strawberry.type
+class User:
+    first_name: str
+    favorite_color: Color
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def users(self, filter: Filter | None = None) -> list[Edge[User]]:
+        return []
+
+
+def test_build_profile_is_disabled_by_default():
+    schema = strawberry.Schema(query=Query)
+
+    assert schema.build_profile is None
+    assert schema.schema_converter.build_profile is None
+
+
+def test_build_profile():
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(profile_schema_build=True)
+    )
+
+    profile = schema.build_profile
+
+    assert isinstance(profile, SchemaBuildProfile)
+    assert list(profile.phases) == [
+        "convert root types",
+        "build GraphQL schema",
+        "resolve node ids",
+        "extend introspection",
+        "validate schema",
+    ]
+    assert set(profile.types) == {"Color", "Filter", "Query", "User", "UserEdge"}
+    assert all(duration >= 0 for duration in profile.types.values())
+    assert profile.total == sum(profile.phases.values())
+    # The profile isn't updated after the schema is built
+    assert schema.schema_converter.build_profile is None
+
+
+def test_build_profile_excludes_nested_types(mocker: MockerFixture):
+    # Outer starts at 0 and ends at 7, Inner takes 2 of that. Outer is then
+    # converted again, from 10 to 11.
+    mocker.patch(
+        "strawberry.schema.build_profile.perf_counter",
+        side_effect=[0.0, 1.0, 3.0, 7.0, 10.0, 11.0],
+    )
+    profile = SchemaBuildProfile()
+
+    with profile.type("Outer"), profile.type("Inner"):
+        pass
+
+    with profile.type("Outer"):
+        pass
+
+    assert profile.types == {"Inner": 2.0, "Outer": 6.0}
+
+
+def test_build_profile_report():
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(profile_schema_build=True)
+    )
+
+    assert schema.build_profile
+    report = schema.build_profile.report(limit=2)
+    lines = report.splitlines()
+
+    assert lines[0].startswith("Schema built in ")
+    assert "Phases:" in lines
+    assert "Types (5):" in lines
+    assert len(lines[lines.index("Types (5):") + 1 :]) == 2
+    assert "validate schema" in report
+
+
+def test_build_cache_is_only_enabled_while_building():
+    assert not is_build_cache_enabled()
+
+    with schema_build_cache():
+        assert is_build_cache_enabled()
+
+        with schema_build_cache(enabled=False):
+            assert not is_build_cache_enabled()
+
+        assert is_build_cache_enabled()
+
+    assert not is_build_cache_enabled()
+
+
+def test_build_cache_builds_the_same_schema():
+    schema = strawberry.Schema(query=Query)
+    cached_schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(cache_schema_build=True)
+    )
+    rebuilt_schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(cache_schema_build=True)
+    )
+
+    assert str(cached_schema) == str(schema)
+    assert str(rebuilt_schema) == str(schema)
+    assert not is_build_cache_enabled()
+
+    result = rebuilt_schema.execute_sync("{ users { node { firstName } } }")
+
+    assert not result.errors
+    assert result.data == {"users": []}
+
+
+def test_build_cache_respects_auto_camel_case():
+    schema = strawberry.Schema(
+        query=Query,
+        config=StrawberryConfig(auto_camel_case=False, cache_schema_build=True),
+    )
+
+    assert "first_name: String!" in str(schema)
+
+
+def test_build_cache_is_invalidated_with_the_annotation():
+    int_edge = StrawberryAnnotation(Edge[int]).resolve()
+    type_definition = int_edge.__strawberry_definition__  # type: ignore[union-attr]
+    annotation = StrawberryAnnotation(str)
+
+    with schema_build_cache():
+        assert annotation.resolve(type_definition=type_definition) is str
+
+        annotation.annotation = T
+
+        assert annotation.resolve(type_definition=type_definition) is int
@@ -0,0 +1,288 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+import strawberry
+from strawberry.schema.config import StrawberryConfig
+from strawberry.subscriptions.multiplexer import SubscriptionMultiplexingConfig
+from strawberry.types.execution import ExecutionResult
+from strawberry.utils.aio import aclosing
+
+events: asyncio.Queue[int | None]
+sources: list[str] = []
+closed: list[str] = []
+
+
+resolved: list[int] = []
+
+
+@strawberry.type
+class Query:
+    hello: str = "world"
+
+
+@strawberry.type
+class Score:
+    points: strawberry.Private[int]
+
+    @strawberry.field
+    def value(self) -> int:
+        resolved.append(self.points)
+        return self.points
+
+
+@strawberry.type
+class Subscription:
+    @strawberry.subscription
+    async def score(self, game: str) -> AsyncGenerator[Score, None]:
+        sources.append(game)
+
+        try:
+            while (points := await events.get()) is not None:
+                yield Score(points=points)
+        finally:
+            closed.append(game)
+
+    @strawberry.subscription
+    async def fail(self) -> AsyncGenerator[int, None]:
+        raise ValueError("Source failed")
+        yield 1  # pragma: no cover
+
+
+@pytest.fixture(autouse=True)
+def reset_sources() -> None:
+    global events
+    events = asyncio.Queue()
+    sources.clear()
+    closed.clear()
+    resolved.clear()
+
+
+async def _cancel(task: asyncio.Future[Any]) -> None:
+    task.cancel()
+
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+def _create_schema(
+    extensions: list[Any] | None = None, **options: Any
+) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        subscription=Subscription,
+        extensions=extensions or [],
+        config=StrawberryConfig(
+            subscription_multiplexing=SubscriptionMultiplexingConfig(
+                context_key=lambda context: context and context.get("user"),
+                **options,
+            )
+        ),
+    )
+
+
+QUERY = "subscription Score($game: String!) { score(game: $game) { value } }"
+
+
+async def test_identical_subscriptions_share_one_source():
+    schema = _create_schema()
+    first = await schema.subscribe(QUERY, variable_values={"game": "final"})
+    second = await schema.subscribe(QUERY, variable_values={"game": "final"})
+
+    async with aclosing(first), aclosing(second):
+        first_result = asyncio.ensure_future(first.__anext__())
+        second_result = asyncio.ensure_future(second.__anext__())
+        await asyncio.sleep(0.01)
+        events.put_nowait(1)
+
+        assert (await first_result).data == {"score": {"value": 1}}
+        assert (await second_result).data == {"score": {"value": 1}}
+        assert first_result.result() is second_result.result()
+
+    await asyncio.sleep(0)
+    assert sources == ["final"]
+    assert closed == ["final"]
+    assert len(schema._subscription_multiplexer) == 0
+
+
+async def test_different_variables_and_contexts_dont_share():
+    schema = _create_schema()
+    subscriptions = [
+        await schema.subscribe(QUERY, variable_values={"game": "final"}),
+        await schema.subscribe(QUERY, variable_values={"game": "semi"}),
+        await schema.subscribe(
+            QUERY, variable_values={"game": "final"}, context_value={"user": 1}
+        ),
+    ]
+    pending = [asyncio.ensure_future(s.__anext__()) for s in subscriptions]
+    await asyncio.sleep(0.01)
+
+    assert sorted(sources) == ["final", "final", "semi"]
+    assert len(schema._subscription_multiplexer) == 3
+
+    for subscription, result in zip(subscriptions, pending, strict=True):
+        await _cancel(result)
+        await subscription.aclose()
+
+
+async def test_source_is_closed_when_the_last_subscriber_leaves():
+    schema = _create_schema()
+    first = await schema.subscribe(QUERY, variable_values={"game": "final"})
+    second = await schema.subscribe(QUERY, variable_values={"game": "final"})
+
+    first_result = asyncio.ensure_future(first.__anext__())
+    second_result = asyncio.ensure_future(second.__anext__())
+    await asyncio.sleep(0.01)
+
+    await _cancel(first_result)
+    await first.aclose()
+    await asyncio.sleep(0)
+    assert closed == []
+
+    events.put_nowait(2)
+    assert (await second_result).data == {"score": {"value": 2}}
+
+    await second.aclose()
+    await asyncio.sleep(0)
+    assert closed == ["final"]
+
+
+async def test_all_subscribers_complete_with_the_source():
+    schema = _create_schema()
+    first = await schema.subscribe(QUERY, variable_values={"game": "final"})
+    second = await schema.subscribe(QUERY, variable_values={"game": "final"})
+
+    async def collect(subscription: Any) -> list[Any]:
+        return [result.data async for result in subscription]
+
+    results = asyncio.gather(collect(first), collect(second))
+    await asyncio.sleep(0.01)
+    events.put_nowait(1)
+    events.put_nowait(2)
+    events.put_nowait(None)
+
+    assert await results == [[{"score": {"value": 1}}, {"score": {"value": 2}}]] * 2
+
+
+async def test_slow_subscribers_are_disconnected(mocker: MockerFixture):
+    schema = _create_schema(max_buffered_events=1)
+    process_errors = mocker.spy(schema, "process_errors")
+    fast = await schema.subscribe(QUERY, variable_values={"game": "final"})
+    slow = await schema.subscribe(QUERY, variable_values={"game": "final"})
+
+    async def read_fast() -> list[Any]:
+        return [(await fast.__anext__()).data for _ in range(3)]
+
+    fast_results = asyncio.ensure_future(read_fast())
+    slow_first = asyncio.ensure_future(slow.__anext__())
+    await asyncio.sleep(0.01)
+
+    for score in (1, 2, 3):
+        events.put_nowait(score)
+
+    # The slow subscriber doesn't stall the fast one
+    assert (await slow_first).data == {"score": {"value": 1}}
+    assert await fast_results == [
+        {"score": {"value": 1}},
+        {"score": {"value": 2}},
+        {"score": {"value": 3}},
+    ]
+
+    overflow = await slow.__anext__()
+
+    assert isinstance(overflow, ExecutionResult)
+    assert overflow.data is None
+    process_errors.assert_called_once_with(overflow.errors, mocker.ANY)
+    assert overflow.errors[0].message == (
+        "Subscription fell too far behind and was disconnected, "
+        "subscribe again to resume receiving events"
+    )
+
+    with pytest.raises(StopAsyncIteration):
+        await slow.__anext__()
+
+    # The shared stream keeps running for the remaining subscriber
+    events.put_nowait(4)
+    assert (await fast.__anext__()).data == {"score": {"value": 4}}
+    assert sources == ["final"]
+
+    await fast.aclose()
+    assert closed == ["final"]
+
+
+async def test_source_is_closed_when_every_subscriber_is_disconnected():
+    schema = _create_schema(max_buffered_events=1)
+    slow = await schema.subscribe(QUERY, variable_values={"game": "final"})
+
+    first = asyncio.ensure_future(slow.__anext__())
+    await asyncio.sleep(0.01)
+
+    for score in (1, 2, 3):
+        events.put_nowait(score)
+
+    assert (await first).data == {"score": {"value": 1}}
+    await asyncio.sleep(0.01)
+
+    assert closed == ["final"]
+    assert (await slow.__anext__()).errors
+    await slow.aclose()
+
+
+async def test_errors_of_the_shared_source_reach_every_subscriber():
+    schema = _create_schema()
+
+    async def first_result() -> Any:
+        async with aclosing(await schema.subscribe("subscription { fail }")) as sub:
+            return await sub.__anext__()
+
+    first, second = await asyncio.gather(first_result(), first_result())
+
+    assert first.errors[0].message == "Source failed"
+    assert second.errors[0].message == "Source failed"
+
+
+async def test_operations_are_validated_for_each_subscriber():
+    schema = _create_schema()
+
+    async with aclosing(await schema.subscribe("subscription { nope }")) as sub:
+        result = await sub.__anext__()
+
+    assert result.errors[0].message == (
+        "Cannot query field 'nope' on type 'Subscription'."
+    )
+    assert len(schema._subscription_multiplexer) == 0
+
+
+async def test_events_are_executed_once():
+    schema = _create_schema()
+    subscriptions = [
+        await schema.subscribe(QUERY, variable_values={"game": "final"})
+        for _ in range(3)
+    ]
+    pending = [asyncio.ensure_future(s.__anext__()) for s in subscriptions]
+    await asyncio.sleep(0.01)
+    events.put_nowait(1)
+
+    results = [await result for result in pending]
+
+    assert [result.data for result in results] == [{"score": {"value": 1}}] * 3
+    assert resolved == [1]
+
+    for subscription in subscriptions:
+        await subscription.aclose()
+
+
+async def test_unhashable_variables_dont_share():
+    schema = _create_schema()
+    multiplexer = schema._subscription_multiplexer
+    execution_context = schema._create_execution_context(
+        QUERY,
+        allowed_operation_types=(),
+        variable_values={"game": {"final"}},
+    )
+
+    assert multiplexer.get_key(execution_context) is None
@@ -4,9 +4,11 @@ from textwrap import dedent
 from typing import Annotated, Any, ClassVar, Generic, TypeVar, Union
 
 import pytest
+from pytest_mock import MockerFixture
 
 import strawberry
 from strawberry.exceptions import InvalidUnionTypeError
+from strawberry.types.base import StrawberryObjectDefinition
 from strawberry.types.lazy_type import lazy
 
 
@@ -1440,3 +1442,31 @@ def test_annotated_union_inside_generic_subclass():
             ]
         }
     }
+
+
+def test_union_of_generics_resolves_each_specialization(mocker: MockerFixture):
+    T = TypeVar("T")
+
+    @strawberry.type
+    class Edge(Generic[T]):
+        node: T
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def edges(self) -> list[Edge[int] | Edge[str]]:
+            return [Edge(node=i) if i % 2 else Edge(node=str(i)) for i in range(6)]
+
+    schema = strawberry.Schema(query=Query)
+    spy_is_implemented_by = mocker.spy(StrawberryObjectDefinition, "is_implemented_by")
+
+    for _ in range(2):
+        result = schema.execute_sync("{ edges { __typename } }")
+
+        assert not result.errors
+        assert result.data == {
+            "edges": [{"__typename": "StrEdge"}, {"__typename": "IntEdge"}] * 3
+        }
+
+    # The types are only searched for the first object of each specialization
+    assert spy_is_implemented_by.call_count == 3
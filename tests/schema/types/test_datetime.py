@@ -52,6 +52,25 @@ def test_serialization(typing, instance, serialized):
             datetime.datetime(2019, 10, 25, 13, 37, tzinfo=dateutil.tz.tzutc()),
             "2019-10-25T13:37:00Z",
         ),
+        (
+            datetime.datetime,
+            "DateTime",
+            datetime.datetime(
+                2019,
+                10,
+                25,
+                13,
+                37,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=1)),
+            ),
+            "2019-10-25T13:37:00+0100",
+        ),
+        (
+            datetime.datetime,
+            "DateTime",
+            datetime.datetime(2019, 10, 26),
+            "2019-10-25T24:00",
+        ),
         (datetime.time, "Time", datetime.time(13, 37), "13:37:00"),
     ],
 )
@@ -147,6 +166,9 @@ def execute_mutation(value) -> ExecutionResult:
         "20120411T03:30+00:61",
         "20120411T033030.123456012:002014-03-12T12:30:14",
         "2014-04-21T24:00:01",
+        "2024-01-01T10:00:00+05:30:15",
+        "2024-01-01T10:00:00+05:30:15.123456",
+        "2024-01-01T10:00:00 +05:30",
     ],
 )
 def test_serialization_of_incorrect_datetime_string(value):
@@ -174,3 +196,38 @@ def test_serialization_error_message_for_incorrect_datetime_string():
     assert result.errors[0].message.startswith(
         expected_message,
     )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-01T10:00",
+        "2024-01-01T10:00:00",
+        "2024-01-01T10:00:00.123",
+        "2024-01-01T10:00:00.1234567",
+        "2024-01-01T10:00:00Z",
+        "2024-01-01T10:00:00z",
+        "2024-01-01T10:00:00+00:00",
+        "2024-01-01T10:00:00-00:00",
+        "2024-01-01T10:00:00.123456+05:30",
+        "2024-01-01T10:00:00-12:00",
+        "2024-01-01T10:00:00+0530",
+        "2024-01-01T10:00:00+05",
+        "2024-01-01T24:00",
+        "2024-01-01 10:00:00",
+        "20240101T100000Z",
+        "2024-01-01",
+    ],
+)
+def test_datetime_parsing_matches_dateutil(value: str):
+    from dateutil.parser import isoparse
+
+    from strawberry.schema.types.base_scalars import parse_datetime
+
+    parsed = parse_datetime(value)
+    expected = isoparse(value)
+
+    assert parsed == expected
+    assert parsed.replace(tzinfo=None) == expected.replace(tzinfo=None)
+    assert type(parsed.tzinfo) is type(expected.tzinfo)
+    assert parsed.tzinfo == expected.tzinfo
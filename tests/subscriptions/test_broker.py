@@ -0,0 +1,207 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any
+
+import pytest
+
+import strawberry
+from strawberry.subscriptions.broker import Broker, BrokerBackend
+from strawberry.utils.aio import aclosing
+
+
+def _matches(pattern: str, topic: str) -> bool:
+    pattern_segments = pattern.split(".")
+    topic_segments = topic.split(".")
+
+    if pattern_segments[-1] == "#":
+        prefix = pattern_segments[:-1]
+        topic_segments = topic_segments[: len(prefix)]
+        pattern_segments = prefix
+
+    return len(pattern_segments) == len(topic_segments) and all(
+        pattern in ("*", topic)
+        for pattern, topic in zip(pattern_segments, topic_segments, strict=True)
+    )
+
+
+class LocalBus:
+    """Stands in for an external message bus shared by several processes."""
+
+    def __init__(self) -> None:
+        self.backends: list[LocalBackend] = []
+
+
+class LocalBackend(BrokerBackend):
+    def __init__(self, bus: LocalBus) -> None:
+        self.bus = bus
+        self.patterns: set[str] = set()
+        self.received: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+        bus.backends.append(self)
+
+    async def publish(self, topic: str, event: Any) -> None:
+        for backend in self.bus.backends:
+            if any(_matches(pattern, topic) for pattern in backend.patterns):
+                backend.received.put_nowait((topic, event))
+
+    async def subscribe(self, pattern: str) -> None:
+        self.patterns.add(pattern)
+
+    async def unsubscribe(self, pattern: str) -> None:
+        self.patterns.discard(pattern)
+
+    async def listen(self) -> AsyncIterator[tuple[str, Any]]:
+        while True:
+            yield await self.received.get()
+
+
+async def _receive(subscription: Any, count: int) -> list[Any]:
+    return [await asyncio.wait_for(subscription.__anext__(), 1) for _ in range(count)]
+
+
+@pytest.mark.parametrize(
+    ("pattern", "topic", "matches"),
+    [
+        ("scores.final", "scores.final", True),
+        ("scores.final", "scores.semi", False),
+        ("scores.*", "scores.final", True),
+        ("scores.*", "scores", False),
+        ("scores.*", "scores.final.home", False),
+        ("*.final", "scores.final", True),
+        ("scores.#", "scores", True),
+        ("scores.#", "scores.final.home", True),
+        ("scores.#", "games.final", False),
+        ("#", "scores.final", True),
+        ("scores.*.#", "scores.final.home", True),
+        ("scores.*.#", "scores", False),
+    ],
+)
+async def test_wildcards(pattern: str, topic: str, matches: bool):
+    broker = Broker()
+
+    async with broker.subscribe(pattern) as subscription:
+        await broker.publish(topic, "event")
+
+        assert len(subscription) == int(matches)
+
+    assert _matches(pattern, topic) is matches
+
+
+async def test_events_are_broadcast_without_copies():
+    broker = Broker()
+    event = {"score": 1}
+
+    async with (
+        broker.subscribe("scores.final") as first,
+        broker.subscribe("scores.*") as second,
+        broker.subscribe("scores.semi") as other,
+    ):
+        await broker.publish("scores.final", event)
+
+        assert await first.__anext__() is event
+        assert await second.__anext__() is event
+        assert len(other) == 0
+
+
+async def test_slow_subscribers_drop_their_oldest_events():
+    broker = Broker(buffer_size=2)
+
+    async with broker.subscribe("scores.final") as subscription:
+        for score in range(5):
+            await broker.publish("scores.final", score)
+
+        assert await _receive(subscription, 2) == [3, 4]
+        assert subscription.dropped == 3
+
+
+async def test_subscriptions_wait_for_events_and_unsubscribe():
+    broker = Broker()
+
+    async def publish() -> None:
+        await asyncio.sleep(0.01)
+        await broker.publish("scores.final", 1)
+        await broker.publish("scores.final", 2)
+
+    task = asyncio.ensure_future(publish())
+
+    async with broker.subscribe("scores.final") as subscription:
+        assert await _receive(subscription, 2) == [1, 2]
+
+    await task
+    assert broker._root.children == {}
+    assert broker._pattern_counts == {}
+
+
+async def test_close_ends_subscriptions_after_their_buffered_events():
+    broker = Broker()
+
+    async with broker.subscribe("scores.final") as subscription:
+        await broker.publish("scores.final", 1)
+        await broker.close()
+
+        assert [event async for event in subscription] == [1]
+
+
+async def test_invalid_patterns_and_topics():
+    broker = Broker()
+
+    with pytest.raises(ValueError, match="can only be the last segment"):
+        broker.subscribe("scores.#.home")
+
+    with pytest.raises(ValueError, match="can't be published to patterns"):
+        await broker.publish("scores.*", 1)
+
+
+async def test_backends_connect_brokers():
+    bus = LocalBus()
+    first_backend, second_backend = LocalBackend(bus), LocalBackend(bus)
+    first, second = Broker(first_backend), Broker(second_backend)
+
+    local = await first.subscribe("scores.final").__aenter__()
+    remote = await second.subscribe("scores.*").__aenter__()
+    other_remote = await second.subscribe("scores.#").__aenter__()
+
+    assert first_backend.patterns == {"scores.final"}
+    assert second_backend.patterns == {"scores.*", "scores.#"}
+
+    await first.publish("scores.final", 1)
+
+    # Each process receives the event once, whatever the matching patterns
+    assert await _receive(local, 1) == [1]
+    assert await _receive(remote, 1) == [1]
+    assert await _receive(other_remote, 1) == [1]
+
+    await remote.close()
+    await other_remote.close()
+    assert second_backend.patterns == set()
+
+    await first.close()
+    await second.close()
+
+
+async def test_subscription_resolvers_listen_to_the_broker():
+    broker = Broker()
+
+    @strawberry.type
+    class Query:
+        hello: str = "world"
+
+    @strawberry.type
+    class Subscription:
+        @strawberry.subscription
+        async def score(self, game: str) -> AsyncGenerator[int, None]:
+            async with broker.subscribe(f"scores.{game}") as scores:
+                async for score in scores:
+                    yield score
+
+    schema = strawberry.Schema(query=Query, subscription=Subscription)
+
+    async with aclosing(
+        await schema.subscribe('subscription { score(game: "final") }')
+    ) as results:
+        next_result = asyncio.ensure_future(results.__anext__())
+        await asyncio.sleep(0.01)
+        await broker.publish("scores.final", 3)
+
+        assert (await next_result).data == {"score": 3}
+
+    assert broker._pattern_counts == {}
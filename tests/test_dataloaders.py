@@ -6,7 +6,18 @@ from typing import Any, Optional, cast
 import pytest
 from pytest_mock import MockerFixture
 
-from strawberry.dataloader import AbstractCache, DataLoader
+from strawberry.dataloader import (
+    AbstractCache,
+    DataLoader,
+    DefaultCache,
+    DispatchAfterDelay,
+    DispatchAfterTicks,
+    DispatchPolicy,
+    DispatchWhenIdle,
+    LRUCache,
+    TieredCache,
+    TTLCache,
+)
 from strawberry.exceptions import WrongNumberOfResultsReturned
 
 IDXType = Callable[[list[int]], Awaitable[list[int]]]
@@ -652,3 +663,262 @@ def test_works_when_created_in_a_different_loop(mocker: MockerFixture):
     assert data == 1
 
     mock_loader.assert_called_once_with([1])
+
+
+@pytest.mark.asyncio
+async def test_lru_cache_evicts_least_recently_used(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    cache = LRUCache[int, int](maxsize=2)
+    loader = DataLoader(load_fn=cast("IDXType", mock_loader), cache_map=cache)
+
+    assert await loader.load_many([1, 2]) == [1, 2]
+    assert await loader.load(1) == 1
+    assert await loader.load(3) == 3
+
+    assert list(cache.cache_map) == [1, 3]
+    assert cache.stats.evictions == 1
+
+    assert await loader.load(2) == 2
+
+    assert mock_loader.call_args_list == [
+        mocker.call([1, 2]),
+        mocker.call([3]),
+        mocker.call([2]),
+    ]
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 4
+
+
+@pytest.mark.asyncio
+async def test_lru_cache_clear_ignores_evicted_keys():
+    cache = LRUCache[int, int](maxsize=1)
+    loader = DataLoader(load_fn=idx, cache_map=cache)
+
+    await loader.load_many([1, 2])
+    loader.clear(1)
+    loader.clear(2)
+
+    assert len(cache) == 0
+
+
+def test_ttl_cache_is_shared_across_event_loops(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    cache = TTLCache[int, int](ttl=60)
+
+    async def run() -> list[int]:
+        loader = DataLoader(load_fn=cast("IDXType", mock_loader), cache_map=cache)
+        return await loader.load_many([1, 2])
+
+    assert asyncio.run(run()) == [1, 2]
+    assert asyncio.run(run()) == [1, 2]
+
+    mock_loader.assert_called_once_with([1, 2])
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_expires_values(mocker: MockerFixture):
+    now = 0.0
+    mock_loader = mocker.Mock(side_effect=idx)
+    cache = TTLCache[int, int](ttl=10, timer=lambda: now)
+
+    assert await DataLoader(cast("IDXType", mock_loader), cache_map=cache).load(1) == 1
+
+    now = 5.0
+    assert await DataLoader(cast("IDXType", mock_loader), cache_map=cache).load(1) == 1
+    mock_loader.assert_called_once_with([1])
+
+    now = 10.0
+    assert await DataLoader(cast("IDXType", mock_loader), cache_map=cache).load(1) == 1
+    assert mock_loader.call_count == 2
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_deduplicates_pending_loads(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    cache = TTLCache[int, int](ttl=60)
+    first = DataLoader(load_fn=cast("IDXType", mock_loader), cache_map=cache)
+    second = DataLoader(load_fn=cast("IDXType", mock_loader), cache_map=cache)
+
+    assert await asyncio.gather(first.load(1), second.load(1)) == [1, 1]
+
+    mock_loader.assert_called_once_with([1])
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_does_not_cache_errors():
+    calls = 0
+
+    async def load(keys: list[int]) -> list[int | BaseException]:
+        nonlocal calls
+        calls += 1
+        return [ValueError("Not found") if calls == 1 else key for key in keys]
+
+    cache = TTLCache[int, int](ttl=60)
+
+    with pytest.raises(ValueError, match="Not found"):
+        await DataLoader(load_fn=load, cache_map=cache).load(1)
+
+    assert await DataLoader(load_fn=load, cache_map=cache).load(1) == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache[int, int](ttl=None, maxsize=2)
+    loader = DataLoader(load_fn=idx, cache_map=cache)
+
+    await loader.load_many([1, 2, 3])
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+
+    loader.clear_all()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_checks_the_shared_cache(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    shared = TTLCache[int, int](ttl=60)
+
+    first = TieredCache[int, int](DefaultCache(), shared)
+    loader = DataLoader(load_fn=cast("IDXType", mock_loader), cache_map=first)
+    assert await loader.load_many([1, 2]) == [1, 2]
+    assert await loader.load(1) == 1
+
+    second = TieredCache[int, int](DefaultCache(), shared)
+    loader = DataLoader(load_fn=cast("IDXType", mock_loader), cache_map=second)
+    assert await loader.load_many([1, 2, 3]) == [1, 2, 3]
+
+    assert mock_loader.call_args_list == [mocker.call([1, 2]), mocker.call([3])]
+    assert (first.stats.hits, first.stats.misses) == (1, 2)
+    assert (second.stats.hits, second.stats.misses) == (2, 1)
+    assert second.local.get(1) is not None
+
+    loader.clear(1)
+    assert shared.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_clears_keys_only_in_the_shared_cache():
+    shared = TTLCache[int, int](ttl=60)
+
+    loader = DataLoader(load_fn=idx, cache_map=TieredCache(DefaultCache(), shared))
+    assert await loader.load(1) == 1
+
+    # A new request, which didn't load the key, invalidates it after a mutation
+    loader = DataLoader(load_fn=idx, cache_map=TieredCache(DefaultCache(), shared))
+    loader.clear(1)
+
+    assert shared.get(1) is None
+
+
+async def _load_after_ticks(loader: DataLoader[int, int], key: int) -> int:
+    for _ in range(key):
+        await asyncio.sleep(0)
+
+    return await loader.load(key)
+
+
+@pytest.mark.asyncio
+async def test_dispatches_on_next_tick_by_default(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(load_fn=cast("IDXType", mock_loader))
+
+    keys = [0, 1, 2]
+    assert await asyncio.gather(*(_load_after_ticks(loader, k) for k in keys)) == keys
+
+    assert mock_loader.call_count > 1
+    assert loader.stats.batches == mock_loader.call_count
+    assert loader.stats.keys == 3
+
+
+@pytest.mark.parametrize(
+    "dispatch_policy",
+    [DispatchAfterTicks(3), DispatchAfterDelay(0.01), DispatchWhenIdle()],
+    ids=["ticks", "delay", "idle"],
+)
+@pytest.mark.asyncio
+async def test_dispatch_policies_collect_keys_across_ticks(
+    mocker: MockerFixture, dispatch_policy: DispatchPolicy
+):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(
+        load_fn=cast("IDXType", mock_loader), dispatch_policy=dispatch_policy
+    )
+
+    keys = [0, 1, 2]
+    assert await asyncio.gather(*(_load_after_ticks(loader, k) for k in keys)) == keys
+
+    mock_loader.assert_called_once_with([0, 1, 2])
+    assert loader.stats.batches == 1
+    assert loader.stats.keys == 3
+    assert loader.stats.batch_sizes == {3: 1}
+
+
+@pytest.mark.asyncio
+async def test_dispatch_when_idle_stops_after_max_ticks(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(
+        load_fn=cast("IDXType", mock_loader),
+        dispatch_policy=DispatchWhenIdle(max_ticks=2),
+    )
+
+    keys = [0, 1, 2, 3, 4]
+    assert await asyncio.gather(*(_load_after_ticks(loader, k) for k in keys)) == keys
+
+    assert mock_loader.call_count > 1
+
+
+def test_dispatch_after_ticks_needs_a_tick():
+    with pytest.raises(ValueError, match="ticks must be at least 1"):
+        DispatchAfterTicks(0)
+
+
+@pytest.mark.asyncio
+async def test_coalesces_keys_loaded_while_in_flight():
+    release = asyncio.Event()
+    calls: list[list[int]] = []
+
+    async def load(keys: list[int]) -> list[int]:
+        calls.append(keys)
+        await release.wait()
+        return keys
+
+    loader = DataLoader(load_fn=load, cache=False, coalesce=True)
+
+    first = asyncio.ensure_future(loader.load(1))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    second = loader.load(1)
+    release.set()
+
+    assert await first == 1
+    assert await second == 1
+    assert calls == [[1]]
+
+    assert await loader.load(1) == 1
+    assert calls == [[1], [1]]
+
+
+@pytest.mark.asyncio
+async def test_coalesces_keys_missing_from_the_cache():
+    calls: list[list[int]] = []
+
+    async def load(keys: list[int]) -> list[int]:
+        calls.append(keys)
+        return keys
+
+    class NoPendingCache(DefaultCache[int, int]):
+        def set(self, key: int, value: "Future[int]") -> None:
+            if value.done():
+                super().set(key, value)
+
+    loader = DataLoader(load_fn=load, cache_map=NoPendingCache(), coalesce=True)
+
+    assert await asyncio.gather(loader.load(1), loader.load(1)) == [1, 1]
+    assert calls == [[1]]
@@ -0,0 +1,89 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+# The packages whose public names are imported lazily
+LAZY_PACKAGES = [
+    "strawberry",
+    "strawberry.experimental.pydantic",
+    "strawberry.extensions",
+    "strawberry.federation",
+    "strawberry.relay",
+]
+
+
+def _imported_modules(module: str) -> set[str]:
+    """The modules imported by `import module` in a new interpreter."""
+    code = f"import sys\nimport {module}\n\nprint(*sys.modules, sep='\\n')"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return set(result.stdout.splitlines())
+
+
+@pytest.mark.parametrize("module", LAZY_PACKAGES)
+def test_import_doesnt_load_dependencies(module: str):
+    # Importing graphql-core and pydantic took most of the 100ms that
+    # importing strawberry used to take
+    modules = _imported_modules(module)
+
+    assert module in modules
+    assert not {
+        name for name in modules if name.split(".")[0] in {"graphql", "pydantic"}
+    }
+
+
+@pytest.mark.parametrize("module", LAZY_PACKAGES)
+def test_public_names_are_importable(module: str):
+    package = importlib.import_module(module)
+
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        package.missing
+
+
+def test_names_shadowed_by_their_module():
+    import strawberry.directive
+    import strawberry.federation.field
+    import strawberry.schema_directive
+
+    assert callable(strawberry.directive)
+    assert strawberry.directive is sys.modules["strawberry.directive"].directive
+    assert callable(strawberry.schema_directive)
+    assert (
+        strawberry.federation.field is sys.modules["strawberry.federation.field"].field
+    )
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "strawberry.annotation.StrawberryAnnotation",
+        "strawberry.exceptions.StrawberryException",
+        "strawberry.experimental.pydantic.conversion",
+        "strawberry.extensions.parser_cache.ParserCache",
+        "strawberry.extensions.runner",
+        "strawberry.federation.schema.Schema",
+        "strawberry.file_uploads.Upload",
+        "strawberry.printer.print_schema",
+        "strawberry.relay.types.GlobalID",
+        "strawberry.schema.config.StrawberryConfig",
+        "strawberry.types.Info",
+        "strawberry.types.arguments.StrawberryArgument",
+        "strawberry.utils.str_converters.to_camel_case",
+    ],
+)
+def test_subpackages_are_accessible_after_import(path: str):
+    # A new interpreter, so that nothing else has imported the subpackages
+    code = f"import strawberry\n\nassert {path} is not None"
+
+    subprocess.run([sys.executable, "-c", code], check=True)
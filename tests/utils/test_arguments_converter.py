@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from enum import Enum
 from typing import Annotated, Optional
 
@@ -8,7 +9,13 @@ from strawberry.annotation import StrawberryAnnotation
 from strawberry.exceptions import UnsupportedTypeError
 from strawberry.schema.config import StrawberryConfig
 from strawberry.schema.types.scalar import DEFAULT_SCALAR_REGISTRY
-from strawberry.types.arguments import StrawberryArgument, convert_arguments
+from strawberry.types.arguments import (
+    StrawberryArgument,
+    build_argument_converter,
+    build_arguments_converter,
+    convert_argument,
+    convert_arguments,
+)
 from strawberry.types.unset import UNSET
 
 
@@ -439,3 +446,113 @@ def test_fails_when_passing_non_strawberry_classes():
         )
         == {}
     )
+
+
+@strawberry.input
+class Node:
+    value: int
+    children: Optional[list["Node"]] = UNSET
+
+
+def test_build_arguments_converter_with_recursive_input_types():
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="node",
+            type_annotation=StrawberryAnnotation(Node),
+        )
+    ]
+
+    converter = build_arguments_converter(
+        arguments,
+        scalar_registry=DEFAULT_SCALAR_REGISTRY,
+        config=StrawberryConfig(),
+    )
+
+    assert converter({"node": {"value": 1, "children": [{"value": 2}]}}) == {
+        "node": Node(value=1, children=[Node(value=2)])
+    }
+    assert converter({}) == {}
+
+
+def test_build_argument_converter_reuses_input_type_converters():
+    @strawberry.input
+    class Input:
+        value: int
+
+    converters = {}
+
+    single = build_argument_converter(
+        Input,
+        scalar_registry=DEFAULT_SCALAR_REGISTRY,
+        config=StrawberryConfig(),
+        converters=converters,
+    )
+    optional = build_argument_converter(
+        StrawberryAnnotation(Optional[Input]).resolve(),
+        scalar_registry=DEFAULT_SCALAR_REGISTRY,
+        config=StrawberryConfig(),
+        converters=converters,
+    )
+
+    assert single is optional
+    assert converters == {Input: single}
+    assert single(None) is None
+    assert single(UNSET) is UNSET
+
+
+def test_convert_argument_and_arguments_reuse_their_converters(mocker):
+    from strawberry.types import arguments as arguments_module
+
+    @strawberry.input
+    class Input:
+        value: int
+
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="input",
+            type_annotation=StrawberryAnnotation(Input),
+        )
+    ]
+    config = StrawberryConfig()
+    build_argument_spy = mocker.spy(arguments_module, "build_argument_converter")
+    build_arguments_spy = mocker.spy(arguments_module, "build_arguments_converter")
+
+    for value in range(3):
+        assert convert_argument(
+            {"value": value}, Input, DEFAULT_SCALAR_REGISTRY, config
+        ) == Input(value=value)
+        assert convert_arguments(
+            {"input": {"value": value}}, arguments, DEFAULT_SCALAR_REGISTRY, config
+        ) == {"input": Input(value=value)}
+
+    def count_input_builds() -> int:
+        return sum(call.args[0] is Input for call in build_argument_spy.call_args_list)
+
+    # Once for `convert_argument`, and once for the field of `convert_arguments`
+    assert count_input_builds() == 2
+    assert build_arguments_spy.call_count == 1
+
+    # A different config gets its own converter
+    convert_argument({"value": 1}, Input, DEFAULT_SCALAR_REGISTRY, StrawberryConfig())
+
+    assert count_input_builds() == 3
+
+
+def test_convert_argument_evicts_the_least_recently_used_converters(monkeypatch):
+    from strawberry.types import arguments as arguments_module
+
+    monkeypatch.setattr(arguments_module, "CONVERTERS_CACHE_SIZE", 2)
+    monkeypatch.setattr(arguments_module, "_cached_converters", OrderedDict())
+    configs = [StrawberryConfig() for _ in range(3)]
+
+    for config in (configs[0], configs[1], configs[0], configs[2]):
+        convert_argument(1, int, DEFAULT_SCALAR_REGISTRY, config)
+
+    cached_configs = [
+        id(config) for _, _, config in arguments_module._cached_converters.values()
+    ]
+
+    # The second config was the least recently used
+    assert cached_configs == [id(configs[0]), id(configs[2])]
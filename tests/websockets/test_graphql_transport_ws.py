@@ -16,7 +16,9 @@ from pytest_mock import MockerFixture
 
 from strawberry.extensions import ParserCache
 from strawberry.extensions import parser_cache as parser_cache_module
+from strawberry.schema.config import StrawberryConfig
 from strawberry.subscriptions import GRAPHQL_TRANSPORT_WS_PROTOCOL
+from strawberry.subscriptions.multiplexer import SubscriptionMultiplexingConfig
 from strawberry.subscriptions.protocols.graphql_transport_ws import (
     handlers as transport_handlers,
 )
@@ -544,6 +546,54 @@ async def test_document_parsing_uses_schema_extensions(
     parser_cache_module._get_parse_cache.cache_clear()
 
 
+async def test_identical_subscriptions_share_one_source(
+    http_client_class: type[HttpClient],
+):
+    multiplexed_schema = Schema(
+        query=Query,
+        subscription=Subscription,
+        config=StrawberryConfig(
+            subscription_multiplexing=SubscriptionMultiplexingConfig(
+                context_key=lambda context: None,
+            )
+        ),
+    )
+    test_client = http_client_class(multiplexed_schema)
+
+    async with test_client.ws_connect(
+        "/graphql", protocols=[GRAPHQL_TRANSPORT_WS_PROTOCOL]
+    ) as ws:
+        await ws.send_message({"type": "connection_init"})
+        connection_ack_message: ConnectionAckMessage = await ws.receive_json()
+        assert connection_ack_message == {"type": "connection_ack"}
+
+        for operation_id in ("sub1", "sub2"):
+            await ws.send_message(
+                {
+                    "id": operation_id,
+                    "type": "subscribe",
+                    "payload": {"query": 'subscription { infinity(message: "Hi") }'},
+                }
+            )
+
+        # Late joiners only receive the events sent after they subscribed
+        received: set[str] = set()
+
+        while received != {"sub1", "sub2"}:
+            next_message: NextMessage = await ws.receive_json()
+            assert next_message["payload"] == {"data": {"infinity": "Hi"}}
+            received.add(next_message["id"])
+
+        assert Subscription.active_infinity_subscriptions == 1
+
+        await ws.send_message({"id": "sub1", "type": "complete"})
+        await ws.send_message({"id": "sub2", "type": "complete"})
+        await ws.close()
+
+    await asyncio.sleep(0.1)
+    assert Subscription.active_infinity_subscriptions == 0
+
+
 @pytest.mark.parametrize(
     ("extra_payload", "expected_message"),
     [
@@ -0,0 +1,283 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+import strawberry
+from strawberry.http.async_base_view import AsyncBaseHTTPView
+from strawberry.subscriptions import GRAPHQL_TRANSPORT_WS_PROTOCOL, GRAPHQL_WS_PROTOCOL
+from strawberry.subscriptions.scheduler import (
+    OperationMetrics,
+    WebSocketScheduler,
+    execution_limit,
+)
+from tests.http.clients.base import HttpClient
+
+
+class RecordingSocket:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self.can_send = asyncio.Event()
+        self.can_send.set()
+
+    async def send(self, operation_id: str) -> None:
+        await self.can_send.wait()
+        await asyncio.sleep(0)
+        self.sent.append(operation_id)
+
+
+async def _send_many(
+    scheduler: WebSocketScheduler,
+    socket: RecordingSocket,
+    operation_id: str,
+    count: int,
+) -> None:
+    for _ in range(count):
+        await scheduler.send(operation_id, socket.send, operation_id)
+
+
+async def test_operations_share_the_socket_by_weight():
+    scheduler = WebSocketScheduler()
+    socket = RecordingSocket()
+    scheduler.add_operation("heavy", weight=2)
+    scheduler.add_operation("light")
+
+    await asyncio.gather(
+        _send_many(scheduler, socket, "heavy", 40),
+        _send_many(scheduler, socket, "light", 40),
+    )
+
+    assert socket.sent[:30].count("heavy") == 20
+    assert socket.sent.count("light") == 40
+
+
+async def test_chatty_operations_do_not_delay_new_ones():
+    scheduler = WebSocketScheduler()
+    socket = RecordingSocket()
+    scheduler.add_operation("chatty")
+    scheduler.add_operation("quiet")
+
+    chatty = asyncio.ensure_future(_send_many(scheduler, socket, "chatty", 100))
+    await asyncio.sleep(0.01)
+    sent_before = len(socket.sent)
+
+    await scheduler.send("quiet", socket.send, "quiet")
+
+    assert socket.sent.index("quiet") <= sent_before + 1
+    await chatty
+
+
+async def test_metrics():
+    scheduler = WebSocketScheduler()
+    socket = RecordingSocket()
+    socket.can_send.clear()
+    metrics = scheduler.add_operation("sub1")
+
+    sends = [
+        asyncio.ensure_future(scheduler.send("sub1", socket.send, "sub1"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+
+    # One message is being written while the others wait for the socket
+    assert scheduler.queue_depth == 2
+    assert metrics.queued == 2
+
+    socket.can_send.set()
+    await asyncio.gather(*sends)
+
+    assert metrics == OperationMetrics(
+        operation_id="sub1",
+        weight=1.0,
+        queued=0,
+        max_queued=2,
+        sent=3,
+        send_latency=metrics.send_latency,
+        max_send_latency=metrics.max_send_latency,
+    )
+    assert 0 < metrics.average_send_latency <= metrics.max_send_latency
+    assert scheduler.queue_depth == 0
+
+    scheduler.remove_operation(metrics)
+    assert scheduler.metrics == {}
+
+
+async def test_cancelled_senders_pass_their_turn():
+    scheduler = WebSocketScheduler()
+    socket = RecordingSocket()
+    socket.can_send.clear()
+
+    first = asyncio.ensure_future(scheduler.send("sub1", socket.send, "sub1"))
+    cancelled = asyncio.ensure_future(scheduler.send("sub2", socket.send, "sub2"))
+    last = asyncio.ensure_future(scheduler.send("sub3", socket.send, "sub3"))
+    await asyncio.sleep(0.01)
+
+    cancelled.cancel()
+    socket.can_send.set()
+    await asyncio.gather(first, last)
+
+    assert cancelled.cancelled()
+    assert socket.sent == ["sub1", "sub3"]
+
+    await scheduler.send("sub1", socket.send, "sub1")
+    assert socket.sent == ["sub1", "sub3", "sub1"]
+
+
+def test_weights_must_be_positive():
+    with pytest.raises(ValueError, match="must be positive"):
+        WebSocketScheduler().add_operation("sub1", weight=0)
+
+
+async def test_reused_ids_keep_the_metrics_of_the_new_operation():
+    scheduler = WebSocketScheduler()
+    old = scheduler.add_operation("sub1")
+    new = scheduler.add_operation("sub1")
+
+    scheduler.remove_operation(old)
+
+    assert scheduler.metrics == {"sub1": new}
+
+
+async def test_execution_limit_caps_concurrent_executions():
+    running = 0
+    max_running = 0
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        async def slow(self) -> int:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return max_running
+
+    schema = strawberry.Schema(query=Query)
+
+    async def execute() -> None:
+        execution_limit.set(asyncio.Semaphore(2))
+
+        async def run() -> None:
+            async for result in await schema.stream("{ slow }"):
+                assert result.errors is None
+
+        await asyncio.gather(*(run() for _ in range(5)))
+
+    await asyncio.ensure_future(execute())
+
+    assert max_running == 2
+
+
+async def test_graphql_transport_ws_limits_concurrent_executions(
+    http_client_class: type[HttpClient], mocker: MockerFixture
+):
+    from tests.views.schema import schema
+
+    mocker.patch.object(
+        AsyncBaseHTTPView, "max_concurrent_executions_per_connection", 1
+    )
+    http_client = http_client_class(schema)
+
+    async with http_client.ws_connect(
+        "/graphql", protocols=[GRAPHQL_TRANSPORT_WS_PROTOCOL]
+    ) as ws:
+        await ws.send_message({"type": "connection_init"})
+        assert await ws.receive_json() == {"type": "connection_ack"}
+
+        for operation_id, delay in (("slow", 0.3), ("fast", 0)):
+            await ws.send_message(
+                {
+                    "id": operation_id,
+                    "type": "subscribe",
+                    "payload": {
+                        "query": f"query {{ asyncHello(delay: {delay}) }}",
+                    },
+                }
+            )
+
+        messages = [await ws.receive_json() for _ in range(4)]
+
+        # The fast query waits for the slow one to finish executing
+        assert [(message["id"], message["type"]) for message in messages] == [
+            ("slow", "next"),
+            ("slow", "complete"),
+            ("fast", "next"),
+            ("fast", "complete"),
+        ]
+
+
+@pytest.mark.parametrize(
+    ("protocol", "messages"),
+    [
+        (
+            GRAPHQL_TRANSPORT_WS_PROTOCOL,
+            [
+                {"type": "connection_init"},
+                {
+                    "id": "sub1",
+                    "type": "subscribe",
+                    "payload": {
+                        "query": 'subscription Echo { echo(message: "Hi") }',
+                        "operationName": "Echo",
+                    },
+                },
+            ],
+        ),
+        (
+            GRAPHQL_WS_PROTOCOL,
+            [
+                {"type": "connection_init"},
+                {
+                    "id": "sub1",
+                    "type": "start",
+                    "payload": {
+                        "query": 'subscription Echo { echo(message: "Hi") }',
+                        "operationName": "Echo",
+                    },
+                },
+            ],
+        ),
+    ],
+)
+async def test_operation_weights_and_metrics_hooks(
+    http_client_class: type[HttpClient],
+    mocker: MockerFixture,
+    protocol: str,
+    messages: list[dict[str, object]],
+):
+    from tests.views.schema import schema
+
+    get_weight = mocker.patch.object(
+        AsyncBaseHTTPView,
+        "get_ws_operation_weight",
+        AsyncMock(return_value=3.0),
+    )
+    on_complete = mocker.patch.object(
+        AsyncBaseHTTPView, "on_ws_operation_complete", AsyncMock()
+    )
+    http_client = http_client_class(schema)
+
+    async with http_client.ws_connect("/graphql", protocols=[protocol]) as ws:
+        for message in messages:
+            await ws.send_json(message)
+
+        assert (await ws.receive_json())["type"] == "connection_ack"
+        assert (await ws.receive_json())["type"] in ("next", "data")
+        assert await ws.receive_json() == {"id": "sub1", "type": "complete"}
+
+        for _ in range(100):
+            if on_complete.await_count:
+                break
+
+            await asyncio.sleep(0.01)
+
+    assert get_weight.await_args is not None
+    assert get_weight.await_args.args[1] == "Echo"
+
+    on_complete.assert_awaited_once()
+    metrics = on_complete.await_args.args[1]
+    assert metrics.operation_id == "sub1"
+    assert metrics.weight == 3.0
+    assert metrics.sent == 2
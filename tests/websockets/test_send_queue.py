@@ -0,0 +1,281 @@
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Mapping
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from strawberry.http.async_base_view import (
+    AsyncBaseHTTPView,
+    AsyncWebSocketAdapter,
+    BufferedWebSocketAdapter,
+)
+from strawberry.http.exceptions import WebSocketDisconnected
+from strawberry.http.websocket_frames import EncodedPayloadCache, encode_message_frame
+from strawberry.subscriptions import GRAPHQL_TRANSPORT_WS_PROTOCOL, GRAPHQL_WS_PROTOCOL
+from strawberry.subscriptions.protocols.graphql_transport_ws.handlers import (
+    BaseGraphQLTransportWSHandler,
+)
+from strawberry.subscriptions.protocols.graphql_ws.handlers import (
+    BaseGraphQLWSHandler,
+)
+from strawberry.types.execution import ExecutionResult
+from tests.http.clients.base import HttpClient
+
+
+class RecordingWebSocketAdapter(AsyncWebSocketAdapter):
+    def __init__(self) -> None:
+        super().__init__(Mock())
+        self.sent: list[str] = []
+        self.closed = False
+        self.can_send = asyncio.Event()
+        self.can_send.set()
+
+    def iter_json(
+        self, *, ignore_parsing_errors: bool = False
+    ) -> AsyncGenerator[object, None]:
+        raise NotImplementedError
+
+    async def send_json(self, message: Mapping[str, object]) -> None:
+        raise NotImplementedError
+
+    async def send_text(self, data: str) -> None:
+        await self.can_send.wait()
+
+        if self.closed:
+            raise WebSocketDisconnected
+
+        self.sent.append(data)
+
+    async def close(self, code: int, reason: str) -> None:
+        self.closed = True
+
+
+async def test_senders_wait_while_the_queue_is_full():
+    websocket = RecordingWebSocketAdapter()
+    websocket.can_send.clear()
+    buffered = BufferedWebSocketAdapter(websocket, max_size=2)
+
+    await buffered.send_text("1")
+    await asyncio.sleep(0)  # the writer takes "1" and waits for the client
+    await buffered.send_text("2")
+    await buffered.send_text("3")
+    send = asyncio.ensure_future(buffered.send_text("4"))
+    await asyncio.sleep(0.01)
+
+    assert not send.done()
+    assert len(buffered) == 2
+
+    websocket.can_send.set()
+    await send
+    await buffered.close(1000, "")
+
+    assert websocket.sent == ["1", "2", "3", "4"]
+    assert websocket.closed
+    await buffered.aclose()
+
+
+async def test_latest_messages_replace_queued_ones():
+    websocket = RecordingWebSocketAdapter()
+    websocket.can_send.clear()
+    buffered = BufferedWebSocketAdapter(websocket, max_size=1)
+
+    await buffered.send_text("first")
+    await asyncio.sleep(0)
+    await buffered.send_latest("sub1", "1")
+    await buffered.send_latest("sub2", "a")
+    await buffered.send_latest("sub1", "2")
+    await buffered.send_latest("sub1", "3")
+
+    websocket.can_send.set()
+    await buffered.close(1000, "")
+
+    assert websocket.sent == ["first", "3", "a"]
+    await buffered.aclose()
+
+
+async def test_coalescing_window_batches_messages():
+    websocket = RecordingWebSocketAdapter()
+    buffered = BufferedWebSocketAdapter(websocket, max_size=10, coalesce_window=0.05)
+
+    for value in range(5):
+        await buffered.send_latest("sub1", str(value))
+        await asyncio.sleep(0)
+
+    await buffered.send_text("complete")
+    await buffered.close(1000, "")
+
+    assert websocket.sent == ["4", "complete"]
+    await buffered.aclose()
+
+
+async def test_close_drops_messages_the_client_does_not_read():
+    websocket = RecordingWebSocketAdapter()
+    websocket.can_send.clear()
+    buffered = BufferedWebSocketAdapter(websocket, max_size=10, close_timeout=0.01)
+
+    await buffered.send_text("stuck")
+    await buffered.send_text("dropped")
+    await buffered.close(1000, "")
+
+    assert websocket.sent == []
+    assert websocket.closed
+    assert buffered._writer is not None
+    assert buffered._writer.done()
+
+
+async def test_send_errors_are_raised_to_the_senders():
+    websocket = RecordingWebSocketAdapter()
+    websocket.closed = True
+    buffered = BufferedWebSocketAdapter(websocket, max_size=10)
+
+    await buffered.send_text("lost")
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(WebSocketDisconnected):
+        await buffered.send_text("lost")
+
+    await buffered.aclose()
+
+
+def test_payloads_are_encoded_once_per_result():
+    encode_json = Mock(side_effect=json.dumps)
+    cache = EncodedPayloadCache(encode_json, maxsize=2)
+    first = ExecutionResult(data={"echo": "Hi"}, errors=None)
+    second = ExecutionResult(data={"echo": "Hi"}, errors=None)
+
+    assert cache.encode(first) == '{"data": {"echo": "Hi"}}'
+    assert cache.encode(first) is cache.encode(first)
+    assert encode_json.call_count == 1
+
+    cache.encode(second)
+    cache.encode(ExecutionResult(data=None, errors=None))
+
+    assert encode_json.call_count == 3
+    assert len(cache) == 2
+
+    cache.encode(first)
+    assert encode_json.call_count == 4
+
+
+def test_large_payloads_are_not_cached():
+    cache = EncodedPayloadCache(json.dumps, max_payload_size=30)
+    small = ExecutionResult(data={"echo": "Hi"}, errors=None)
+    large = ExecutionResult(data={"echo": "Hi" * 10}, errors=None)
+
+    cache.encode(small)
+    cache.encode(large)
+
+    assert len(cache) == 1
+
+
+def test_message_frames_embed_encoded_payloads():
+    frame = encode_message_frame("next", 'sub"1', '{"data": {"echo": "Hi"}}')
+
+    assert json.loads(frame) == {
+        "type": "next",
+        "id": 'sub"1',
+        "payload": {"data": {"echo": "Hi"}},
+    }
+
+
+@pytest.fixture
+def buffered_http_client(
+    http_client_class: type[HttpClient], mocker: MockerFixture
+) -> HttpClient:
+    from tests.views.schema import schema
+
+    mocker.patch.object(AsyncBaseHTTPView, "websocket_send_queue_size", 1)
+    mocker.patch.object(AsyncBaseHTTPView, "websocket_coalesce_window", 0.01)
+
+    return http_client_class(schema)
+
+
+@pytest.mark.parametrize("extensions", [{}, {"latestValue": True}])
+async def test_graphql_transport_ws_with_a_send_queue(
+    buffered_http_client: HttpClient,
+    extensions: dict[str, Any],
+    mocker: MockerFixture,
+):
+    send_frame = mocker.spy(BaseGraphQLTransportWSHandler, "send_frame")
+
+    async with buffered_http_client.ws_connect(
+        "/graphql", protocols=[GRAPHQL_TRANSPORT_WS_PROTOCOL]
+    ) as ws:
+        await ws.send_message({"type": "connection_init"})
+        assert await ws.receive_json() == {"type": "connection_ack"}
+
+        await ws.send_message(
+            {
+                "id": "sub1",
+                "type": "subscribe",
+                "payload": {
+                    "query": 'subscription { echo(message: "Hi") }',
+                    "extensions": extensions,
+                },
+            }
+        )
+
+        assert await ws.receive_json() == {
+            "id": "sub1",
+            "type": "next",
+            "payload": {"data": {"echo": "Hi"}, "extensions": {"example": "example"}},
+        }
+        assert await ws.receive_json() == {"id": "sub1", "type": "complete"}
+
+        # Results are sent through the handler's hook
+        send_frame.assert_called_once_with(
+            mocker.ANY, "sub1", mocker.ANY, bool(extensions)
+        )
+        assert json.loads(send_frame.call_args.args[2])["type"] == "next"
+
+        await ws.send_message({"id": "sub2", "type": "subscribe", "payload": {}})
+        await ws.receive(timeout=2)
+        assert ws.closed
+        assert ws.close_code == 4400
+
+
+@pytest.mark.parametrize("extensions", [{}, {"latestValue": True}])
+async def test_graphql_ws_with_a_send_queue(
+    buffered_http_client: HttpClient,
+    extensions: dict[str, Any],
+    mocker: MockerFixture,
+):
+    send_frame = mocker.spy(BaseGraphQLWSHandler, "send_frame")
+
+    async with buffered_http_client.ws_connect(
+        "/graphql", protocols=[GRAPHQL_WS_PROTOCOL]
+    ) as ws:
+        await ws.send_legacy_message({"type": "connection_init"})
+        assert await ws.receive_json() == {"type": "connection_ack"}
+
+        await ws.send_legacy_message(
+            {
+                "type": "start",
+                "id": "demo",
+                "payload": {
+                    "query": 'subscription { echo(message: "Hi") }',
+                    "extensions": extensions,
+                },
+            }
+        )
+
+        assert await ws.receive_json() == {
+            "type": "data",
+            "id": "demo",
+            "payload": {"data": {"echo": "Hi"}, "extensions": {"example": "example"}},
+        }
+        assert await ws.receive_json() == {"type": "complete", "id": "demo"}
+
+        # Results are sent through the handler's hook
+        send_frame.assert_called_once_with(
+            mocker.ANY, "demo", mocker.ANY, bool(extensions)
+        )
+        assert json.loads(send_frame.call_args.args[2])["type"] == "data"
+
+        await ws.send_legacy_message({"type": "connection_terminate"})
+        await ws.receive(timeout=2)
+        assert ws.closed
+        assert ws.close_code == 1000
@@ -1,4 +1,7 @@
+import json
+
 from strawberry.http.async_base_view import AsyncBaseHTTPView
+from strawberry.http.codecs import JSONCodec
 from strawberry.subscriptions import GRAPHQL_TRANSPORT_WS_PROTOCOL, GRAPHQL_WS_PROTOCOL
 from strawberry.subscriptions.protocols.graphql_transport_ws.types import (
     ConnectionAckMessage,
@@ -121,3 +124,25 @@ async def test_handlers_use_the_views_decode_json_method(
         assert ws.closed
 
     assert spy.call_count == 1
+
+
+async def test_handlers_send_text_frames_with_bytes_json_codecs(
+    http_client: HttpClient, mocker
+):
+    codec = mocker.Mock(spec=JSONCodec)
+    codec.decode.side_effect = json.loads
+    codec.encode.side_effect = lambda data: json.dumps(data).encode()
+    mocker.patch.object(AsyncBaseHTTPView, "json_codec", codec)
+
+    async with http_client.ws_connect(
+        "/graphql", protocols=[GRAPHQL_TRANSPORT_WS_PROTOCOL]
+    ) as ws:
+        await ws.send_message({"type": "connection_init"})
+
+        connection_ack_message: ConnectionAckMessage = await ws.receive_json()
+        assert connection_ack_message == {"type": "connection_ack"}
+
+        await ws.close()
+        assert ws.closed
+
+    assert codec.encode.call_count == 1